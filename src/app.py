@@ -19,9 +19,13 @@ from flask_migrate import Migrate
 from flask_sqlalchemy import SQLAlchemy
 from werkzeug.exceptions import HTTPException
 
+from src.commands.index import create_commands
 from src.models.index import create_models
 from src.routes.index import create_blueprints
 from src.schemas.index import create_schemas
+from src.services.utils.helpers.version_counter.version_counter import (
+    track_content_versions,
+)
 
 
 def create_app():
@@ -70,6 +74,7 @@ def create_app():
     # Database Model Instantiation
     models = create_models(db)
     # HACK This way of creating models is not correct. Change to migrations approach.
+    track_content_versions(db)
 
     # API Schema Instantiation
     schemas = create_schemas(ma=ma, models=models)
@@ -82,6 +87,9 @@ def create_app():
     # API Routes Instantiation
     create_blueprints(db, models, schemas, app, firebase_app)
 
+    # CLI Commands Instantiation
+    create_commands(db, models, app)
+
     # Route Configuration
     @app.route("/")
     def check_health():
@@ -0,0 +1,111 @@
+# -*- coding: utf-8 -*-
+"""Module containing the CLI Commands to generate local keys and mint local tokens.
+
+The local tokens are verified by the Local Verifier (AUTH_VERIFIER=local), so that
+benchmark harnesses can authenticate without Firebase.
+
+Typical usage example:
+
+    $ flask generate-local-keys local_private_key.pem local_public_keys.json
+    $ flask mint-local-tokens local_private_key.pem --role student --count 1000
+
+Returns:
+    function: CLI Commands to generate local keys and mint local tokens.
+"""
+import json
+import uuid
+from typing import Dict
+
+import click
+from flask.cli import with_appcontext
+from flask_sqlalchemy import SQLAlchemy
+from flask_sqlalchemy.model import Model
+from src.services.utils.helpers.token_verifier.token_verifier import (
+    LOCAL_KEY_ID,
+    generate_local_keys,
+    load_local_signer,
+    mint_local_token,
+)
+
+
+def create_generate_local_keys_command():
+    """Creates the CLI Command to generate a key pair for the local tokens.
+
+    Returns:
+        function: CLI Command to generate the local keys.
+    """
+
+    @click.command("generate-local-keys")
+    @click.argument("private_key_file", type=click.Path(dir_okay=False))
+    @click.argument("public_keys_file", type=click.Path(dir_okay=False))
+    @click.option("--key-id", default=LOCAL_KEY_ID, show_default=True)
+    def generate_keys(private_key_file: str, public_keys_file: str, key_id: str):
+        """Generate the private key that signs the local tokens and the public keys that verify them."""
+        private_key, public_key = generate_local_keys()
+        with open(private_key_file, "w", encoding="utf-8") as key_file:
+            key_file.write(private_key)
+        with open(public_keys_file, "w", encoding="utf-8") as keys_file:
+            json.dump({key_id: public_key}, keys_file, indent=2)
+        click.echo(f"Set LOCAL_JWT_PUBLIC_KEYS_FILE={public_keys_file} to verify them.")
+
+    return generate_keys
+
+
+def create_mint_local_tokens_command(db: SQLAlchemy, models: Dict[str, Model]):
+    """Creates the CLI Command to create Users and mint a local token for each of them.
+
+    Args:
+        db (SQLAlchemy): Database Object containing the Models.
+        models (Dict[str,Model]): Dictionary containing all models defined in the Database.
+
+    Returns:
+        function: CLI Command to mint the local tokens.
+    """
+
+    @click.command("mint-local-tokens")
+    @click.argument("private_key_file", type=click.Path(exists=True, dir_okay=False))
+    @click.option(
+        "--role", type=click.Choice(["student", "teacher"]), default="student"
+    )
+    @click.option("--count", type=click.IntRange(min=1), default=1, show_default=True)
+    @click.option("--expires-in", type=int, default=3600, show_default=True)
+    @click.option("--key-id", default=LOCAL_KEY_ID, show_default=True)
+    @click.option("--output", type=click.File("w"), default="-")
+    @with_appcontext
+    def mint_tokens(
+        private_key_file: str,
+        role: str,
+        count: int,
+        expires_in: int,
+        key_id: str,
+        output,
+    ):
+        """Create Users with the given Role and write a local token for each of them, as JSON Lines."""
+        signer = load_local_signer(private_key_file, key_id)
+        users = []
+        for _ in range(count):
+            user = models["User"](
+                email=f"load-test-{uuid.uuid4()}@example.com",
+                first_name="Load Test",
+                last_name=role.capitalize(),
+                vark_completed=True,
+            )
+            user.role.append(models["Role"](role_name=role, is_enabled=True))
+            user.learning_style = models["LearningStyle"]()
+            users.append(user)
+        db.session.add_all(users)
+        db.session.commit()
+
+        for user in users:
+            output.write(
+                json.dumps(
+                    {
+                        "user_id": str(user.id),
+                        "role": role,
+                        "token": mint_local_token(signer, user.id, expires_in),
+                    }
+                )
+                + "\n"
+            )
+
+    return mint_tokens
@@ -0,0 +1,35 @@
+# -*- coding: utf-8 -*-
+"""Module Containing the CLI Commands Index
+
+This module registers all of the CLI Commands of the Backend in the Flask Application.
+
+Typical usage example:
+
+    $ flask rebuild-knowledge-snapshots
+    $ flask rebuild-learning-style-affinities
+    $ flask generate-local-keys local_private_key.pem local_public_keys.json
+    $ flask mint-local-tokens local_private_key.pem --role student --count 1000
+"""
+from typing import Dict
+
+from flask import Flask
+from flask_sqlalchemy import SQLAlchemy
+from flask_sqlalchemy.model import Model
+from src.commands.auth.mint_local_tokens import (
+    create_generate_local_keys_command,
+    create_mint_local_tokens_command,
+)
+from src.commands.knowledge_snapshot.rebuild_knowledge_snapshots import (
+    create_rebuild_knowledge_snapshots_command,
+)
+from src.commands.learning_style.rebuild_learning_style_affinities import (
+    create_rebuild_learning_style_affinities_command,
+)
+
+
+def create_commands(db: SQLAlchemy, models: Dict[str, Model], app: Flask):
+    """Function to register all of the CLI Commands in the Application"""
+    app.cli.add_command(create_rebuild_knowledge_snapshots_command(db, models))
+    app.cli.add_command(create_rebuild_learning_style_affinities_command(db, models))
+    app.cli.add_command(create_generate_local_keys_command())
+    app.cli.add_command(create_mint_local_tokens_command(db, models))
@@ -0,0 +1,48 @@
+# -*- coding: utf-8 -*-
+"""Module containing the CLI Command to rebuild the User Knowledge Snapshots in bulk.
+
+Typical usage example:
+
+    $ flask rebuild-knowledge-snapshots --batch-size 500
+
+Returns:
+    function: CLI Command to rebuild the User Knowledge Snapshots.
+"""
+from typing import Dict
+
+import click
+from flask.cli import with_appcontext
+from flask_sqlalchemy import SQLAlchemy
+from flask_sqlalchemy.model import Model
+from src.services.utils.helpers.user_knowledge_snapshot.user_knowledge_snapshot import (
+    rebuild_user_knowledge_snapshots,
+)
+
+
+def create_rebuild_knowledge_snapshots_command(
+    db: SQLAlchemy, models: Dict[str, Model]
+):
+    """Creates the CLI Command to rebuild the Knowledge Snapshots of every User.
+
+    Args:
+        db (SQLAlchemy): Database Object containing the Models.
+        models (Dict[str,Model]): Dictionary containing all models defined in the Database.
+
+    Returns:
+        function: CLI Command to rebuild the User Knowledge Snapshots.
+    """
+
+    @click.command("rebuild-knowledge-snapshots")
+    @click.option(
+        "--batch-size",
+        default=500,
+        show_default=True,
+        help="Number of Users whose Evidence is loaded at once.",
+    )
+    @with_appcontext
+    def rebuild_knowledge_snapshots(batch_size: int):
+        """Rebuild the Knowledge Snapshots of every User (e.g. after a content migration)."""
+        rebuilt_users = rebuild_user_knowledge_snapshots(db, models, batch_size)
+        click.echo(f"Rebuilt Knowledge Snapshots for {rebuilt_users} Users.")
+
+    return rebuild_knowledge_snapshots
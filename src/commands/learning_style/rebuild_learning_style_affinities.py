@@ -0,0 +1,44 @@
+# -*- coding: utf-8 -*-
+"""Module containing the CLI Command to rebuild the stored Learning Style Affinities.
+
+Typical usage example:
+
+    $ flask rebuild-learning-style-affinities
+
+Returns:
+    function: CLI Command to rebuild the Learning Style Affinities.
+"""
+from typing import Dict
+
+import click
+from flask.cli import with_appcontext
+from flask_sqlalchemy import SQLAlchemy
+from flask_sqlalchemy.model import Model
+from src.services.utils.helpers.learning_style_affinity.learning_style_affinity import (
+    rebuild_learning_style_affinities,
+)
+
+
+def create_rebuild_learning_style_affinities_command(
+    db: SQLAlchemy, models: Dict[str, Model]
+):
+    """Creates the CLI Command to rebuild the Learning Style Affinities of every User.
+
+    Args:
+        db (SQLAlchemy): Database Object containing the Models.
+        models (Dict[str,Model]): Dictionary containing all models defined in the Database.
+
+    Returns:
+        function: CLI Command to rebuild the Learning Style Affinities.
+    """
+
+    @click.command("rebuild-learning-style-affinities")
+    @with_appcontext
+    def rebuild_affinities():
+        """Rebuild the Learning Style Affinities of every User (e.g. after adding the columns)."""
+        rebuilt_learning_styles = rebuild_learning_style_affinities(db, models)
+        click.echo(
+            f"Rebuilt Learning Style Affinities for {rebuilt_learning_styles} Users."
+        )
+
+    return rebuild_affinities
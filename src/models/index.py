@@ -38,6 +38,8 @@ from src.models.test_question import test_question
 from src.models.topic import topic
 from src.models.topic_predence import topic_precedence
 from src.models.user import user
+from src.models.user_knowledge_snapshot import user_knowledge_snapshot
+from src.models.version_counter import version_counter
 
 
 def create_models(db: SQLAlchemy) -> Dict[str, Model]:
@@ -62,5 +64,7 @@ def create_models(db: SQLAlchemy) -> Dict[str, Model]:
         "Topic": topic.create_model(db),
         "TopicPrecedence": topic_precedence.create_model(db),
         "User": user.create_model(db),
+        "UserKnowledgeSnapshot": user_knowledge_snapshot.create_model(db),
+        "VersionCounter": version_counter.create_model(db),
     }
     return model_dict
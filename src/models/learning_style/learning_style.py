@@ -32,6 +32,13 @@ def create_model(db: SQLAlchemy):
         kinesthetic = db.Column(db.Integer, default=1, nullable=False)
         textual = db.Column(db.Integer, default=1, nullable=False)
 
+        # Noisy-OR affinity of every Learning Style, from the Interactions the user fired.
+        # NOTE: Kept up to date on every fired Interaction. Null if none was fired yet.
+        visual_affinity = db.Column(db.Float, nullable=True)
+        aural_affinity = db.Column(db.Float, nullable=True)
+        kinesthetic_affinity = db.Column(db.Float, nullable=True)
+        textual_affinity = db.Column(db.Float, nullable=True)
+
         user_id = db.Column(
             UUID(as_uuid=True), db.ForeignKey("user.id"), nullable=False
         )
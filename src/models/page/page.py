@@ -60,4 +60,7 @@ def create_model(db: SQLAlchemy):
             initially="DEFERRED",
         )
 
+        # NOTE: Index for the Keyset Pagination of the Pages of a Template.
+        db.Index("ix_page_template_position", template_id, relative_position, id)
+
     return Page
@@ -63,4 +63,7 @@ def create_model(db: SQLAlchemy):
             initially="DEFERRED",
         )
 
+        # NOTE: Index for the Keyset Pagination of the Templates of a Topic.
+        db.Index("ix_template_topic_position", topic_id, relative_position, id)
+
     return Template
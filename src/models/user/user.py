@@ -61,4 +61,7 @@ def create_model(db: SQLAlchemy):
             cascade="all, delete-orphan",
         )
 
+        # NOTE: Index for the Keyset Pagination of the Users by creation date.
+        db.Index("ix_user_created_at", created_at, id)
+
     return User
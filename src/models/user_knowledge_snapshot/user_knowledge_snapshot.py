@@ -0,0 +1,50 @@
+# -*- coding: utf-8 -*-
+"""Module Containing the User Knowledge Snapshot Entity Model
+
+This module contains the Model Definition for the Entity Representing the materialized
+Knowledge of a User for a Topic or Template in the Database. Every row is stamped with
+the Domain and Evidence Versions it was computed for.
+
+Typical usage example:
+
+    ...
+    import src.models.user_knowledge_snapshot import user_knowledge_snapshot
+
+    {
+        ### Other Model Definitions
+        'UserKnowledgeSnapshot' : user_knowledge_snapshot.create_model(db)
+    }
+"""
+
+import uuid
+from datetime import datetime
+
+from flask_sqlalchemy import SQLAlchemy
+from sqlalchemy.dialects.postgresql import UUID
+
+
+def create_model(db: SQLAlchemy):
+    class UserKnowledgeSnapshot(db.Model):
+        id = db.Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+        created_at = db.Column(db.DateTime, nullable=False, default=datetime.utcnow)
+
+        user_id = db.Column(
+            UUID(as_uuid=True), db.ForeignKey("user.id"), nullable=False
+        )
+        # NOTE: The node is either a Topic or a Template, so it has no Foreign Key.
+        node_id = db.Column(UUID(as_uuid=True), nullable=False)
+        entity_type = db.Column(db.String(255), nullable=False)
+
+        expected_knowledge = db.Column(db.Float(), nullable=False)
+        evidence_observed = db.Column(db.Boolean(), nullable=False)
+
+        domain_version = db.Column(db.Integer(), nullable=False)
+        evidence_version = db.Column(db.Integer(), nullable=False)
+
+        __table_args__ = (
+            db.UniqueConstraint(
+                user_id, node_id, name="unique_user_knowledge_snapshot"
+            ),
+        )
+
+    return UserKnowledgeSnapshot
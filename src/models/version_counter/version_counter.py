@@ -0,0 +1,34 @@
+# -*- coding: utf-8 -*-
+"""Module Containing the Version Counter Entity Model
+
+This module contains the Model Definition for the Entity Representing a Version Counter
+in the Database. Version Counters are bumped by the write paths so that every worker
+can tell when its cached data became stale.
+
+Typical usage example:
+
+    ...
+    import src.models.version_counter import version_counter
+
+    {
+        ### Other Model Definitions
+        'VersionCounter' : version_counter.create_model(db)
+    }
+"""
+
+import uuid
+from datetime import datetime
+
+from flask_sqlalchemy import SQLAlchemy
+from sqlalchemy.dialects.postgresql import UUID
+
+
+def create_model(db: SQLAlchemy):
+    class VersionCounter(db.Model):
+        id = db.Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+        created_at = db.Column(db.DateTime, nullable=False, default=datetime.utcnow)
+
+        counter_name = db.Column(db.String(255), unique=True, nullable=False)
+        counter_value = db.Column(db.Integer(), nullable=False, default=0)
+
+    return VersionCounter
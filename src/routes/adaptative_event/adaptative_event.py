@@ -20,6 +20,12 @@ from src.services.utils.controllers.adaptative_event.get_all_adaptative_events_b
 from src.services.utils.controllers.adaptative_event.switch_adaptative_events import (
     switch_adaptative_event_controller_factory,
 )
+from src.services.utils.controllers.adaptative_event.get_triggered_adaptative_events_batch import (
+    get_triggered_adaptative_events_batch_controller_factory,
+)
+from src.services.utils.controllers.adaptative_event.stream_triggered_adaptative_events import (
+    stream_triggered_adaptative_events_controller_factory,
+)
 
 
 def create_adaptative_event_blueprint(
@@ -74,4 +80,21 @@ def create_adaptative_event_blueprint(
         firebase_app=firebase_app,
         user_model=models["User"],
     )
+    get_triggered_adaptative_events_batch_controller_factory(
+        models,
+        schemas,
+        blueprint,
+        expected_role="student",
+        firebase_app=firebase_app,
+        user_model=models["User"],
+    )
+    stream_triggered_adaptative_events_controller_factory(
+        db,
+        models,
+        schemas,
+        blueprint,
+        expected_role="student",
+        firebase_app=firebase_app,
+        user_model=models["User"],
+    )
     return blueprint
@@ -5,16 +5,19 @@
 Returns:
     function: Function for instantiating the User Auth Blueprint.
 """
-from os import environ
-
-import requests
 from firebase_admin import App
 from firebase_admin._auth_utils import EmailAlreadyExistsError
 from firebase_admin.auth import create_user
 from flask import Blueprint, request
 from flask_sqlalchemy import SQLAlchemy
 from marshmallow import EXCLUDE
+from requests import RequestException
 from sqlalchemy.exc import IntegrityError
+from src.services.utils.helpers.identity_http_session.identity_http_session import (
+    identity_post,
+    identity_toolkit_url,
+    secure_token_url,
+)
 from src.services.utils.middleware.auth_middleware import auth_middleware
 from src.services.utils.controllers.auth.update_current_user import (
     update_current_user_controller_factory,
@@ -36,6 +39,18 @@ def create_auth_blueprint(
     """
     blueprint = Blueprint(name="/auth", import_name=__name__, url_prefix="/auth")
 
+    @blueprint.errorhandler(RequestException)
+    def handle_identity_request_exception(_ex):
+        """Return an error response when the Google Identity APIs cannot be reached after the retries."""
+        return {
+            "success": False,
+            "data": {
+                "error": "IDENTITY_SERVICE_UNAVAILABLE",
+                "message": "Authentication Service Unavailable",
+            },
+            "message": "Authentication Service Unavailable",
+        }, 503
+
     @blueprint.route("/signup", methods=["POST"])
     def create_user_account():
         try:
@@ -70,8 +85,8 @@ def create_auth_blueprint(
                 password=req_data["password"],
                 app=firebase_app,
             )
-            token = requests.post(
-                f"https://identitytoolkit.googleapis.com/v1/accounts:signInWithPassword?key={environ.get('GOOGLE_API_KEY')}",
+            token = identity_post(
+                identity_toolkit_url("accounts:signInWithPassword"),
                 data={
                     "email": req_data["email"],
                     "password": req_data["password"],
@@ -96,8 +111,8 @@ def create_auth_blueprint(
     @blueprint.route("/login", methods=["POST"])
     def login_with_email_password():
         req_data = request.get_json()
-        token = requests.post(
-            f"https://identitytoolkit.googleapis.com/v1/accounts:signInWithPassword?key={environ.get('GOOGLE_API_KEY')}",
+        token = identity_post(
+            identity_toolkit_url("accounts:signInWithPassword"),
             data={
                 "email": req_data.get("email"),
                 "password": req_data.get("password"),
@@ -129,8 +144,8 @@ def create_auth_blueprint(
     )
     def change_password(current_user=None):
         req_data = request.get_json()
-        token = requests.post(
-            f"https://identitytoolkit.googleapis.com/v1/accounts:signInWithPassword?key={environ.get('GOOGLE_API_KEY')}",
+        token = identity_post(
+            identity_toolkit_url("accounts:signInWithPassword"),
             data={
                 "email": current_user.email,
                 "password": req_data.get("old_password"),
@@ -146,8 +161,8 @@ def create_auth_blueprint(
                 },
                 "message": "Wrong Password",
             }, 400
-        token = requests.post(
-            f"https://identitytoolkit.googleapis.com/v1/accounts:update?key={environ.get('GOOGLE_API_KEY')}",
+        token = identity_post(
+            identity_toolkit_url("accounts:update"),
             data={
                 "idToken": token.json().get("idToken"),
                 "password": req_data.get("new_password"),
@@ -172,9 +187,8 @@ def create_auth_blueprint(
                 },
                 "message": "Missing Refresh Token",
             }, 400
-        token = requests.post(
-            "https://securetoken.googleapis.com/v1/token",
-            params={"key": environ.get("GOOGLE_API_KEY")},
+        token = identity_post(
+            secure_token_url("token"),
             data={
                 "grant_type": "refresh_token",
                 "refresh_token": req_data.get("refreshToken"),
@@ -23,6 +23,12 @@ from src.services.utils.controllers.user.enable_role import (
 from src.services.utils.controllers.user.get_all_users_with_pagination_controller import (
     get_all_users_with_pagination_controller_factory,
 )
+from src.services.utils.controllers.user.get_cohort_knowledge_controller import (
+    get_cohort_knowledge_controller_factory,
+)
+from src.services.utils.controllers.user.simulate_user_knowledge_controller import (
+    simulate_user_knowledge_controller_factory,
+)
 
 
 def create_user_blueprint(
@@ -74,6 +80,14 @@ def create_user_blueprint(
         firebase_app=firebase_app,
         user_model=models["User"],
     )
+    get_cohort_knowledge_controller_factory(
+        models,
+        schemas["User_DefaultSchema"],
+        blueprint,
+        expected_role="teacher",
+        firebase_app=firebase_app,
+        user_model=models["User"],
+    )
     enable_role_controller_factory(
         db,
         models,
@@ -83,4 +97,12 @@ def create_user_blueprint(
         firebase_app=firebase_app,
         user_model=models["User"],
     )
+    simulate_user_knowledge_controller_factory(
+        models,
+        schemas,
+        blueprint,
+        expected_role="teacher",
+        firebase_app=firebase_app,
+        user_model=models["User"],
+    )
     return blueprint
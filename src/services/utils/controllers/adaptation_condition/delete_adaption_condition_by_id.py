@@ -11,6 +11,9 @@ from flask_marshmallow.schema import Schema
 from flask_sqlalchemy import SQLAlchemy
 from flask_sqlalchemy.model import Model
 from src.services.utils.middleware.auth_middleware import auth_middleware
+from src.services.utils.helpers.version_counter.version_counter import (
+    bump_rules_version,
+)
 
 
 def delete_adaptation_condition_by_id_controller_factory(
@@ -69,6 +72,7 @@ def delete_adaptation_condition_by_id_controller_factory(
                 },
             }, 400
         db.session.delete(data)
+        bump_rules_version(db)
         db.session.commit()
         return {
             "success": True,
@@ -13,6 +13,9 @@ from flask_sqlalchemy.model import Model
 from sqlalchemy import func
 from sqlalchemy.exc import IntegrityError
 from src.services.utils.middleware.auth_middleware import auth_middleware
+from src.services.utils.helpers.version_counter.version_counter import (
+    bump_rules_version,
+)
 
 
 def create_one_adaptative_event_factory(
@@ -75,6 +78,7 @@ def create_one_adaptative_event_factory(
             )
         try:
             db.session.add(new_instance)
+            bump_rules_version(db)
             db.session.commit()
         except IntegrityError:
             return {
@@ -0,0 +1,98 @@
+# -*- coding: utf-8 -*-
+"""Module containing the Controller for Reading the Triggered Adaptative Events of many Adaptative Objects at once.
+
+Returns:
+    function: Read Function for the Triggered Adaptative Events & Schema
+"""
+from typing import Dict
+from firebase_admin import App
+from flask import Blueprint, request
+from flask_marshmallow.schema import Schema
+from flask_sqlalchemy.model import Model
+from src.services.utils.helpers.adaptation_rule_engine.adaptation_rule_engine import (
+    find_objects_triggered_adaptative_events,
+)
+from src.services.utils.helpers.adaptative_object_ancestry.adaptative_object_ancestry import (
+    AdaptativeObjectScopeError,
+    scope_ancestry,
+)
+from src.services.utils.helpers.principal_cache.principal_cache import (
+    refresh_learning_style,
+)
+from src.services.utils.helpers.triggered_events_cache.triggered_events_cache import (
+    triggered_events_versions,
+)
+from src.services.utils.middleware.auth_middleware import auth_middleware
+
+
+def get_triggered_adaptative_events_batch_controller_factory(
+    models: Dict[str, Model],
+    schemas: Dict[str, Schema],
+    blueprint: Blueprint,
+    expected_role: str = None,
+    firebase_app: App = None,
+    user_model: Model = None,
+):
+    """Creates a Function that Finds the adaptative events triggered by the current user for many adaptative objects.
+
+    Args:
+        models (Dict[str,Model]): Dictionary containing all models defined in the Database.
+        schema (Dict[str,Schema]): Dictionary containing all schemas defined in the API.
+        blueprint (Blueprint): Blueprint to contain the new route.
+        expected_role (str): Expected Role String. Either teacher or student.
+        firebase_app (App): Firebase App Instance.
+        user_model (Model): User Model Instance.
+
+    Returns:
+        function: Read Function for the Triggered Adaptative Events & Schema.
+    """
+
+    @blueprint.route("/triggered_events", methods=["POST"])
+    @auth_middleware(
+        expected_role=expected_role, firebase_app=firebase_app, user_model=user_model
+    )
+    def get_triggered_adaptative_events_batch_controller(current_user=None):
+        """Function to get the triggered adaptative events by the current user for many adaptative objects.
+
+        The request body contains exactly one of:
+            template_id (str): Every Topic, Template, Page & Test Question of the Template.
+            practice_test_id (str): The Topic, Template & Page of the Practice Test and its Test Questions.
+            adaptative_object_ids (List[str]): The listed Adaptative Objects.
+
+        Returns:
+            dict: Response dictionary containing the Triggered Adaptative Events of every Adaptative Object.
+        """
+        # Find the Topic and Template of every Adaptative Object in the requested scope.
+        # NOTE: They are resolved from the ancestry index, which is only rebuilt when the
+        # Domain Version read here changes.
+        _, learning_style_version, domain_version, _ = triggered_events_versions(
+            models, current_user.id
+        )
+        try:
+            ancestry = scope_ancestry(models, request.get_json() or {}, domain_version)
+        except AdaptativeObjectScopeError as error:
+            return {
+                "message": error.message,
+                "data": {"error": error.error, "message": error.message},
+                "success": False,
+            }, 400
+
+        # NOTE: The cached Learning Style is only read again if its Version changed.
+        refresh_learning_style(current_user, learning_style_version)
+        # NOTE: The User Model is estimated at most once for all of the Adaptative Objects.
+        triggered_adaptative_events = find_objects_triggered_adaptative_events(
+            models, current_user, ancestry
+        )
+        adaptative_event_schema = schemas["AdaptativeEvent_CompleteSchema"]()
+        return {
+            "success": True,
+            "data": {
+                str(adaptative_object_id): adaptative_event_schema.dump(
+                    obj=adaptative_events, many=True
+                )
+                for adaptative_object_id, adaptative_events in triggered_adaptative_events.items()
+            },
+            "message": "Triggered Adaptative Events Retrieved Successfully",
+        }, 200
+
+    return get_triggered_adaptative_events_batch_controller
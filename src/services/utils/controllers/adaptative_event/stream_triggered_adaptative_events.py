@@ -0,0 +1,132 @@
+# -*- coding: utf-8 -*-
+"""Module containing the Controller for Streaming the changes of the Triggered Adaptative Events of many Adaptative Objects.
+
+Returns:
+    function: Stream Function for the Triggered Adaptative Events & Schema
+"""
+from typing import Dict
+from firebase_admin import App
+from flask import Blueprint, Response, request, stream_with_context
+from flask_marshmallow.schema import Schema
+from flask_sqlalchemy import SQLAlchemy
+from flask_sqlalchemy.model import Model
+from src.services.utils.helpers.adaptation_rule_engine.adaptation_rule_engine import (
+    find_objects_triggered_adaptative_events,
+)
+from src.services.utils.helpers.adaptative_object_ancestry.adaptative_object_ancestry import (
+    AdaptativeObjectScopeError,
+    scope_ancestry,
+)
+from src.services.utils.helpers.principal_cache.principal_cache import (
+    refresh_learning_style,
+)
+from src.services.utils.helpers.triggered_events_cache.triggered_events_cache import (
+    triggered_events_versions,
+)
+from src.services.utils.helpers.triggered_events_stream.triggered_events_stream import (
+    STREAM_MAX_WAIT_SECONDS,
+    cooperative_workers,
+    stream_triggered_events_changes,
+)
+from src.services.utils.middleware.auth_middleware import auth_middleware
+
+
+def stream_triggered_adaptative_events_controller_factory(
+    db: SQLAlchemy,
+    models: Dict[str, Model],
+    schemas: Dict[str, Schema],
+    blueprint: Blueprint,
+    expected_role: str = None,
+    firebase_app: App = None,
+    user_model: Model = None,
+):
+    """Creates a Function that Streams the changes of the adaptative events triggered by the current user for many adaptative objects.
+
+    Args:
+        db (SQLAlchemy): SQLAlchemy Database Instance.
+        models (Dict[str,Model]): Dictionary containing all models defined in the Database.
+        schema (Dict[str,Schema]): Dictionary containing all schemas defined in the API.
+        blueprint (Blueprint): Blueprint to contain the new route.
+        expected_role (str): Expected Role String. Either teacher or student.
+        firebase_app (App): Firebase App Instance.
+        user_model (Model): User Model Instance.
+
+    Returns:
+        function: Stream Function for the Triggered Adaptative Events & Schema.
+    """
+
+    @blueprint.route("/triggered_events/stream", methods=["GET"])
+    @auth_middleware(
+        expected_role=expected_role, firebase_app=firebase_app, user_model=user_model
+    )
+    def stream_triggered_adaptative_events_controller(current_user=None):
+        """Function to stream the changes of the adaptative events triggered by the current user as Server-Sent Events.
+
+        The query string contains exactly one of:
+            template_id (str): Every Topic, Template, Page & Test Question of the Template.
+            practice_test_id (str): The Topic, Template & Page of the Practice Test and its Test Questions.
+            adaptative_object_ids (str): Comma separated IDs of the Adaptative Objects.
+
+        Clients reconnect with the Last-Event-ID header, and only get a message once the
+        Evidence, Learning Style, Domain or Rules Versions change.
+
+        Returns:
+            Response: Stream of a "snapshot" event with the Triggered Adaptative Events of every
+            Adaptative Object, or a "diff" event with the Events added and removed since the Last-Event-ID.
+        """
+        scope = request.args.to_dict()
+        if scope.get("adaptative_object_ids") is not None:
+            scope["adaptative_object_ids"] = scope["adaptative_object_ids"].split(",")
+
+        # NOTE: The scope is validated against the current Domain Version, before the stream starts.
+        versions = triggered_events_versions(models, current_user.id)
+        try:
+            scope_ancestry(models, scope, versions[2])
+        except AdaptativeObjectScopeError as error:
+            return {
+                "message": error.message,
+                "data": {"error": error.error, "message": error.message},
+                "success": False,
+            }, 400
+
+        adaptative_event_schema = schemas["AdaptativeEvent_CompleteSchema"]()
+        user_id = current_user.id
+
+        def compute_triggered_adaptative_events(current_versions: tuple) -> dict:
+            """Function to evaluate and serialize the Events of every Adaptative Object in the scope."""
+            _, learning_style_version, domain_version, _ = current_versions
+            # NOTE: The scope is resolved again, because the Domain Model may have changed.
+            try:
+                ancestry = scope_ancestry(models, scope, domain_version)
+            except AdaptativeObjectScopeError:
+                ancestry = {}
+            # NOTE: The cached Learning Style is only read again if its Version changed.
+            refresh_learning_style(current_user, learning_style_version)
+            return {
+                str(adaptative_object_id): adaptative_event_schema.dump(
+                    obj=adaptative_events, many=True
+                )
+                for adaptative_object_id, adaptative_events in find_objects_triggered_adaptative_events(
+                    models, current_user, ancestry
+                ).items()
+            }
+
+        return Response(
+            stream_with_context(
+                stream_triggered_events_changes(
+                    versions,
+                    lambda: triggered_events_versions(models, user_id),
+                    compute_triggered_adaptative_events,
+                    last_event_id=request.headers.get("Last-Event-ID"),
+                    # NOTE: The read transaction is ended while waiting, so the stream does
+                    # not hold a connection of the pool.
+                    end_transaction=db.session.rollback,
+                    # NOTE: Sync workers are never held waiting for a change.
+                    max_wait=STREAM_MAX_WAIT_SECONDS if cooperative_workers() else 0,
+                )
+            ),
+            mimetype="text/event-stream",
+            headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+        )
+
+    return stream_triggered_adaptative_events_controller
@@ -6,6 +6,9 @@ from flask_sqlalchemy import SQLAlchemy
 from flask_sqlalchemy.model import Model
 from sqlalchemy.exc import IntegrityError
 from src.services.utils.middleware.auth_middleware import auth_middleware
+from src.services.utils.helpers.version_counter.version_counter import (
+    bump_rules_version,
+)
 
 
 def switch_adaptative_event_controller_factory(
@@ -87,6 +90,7 @@ def switch_adaptative_event_controller_factory(
                 adaptative_event_exchange.relative_position - 1
             )
         try:
+            bump_rules_version(db)
             db.session.commit()
         except IntegrityError:
             return {
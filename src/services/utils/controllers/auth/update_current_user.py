@@ -10,6 +10,9 @@ from flask_marshmallow.schema import Schema
 from flask_sqlalchemy import SQLAlchemy
 from flask_sqlalchemy.model import Model
 from sqlalchemy.exc import IntegrityError
+from src.services.utils.helpers.principal_cache.principal_cache import (
+    invalidate_principal,
+)
 from src.services.utils.middleware.auth_middleware import auth_middleware
 
 
@@ -68,6 +71,7 @@ def update_current_user_controller_factory(
                 },
                 "message": "Database Integrity Error",
             }, 400
+        invalidate_principal(current_user.id)
 
         return {
             "success": True,
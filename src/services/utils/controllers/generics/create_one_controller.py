@@ -11,6 +11,10 @@ from flask_sqlalchemy import SQLAlchemy
 from flask_sqlalchemy.model import Model
 from sqlalchemy.exc import IntegrityError
 from src.services.utils.middleware.auth_middleware import auth_middleware
+from src.services.utils.helpers.version_counter.version_counter import (
+    bump_domain_version,
+    bump_rules_version,
+)
 
 
 def create_one_controller_factory(
@@ -51,6 +55,8 @@ def create_one_controller_factory(
         new_instance = model(**req_data)
         try:
             db.session.add(new_instance)
+            bump_domain_version(db, model)
+            bump_rules_version(db, model)
             db.session.commit()
         except IntegrityError:
             return {
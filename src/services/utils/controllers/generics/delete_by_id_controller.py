@@ -10,6 +10,10 @@ from flask_marshmallow.schema import Schema
 from flask_sqlalchemy import SQLAlchemy
 from flask_sqlalchemy.model import Model
 from src.services.utils.middleware.auth_middleware import auth_middleware
+from src.services.utils.helpers.version_counter.version_counter import (
+    bump_domain_version,
+    bump_rules_version,
+)
 
 
 def delete_by_id_controller_factory(
@@ -57,6 +61,8 @@ def delete_by_id_controller_factory(
                 "data": schema().dump(obj=data, many=False),
             }, 200
         db.session.delete(data)
+        bump_domain_version(db, model)
+        bump_rules_version(db, model)
         db.session.commit()
         return {
             "success": True,
@@ -8,6 +8,13 @@ from firebase_admin import App
 from flask import Blueprint, request
 from flask_marshmallow.schema import Schema
 from flask_sqlalchemy.model import Model
+from src.services.utils.helpers.conditional_request.conditional_request import (
+    content_etag,
+    etag_headers,
+    is_not_modified,
+    not_modified_response,
+    serialized_etag,
+)
 from src.services.utils.middleware.auth_middleware import auth_middleware
 
 
@@ -40,14 +47,28 @@ def get_all_controller_factory(
     )
     def get_all_controller(current_user=None):
         args = request.args
+        # NOTE: Clients that already have the current instances get a 304 before they are read.
+        etag = content_etag(model, schema, args.get("sort_key"))
+        if etag is not None and is_not_modified(etag):
+            return not_modified_response(etag)
         if args.get("sort_key"):
             data = model().query.order_by(args.get("sort_key")).all()
         else:
             data = model().query.all()
-        return {
-            "message": "Model Bulk Data Found Successfully",
-            "data": schema().dump(obj=data, many=True),
-            "success": True,
-        }, 200
+        serialized_data = schema().dump(obj=data, many=True)
+        # NOTE: Instances whose Content Version is not tracked get the ETag of their rows.
+        if etag is None:
+            etag = serialized_etag(model, schema, serialized_data, args.get("sort_key"))
+            if is_not_modified(etag):
+                return not_modified_response(etag)
+        return (
+            {
+                "message": "Model Bulk Data Found Successfully",
+                "data": serialized_data,
+                "success": True,
+            },
+            200,
+            etag_headers(etag),
+        )
 
     return get_all_controller
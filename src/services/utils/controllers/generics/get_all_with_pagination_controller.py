@@ -8,6 +8,9 @@ from firebase_admin import App
 from flask import Blueprint, request
 from flask_marshmallow.schema import Schema
 from flask_sqlalchemy.model import Model
+from src.services.utils.helpers.keyset_pagination.keyset_pagination import (
+    keyset_pagination_response,
+)
 from src.services.utils.middleware.auth_middleware import auth_middleware
 
 
@@ -40,6 +43,9 @@ def get_all_with_pagination_controller_factory(
     )
     def get_all_with_pagination_controller(current_user=None):
         args = request.args
+        # Paginate with cursors if the "after" parameter is present (Even if empty).
+        if args.get("after") is not None:
+            return keyset_pagination_response(model().query, model, schema, args)
         # Sort only if "sort_key" parameter is present.
         if args.get("sort_key"):
             data = model().query.order_by(args.get("sort_key"))
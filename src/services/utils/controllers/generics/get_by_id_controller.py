@@ -8,6 +8,13 @@ from firebase_admin import App
 from flask import Blueprint
 from flask_marshmallow.schema import Schema
 from flask_sqlalchemy.model import Model
+from src.services.utils.helpers.conditional_request.conditional_request import (
+    content_etag,
+    etag_headers,
+    is_not_modified,
+    not_modified_response,
+    serialized_etag,
+)
 from src.services.utils.middleware.auth_middleware import auth_middleware
 
 
@@ -46,17 +53,35 @@ def get_by_id_controller_factory(
         Returns:
             dict: Response dictionary containing the updated model instance.
         """
+        # NOTE: Clients that already have the current instance get a 304 before it is read.
+        etag = content_etag(model, schema, uuid)
+        if etag is not None and is_not_modified(etag):
+            return not_modified_response(etag)
         data = model().query.get(uuid)
+        serialized_data = schema().dump(obj=data, many=False)
+        # NOTE: Instances whose Content Version is not tracked get the ETag of their rows.
+        if etag is None:
+            etag = serialized_etag(model, schema, serialized_data, uuid)
+            if is_not_modified(etag):
+                return not_modified_response(etag)
         if not data:
-            return {
-                "success": False,
-                "message": "Model Data Not Found",
-                "data": schema().dump(obj=data, many=False),
-            }, 200
-        return {
-            "success": True,
-            "message": "Model Data Found Successfully",
-            "data": schema().dump(obj=data, many=False),
-        }, 200
+            return (
+                {
+                    "success": False,
+                    "message": "Model Data Not Found",
+                    "data": serialized_data,
+                },
+                200,
+                etag_headers(etag),
+            )
+        return (
+            {
+                "success": True,
+                "message": "Model Data Found Successfully",
+                "data": serialized_data,
+            },
+            200,
+            etag_headers(etag),
+        )
 
     return get_by_id_controller
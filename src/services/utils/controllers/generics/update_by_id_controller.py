@@ -11,6 +11,10 @@ from flask_sqlalchemy import SQLAlchemy
 from flask_sqlalchemy.model import Model
 from sqlalchemy.exc import IntegrityError
 from src.services.utils.middleware.auth_middleware import auth_middleware
+from src.services.utils.helpers.version_counter.version_counter import (
+    bump_domain_version,
+    bump_rules_version,
+)
 
 
 def update_by_id_controller_factory(
@@ -61,6 +65,8 @@ def update_by_id_controller_factory(
         for key in new_data:
             setattr(data, key, new_data[key])
         try:
+            bump_domain_version(db, model)
+            bump_rules_version(db, model)
             db.session.commit()
         except IntegrityError:
             return {
@@ -11,6 +11,16 @@ from flask_marshmallow.schema import Schema
 from flask_sqlalchemy import SQLAlchemy
 from flask_sqlalchemy.model import Model
 from sqlalchemy.exc import IntegrityError
+from src.services.utils.helpers.learning_style_affinity.learning_style_affinity import (
+    update_learning_style_affinities,
+)
+from src.services.utils.helpers.user_knowledge_state.user_knowledge_state import (
+    update_user_knowledge_state,
+)
+from src.services.utils.helpers.version_counter.version_counter import (
+    bump_version,
+    get_evidence_counter_name,
+)
 from src.services.utils.middleware.auth_middleware import auth_middleware
 
 
@@ -52,6 +62,16 @@ def create_one_interaction_fired_factory(
         new_instance = models["InteractionFired"](user_id=current_user.id, **req_data)
         try:
             db.session.add(new_instance)
+            # NOTE: The stored Learning Style Affinities are updated in the same transaction.
+            # Interactions related to learning styles are not Knowledge Evidence, so
+            # they only bump the Learning Style Version of the User.
+            evidence_version = None
+            if not update_learning_style_affinities(
+                db, models, current_user.id, new_instance.measurable_interaction_id
+            ):
+                evidence_version = bump_version(
+                    db, get_evidence_counter_name(current_user.id)
+                )
             db.session.commit()
         except IntegrityError:
             return {
@@ -62,6 +82,14 @@ def create_one_interaction_fired_factory(
                 },
                 "message": "Database Integrity Error",
             }, 400
+        # Re-propagate only the Template affected by the new Evidence and its downstream Topics.
+        if evidence_version is not None:
+            update_user_knowledge_state(
+                models,
+                current_user.id,
+                evidence_version,
+                [new_instance.measurable_interaction_id],
+            )
         return {
             "success": True,
             "message": "Model Data Created Successfully",
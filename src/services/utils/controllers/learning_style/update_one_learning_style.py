@@ -6,6 +6,16 @@ from flask_marshmallow.schema import Schema
 from flask_sqlalchemy import SQLAlchemy
 from flask_sqlalchemy.model import Model
 from sqlalchemy.exc import IntegrityError
+from src.services.utils.helpers.learning_style_affinity.learning_style_affinity import (
+    LEARNING_STYLE_AFFINITY_COLUMNS,
+)
+from src.services.utils.helpers.principal_cache.principal_cache import (
+    invalidate_principal,
+)
+from src.services.utils.helpers.version_counter.version_counter import (
+    bump_version,
+    get_learning_style_counter_name,
+)
 from src.services.utils.middleware.auth_middleware import auth_middleware
 
 
@@ -31,9 +41,15 @@ def update_one_learning_style_controller_factory(
         req_data = request.get_json()
 
         for key in req_data:
+            # NOTE: The Affinities are only updated by the fired Interactions.
+            if key in LEARNING_STYLE_AFFINITY_COLUMNS.values():
+                continue
             setattr(current_user.learning_style, key, req_data[key])
 
         current_user.vark_completed = True
+        # NOTE: The cached Triggered Adaptative Events of the User become stale, but
+        # its Knowledge State does not depend on the Learning Styles.
+        bump_version(db, get_learning_style_counter_name(current_user.id))
 
         try:
             db.session.commit()
@@ -47,6 +63,7 @@ def update_one_learning_style_controller_factory(
                 },
                 "message": "Database Integrity Error",
             }, 400
+        invalidate_principal(current_user.id)
         return {
             "success": True,
             "message": "Model Data Updated Successfully",
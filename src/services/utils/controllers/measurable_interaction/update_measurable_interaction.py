@@ -12,6 +12,9 @@ from flask_sqlalchemy import SQLAlchemy
 from flask_sqlalchemy.model import Model
 from sqlalchemy.exc import IntegrityError
 from src.services.utils.middleware.auth_middleware import auth_middleware
+from src.services.utils.helpers.version_counter.version_counter import (
+    bump_domain_version,
+)
 
 
 def update_measurable_interaction_controller_factory(
@@ -73,6 +76,7 @@ def update_measurable_interaction_controller_factory(
         for key in new_data:
             setattr(data, key, new_data[key])
         try:
+            bump_domain_version(db)
             db.session.commit()
         except IntegrityError:
             return {
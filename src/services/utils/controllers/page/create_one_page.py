@@ -8,6 +8,9 @@ from flask_sqlalchemy.model import Model
 from sqlalchemy import func
 from sqlalchemy.exc import IntegrityError
 from src.services.utils.middleware.auth_middleware import auth_middleware
+from src.services.utils.helpers.version_counter.version_counter import (
+    bump_domain_version,
+)
 
 
 def create_one_page_controller_factory(
@@ -95,6 +98,7 @@ def create_one_page_controller_factory(
         try:
             db.session.add(new_instance)
             db.session.add(page_adaptative_object)
+            bump_domain_version(db)
             db.session.commit()
         except IntegrityError:
             return {
@@ -10,6 +10,9 @@ from flask_marshmallow.schema import Schema
 from flask_sqlalchemy import SQLAlchemy
 from flask_sqlalchemy.model import Model
 from src.services.utils.middleware.auth_middleware import auth_middleware
+from src.services.utils.helpers.version_counter.version_counter import (
+    bump_domain_version,
+)
 
 
 def delete_one_page_controller_factory(
@@ -67,6 +70,7 @@ def delete_one_page_controller_factory(
         ):
             element.relative_position -= 1
         db.session.delete(data)
+        bump_domain_version(db)
         db.session.commit()
         return {
             "success": True,
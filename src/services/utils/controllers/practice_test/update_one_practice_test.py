@@ -8,6 +8,9 @@ from flask_sqlalchemy import SQLAlchemy
 from flask_sqlalchemy.model import Model
 from sqlalchemy.exc import IntegrityError
 from src.services.utils.middleware.auth_middleware import auth_middleware
+from src.services.utils.helpers.version_counter.version_counter import (
+    bump_domain_version,
+)
 
 
 def update_one_practice_test_controller_factory(
@@ -88,6 +91,7 @@ def update_one_practice_test_controller_factory(
                         },
                     }, 400
         try:
+            bump_domain_version(db)
             db.session.commit()
 
         except IntegrityError:
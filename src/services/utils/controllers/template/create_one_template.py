@@ -9,6 +9,9 @@ from flask_sqlalchemy.model import Model
 from sqlalchemy import func
 from sqlalchemy.exc import IntegrityError
 from src.services.utils.middleware.auth_middleware import auth_middleware
+from src.services.utils.helpers.version_counter.version_counter import (
+    bump_domain_version,
+)
 
 
 def create_one_template_controller_factory(
@@ -44,6 +47,7 @@ def create_one_template_controller_factory(
         try:
             db.session.add(new_instance)
             db.session.add(template_adaptative_object)
+            bump_domain_version(db)
             db.session.commit()
         except IntegrityError:
             return {
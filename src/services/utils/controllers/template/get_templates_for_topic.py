@@ -8,6 +8,9 @@ from firebase_admin import App
 from flask import Blueprint, request
 from flask_marshmallow.schema import Schema
 from flask_sqlalchemy.model import Model
+from src.services.utils.helpers.keyset_pagination.keyset_pagination import (
+    keyset_pagination_response,
+)
 from src.services.utils.middleware.auth_middleware import auth_middleware
 
 
@@ -41,6 +44,9 @@ def get_templates_for_topic_factory(
     def get_templates_for_topic(current_user=None):
         args = request.args
         data = model().query.filter_by(topic_id=args.get("topic_id"))
+        # Paginate with cursors if the "after" parameter is present (Even if empty).
+        if args.get("after") is not None:
+            return keyset_pagination_response(data, model, schema, args)
         if args.get("sort_key"):
             data = data.order_by(args.get("sort_key"))
         if args.get("page") and args.get("page_size"):
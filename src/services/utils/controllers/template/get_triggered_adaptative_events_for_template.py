@@ -9,13 +9,27 @@ from firebase_admin import App
 from flask import Blueprint
 from flask_marshmallow.schema import Schema
 from flask_sqlalchemy.model import Model
-from src.services.utils.helpers.learning_style_bayesian_network_constructor.learning_style_bayesian_network_constructor import (
-    learning_style_bayesian_network_constructor,
+from src.services.utils.helpers.adaptation_rule_engine.adaptation_rule_engine import (
+    adaptation_rule_variables,
+    find_triggered_adaptative_events,
 )
-from src.services.utils.middleware.auth_middleware import auth_middleware
-from src.services.utils.helpers.knowledge_bayesian_network_constructor.knowledge_bayesian_network_constructor import (
-    knowledge_bayesian_network_constructor,
+from src.services.utils.helpers.adaptative_object_ancestry.adaptative_object_ancestry import (
+    find_object_context,
+)
+from src.services.utils.helpers.conditional_request.conditional_request import (
+    etag_headers,
+    is_not_modified,
+    not_modified_response,
+)
+from src.services.utils.helpers.principal_cache.principal_cache import (
+    refresh_learning_style,
 )
+from src.services.utils.helpers.triggered_events_cache.triggered_events_cache import (
+    cached_triggered_adaptative_events,
+    triggered_events_etag,
+    triggered_events_versions,
+)
+from src.services.utils.middleware.auth_middleware import auth_middleware
 
 
 def get_triggered_adaptative_events_by_template_controller_factory(
@@ -55,8 +69,12 @@ def get_triggered_adaptative_events_by_template_controller_factory(
         Returns:
             dict: Response dictionary containing the Triggered Adaptative Events.
         """
-        template = models["Template"].query.filter_by(id=uuid).first()
-        if not template:
+        # NOTE: The Topic of the Template is resolved from the ancestry index,
+        # which is only rebuilt when the Domain Version read here changes.
+        versions = triggered_events_versions(models, current_user.id)
+        _, learning_style_version, domain_version, _ = versions
+        context = find_object_context(models, "Template", uuid, domain_version)
+        if context is None:
             return {
                 "message": "Template not found",
                 "data": {
@@ -65,68 +83,42 @@ def get_triggered_adaptative_events_by_template_controller_factory(
                 },
                 "success": False,
             }, 400
+        adaptative_object_id, topic_id, template_id = context
 
-        # Use Utility Function to Construct a Bayesian Network for User Model.
-        knowledge_bayesian_network = knowledge_bayesian_network_constructor(
-            models, current_user
-        )
-        learning_styles_values = learning_style_bayesian_network_constructor(
-            models, current_user
-        )
-        print("Knowledge Information =>", knowledge_bayesian_network.nodes)
-        print("Learning Styles =>", learning_styles_values)
-
-        # Get all of the adaptative events for the template.
-        adaptative_events = template.adaptative_object.adaptative_events.order_by(
-            "relative_position"
-        ).all()
-
-        # Get other important information about the Template (Parent Topic)
-        topic = template.topic
-        # Filter out the adaptative events that are not triggered by the user.
-        triggered_adaptative_events = []
-        for adaptative_event in adaptative_events:
-            condition_met_array = []
-            for condition in adaptative_event.adaptation_conditions:
-                if condition.variable_to_compare == "TOPIC_KNOWLEDGE":
-                    variable_to_compare = knowledge_bayesian_network.nodes[topic.id][
-                        "expected_knowledge"
-                    ]
-                elif condition.variable_to_compare == "TEMPLATE_KNOWLEDGE":
-                    variable_to_compare = knowledge_bayesian_network.nodes[template.id][
-                        "expected_knowledge"
-                    ]
-                elif condition.variable_to_compare == "LEARNING_STYLE_AURAL_AFFINITY":
-                    variable_to_compare = learning_styles_values["AURAL"]
-                elif condition.variable_to_compare == "LEARNING_STYLE_VISUAL_AFFINITY":
-                    variable_to_compare = learning_styles_values["VISUAL"]
-                elif condition.variable_to_compare == "LEARNING_STYLE_READING_AFFINITY":
-                    variable_to_compare = learning_styles_values["TEXTUAL"]
-                elif (
-                    condition.variable_to_compare
-                    == "LEARNING_STYLE_KINESTHETIC_AFFINITY"
-                ):
-                    variable_to_compare = learning_styles_values["KINESTHETIC"]
-                condition_met_array.append(
-                    variable_to_compare <= condition.value_to_compare / 100
-                    if condition.comparation_condition == "lte"
-                    else variable_to_compare >= condition.value_to_compare / 100
-                )
+        # NOTE: Clients that already have the current Events get a 304 before any inference.
+        etag = triggered_events_etag(current_user.id, adaptative_object_id, versions)
+        if is_not_modified(etag):
+            return not_modified_response(etag)
+        # NOTE: The cached Learning Style is only read again if its Version changed.
+        refresh_learning_style(current_user, learning_style_version)
 
-            if adaptative_event.condition_aggregator == "AND" and all(
-                condition_met_array
-            ):
-                triggered_adaptative_events.append(adaptative_event)
-            elif adaptative_event.condition_aggregator == "OR" and any(
-                condition_met_array
-            ):
-                triggered_adaptative_events.append(adaptative_event)
-        return {
-            "success": True,
-            "data": schemas["AdaptativeEvent_CompleteSchema"]().dump(
-                obj=triggered_adaptative_events, many=True
+        # Find the adaptative events triggered by the user with the compiled Adaptation Rules.
+        # NOTE: The User Model is only inferred for the variables the Conditions read, and
+        # only if the cached Events are stale.
+        triggered_adaptative_events = cached_triggered_adaptative_events(
+            models,
+            current_user.id,
+            adaptative_object_id,
+            lambda: schemas["AdaptativeEvent_CompleteSchema"]().dump(
+                obj=find_triggered_adaptative_events(
+                    models,
+                    adaptative_object_id,
+                    adaptation_rule_variables(
+                        models, current_user, topic_id, template_id
+                    ),
+                ),
+                many=True,
             ),
-            "message": "Adaptative Events for Template Retrieved Successfully",
-        }, 200
+            versions,
+        )
+        return (
+            {
+                "success": True,
+                "data": triggered_adaptative_events,
+                "message": "Adaptative Events for Template Retrieved Successfully",
+            },
+            200,
+            etag_headers(etag),
+        )
 
     return get_triggered_adaptative_events_by_template_controller
@@ -6,6 +6,13 @@ from flask_marshmallow.schema import Schema
 from flask_sqlalchemy import SQLAlchemy
 from flask_sqlalchemy.model import Model
 from sqlalchemy.exc import IntegrityError
+from src.services.utils.helpers.user_knowledge_state.user_knowledge_state import (
+    update_user_knowledge_state,
+)
+from src.services.utils.helpers.version_counter.version_counter import (
+    bump_version,
+    get_evidence_counter_name,
+)
 from src.services.utils.middleware.auth_middleware import auth_middleware
 
 
@@ -143,6 +150,9 @@ def create_one_test_attempt_controller_factory(
         # Add the Test Attempt to the Database and commit the changes.
         try:
             db.session.add(test_attempt)
+            evidence_version = bump_version(
+                db, get_evidence_counter_name(current_user.id)
+            )
             db.session.commit()
         except IntegrityError:
             return {
@@ -153,6 +163,16 @@ def create_one_test_attempt_controller_factory(
                 },
                 "message": "Database Integrity Error",
             }, 400
+        # Re-propagate only the Template affected by the new Evidence and its downstream Topics.
+        # NOTE: A Practice Test is Knowledge Evidence only if the user passed it.
+        update_user_knowledge_state(
+            models,
+            current_user.id,
+            evidence_version,
+            [practice_test.page_id]
+            if test_attempt.acquired_score >= practice_test.approval_score
+            else [],
+        )
         return {
             "success": True,
             "message": "Model Data Created Successfully",
@@ -8,6 +8,9 @@ from flask_sqlalchemy import SQLAlchemy
 from flask_sqlalchemy.model import Model
 from sqlalchemy.exc import IntegrityError
 from src.services.utils.middleware.auth_middleware import auth_middleware
+from src.services.utils.helpers.version_counter.version_counter import (
+    bump_domain_version,
+)
 from src.lib.exceptions.circular_exception import CircularException
 
 
@@ -140,6 +143,7 @@ def create_topic_prelations_controller_factory(
         predecessor.successors.append(precedence)
         successor.predecessors.append(precedence)
         try:
+            bump_domain_version(db)
             db.session.commit()
         except IntegrityError:
             return {
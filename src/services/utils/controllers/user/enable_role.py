@@ -12,6 +12,9 @@ from flask_marshmallow.schema import Schema
 from flask_sqlalchemy import SQLAlchemy
 from flask_sqlalchemy.model import Model
 from sqlalchemy.exc import IntegrityError
+from src.services.utils.helpers.principal_cache.principal_cache import (
+    invalidate_principal,
+)
 from src.services.utils.middleware.auth_middleware import auth_middleware
 
 
@@ -83,6 +86,7 @@ def enable_role_controller_factory(
                 },
                 "message": "Database Integrity Error",
             }, 400
+        invalidate_principal(data.id)
 
         return {
             "success": True,
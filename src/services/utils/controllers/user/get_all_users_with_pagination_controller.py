@@ -9,6 +9,9 @@ from firebase_admin import App
 from flask import Blueprint, request
 from flask_marshmallow.schema import Schema
 from flask_sqlalchemy.model import Model
+from src.services.utils.helpers.keyset_pagination.keyset_pagination import (
+    keyset_pagination_response,
+)
 from src.services.utils.middleware.auth_middleware import auth_middleware
 
 
@@ -42,6 +45,16 @@ def get_all_users_with_pagination_controller_factory(
     def get_all_users_with_pagination_controller(current_user=None):
         args = request.args
         user_type = args.get("user_type") if args.get("user_type") else "student"
+        # Paginate with cursors if the "after" parameter is present (Even if empty).
+        if args.get("after") is not None:
+            return keyset_pagination_response(
+                models["User"]()
+                .query.join(models["Role"])
+                .filter(models["Role"].role_name == user_type),
+                models["User"],
+                schema,
+                args,
+            )
         if args.get("sort_key"):
             data = (
                 models["User"]()
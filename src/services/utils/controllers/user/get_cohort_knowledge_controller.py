@@ -0,0 +1,107 @@
+# -*- coding: utf-8 -*-
+"""Module containing the Controller for Reading the estimated Knowledge of the Students (With Pagination)
+
+Returns:
+    function: Read Function for the Knowledge of a page of Students.
+"""
+from typing import Dict
+from firebase_admin import App
+from flask import Blueprint, request
+from flask_marshmallow.schema import Schema
+from flask_sqlalchemy.model import Model
+from src.services.utils.helpers.cohort_knowledge_inference.cohort_knowledge_inference import (
+    cohort_knowledge_inference,
+)
+from src.services.utils.helpers.keyset_pagination.keyset_pagination import (
+    DEFAULT_PAGE_SIZE,
+)
+from src.services.utils.middleware.auth_middleware import auth_middleware
+
+
+def get_cohort_knowledge_controller_factory(
+    models: Dict[str, Model],
+    schema: Schema,
+    blueprint: Blueprint,
+    expected_role: str = None,
+    firebase_app: App = None,
+    user_model: Model = None,
+):
+    """Creates a Controller for Reading the estimated Knowledge of the Students (With Pagination)
+
+    Args:
+        models (Dict[str, Model]): Dictionary containing all models defined in the Database.
+        schema (Schema): Schema of the Users to Return on success.
+        blueprint (Blueprint): Blueprint to contain the new route.
+        expected_role (str): Expected Role String. Either teacher or student.
+        firebase_app (App): Firebase App Instance.
+        user_model (Model): User Model Instance.
+
+    Returns:
+        function: Read Function for the Knowledge of a page of Students.
+    """
+
+    @blueprint.route("/knowledge_with_pagination", methods=["GET"])
+    @auth_middleware(
+        expected_role=expected_role, firebase_app=firebase_app, user_model=user_model
+    )
+    def get_cohort_knowledge_controller(current_user=None):
+        args = request.args
+        try:
+            page = int(args.get("page", 1))
+            page_size = int(args.get("page_size", DEFAULT_PAGE_SIZE))
+        except ValueError:
+            page, page_size = 0, 0
+        if page < 1 or page_size < 1:
+            return {
+                "message": "The page and page_size must be positive integers",
+                "data": {
+                    "error": "INVALID_PAGINATION",
+                    "message": "The page and page_size must be positive integers",
+                },
+                "success": False,
+            }, 400
+
+        query = (
+            models["User"]()
+            .query.join(models["Role"])
+            .filter(models["Role"].role_name == "student")
+        )
+        if args.get("sort_key"):
+            query = query.order_by(args.get("sort_key"))
+        data = query.order_by(models["User"].id).paginate(page=page, per_page=page_size)
+
+        # NOTE: The Knowledge of the whole page is estimated in a single batched pass.
+        cohort_knowledge = cohort_knowledge_inference(
+            models, [user.id for user in data.items]
+        )
+        users = schema().dump(obj=data.items, many=True)
+        return {
+            "message": "Cohort Knowledge Found Successfully",
+            "data": {
+                "total_pages": data.pages,
+                "total_items": data.total,
+                "current_page": data.page,
+                "page_size": data.per_page,
+                "nodes": [
+                    {"id": str(node_id), "entity_type": entity_type}
+                    for node_id, entity_type in zip(
+                        cohort_knowledge["node_ids"], cohort_knowledge["entity_types"]
+                    )
+                ],
+                "items": [
+                    {
+                        "user": user,
+                        "expected_knowledge": expected_knowledge.tolist(),
+                        "evidence_observed": evidence_observed.tolist(),
+                    }
+                    for user, expected_knowledge, evidence_observed in zip(
+                        users,
+                        cohort_knowledge["expected_knowledge"],
+                        cohort_knowledge["evidence_observed"],
+                    )
+                ],
+            },
+            "success": True,
+        }, 200
+
+    return get_cohort_knowledge_controller
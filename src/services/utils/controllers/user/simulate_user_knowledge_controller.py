@@ -0,0 +1,184 @@
+# -*- coding: utf-8 -*-
+"""Module containing the Controller for Simulating hypothetical Evidence on the Knowledge of a Student.
+
+Returns:
+    function: Simulation Function for the Knowledge of a Student.
+"""
+from collections import ChainMap
+from typing import Dict
+from firebase_admin import App
+from flask import Blueprint, request
+from flask_marshmallow.schema import Schema
+from flask_sqlalchemy.model import Model
+from src.services.utils.helpers.adaptation_rule_engine.adaptation_rule_engine import (
+    find_scenarios_triggered_adaptative_events,
+)
+from src.services.utils.helpers.adaptative_object_ancestry.adaptative_object_ancestry import (
+    knowledge_nodes_ancestry,
+)
+from src.services.utils.helpers.knowledge_simulation.knowledge_simulation import (
+    resolve_hypothetical_evidence,
+    user_knowledge_simulation,
+)
+from src.services.utils.helpers.triggered_events_cache.triggered_events_cache import (
+    triggered_events_diff,
+)
+from src.services.utils.middleware.auth_middleware import auth_middleware
+
+
+def simulate_user_knowledge_controller_factory(
+    models: Dict[str, Model],
+    schemas: Dict[str, Schema],
+    blueprint: Blueprint,
+    expected_role: str = None,
+    firebase_app: App = None,
+    user_model: Model = None,
+):
+    """Creates a Controller for Simulating hypothetical Evidence on the Knowledge of a Student.
+
+    Args:
+        models (Dict[str, Model]): Dictionary containing all models defined in the Database.
+        schemas (Dict[str,Schema]): Dictionary containing all schemas defined in the API.
+        blueprint (Blueprint): Blueprint to contain the new route.
+        expected_role (str): Expected Role String. Either teacher or student.
+        firebase_app (App): Firebase App Instance.
+        user_model (Model): User Model Instance.
+
+    Returns:
+        function: Simulation Function for the Knowledge of a Student.
+    """
+
+    @blueprint.route("/<string:uuid>/knowledge/simulate", methods=["POST"])
+    @auth_middleware(
+        expected_role=expected_role, firebase_app=firebase_app, user_model=user_model
+    )
+    def simulate_user_knowledge_controller(uuid: str, current_user=None):
+        """Function to simulate hypothetical Evidence on the Knowledge of a Student, without writing it.
+
+        The request body contains:
+            scenarios (List[List[dict]]): Hypothetical Evidence deltas of every scenario. Every
+                delta is either {"practice_test_id", "passed"} or {"measurable_interaction_id", "fired"}.
+
+        Args:
+            uuid (str): Unique ID of the Student.
+
+        Returns:
+            dict: Response dictionary containing, for every scenario, the Topics and Templates
+            whose Knowledge changed and the Triggered Adaptative Events added and removed.
+        """
+        req_data = request.get_json() or {}
+        scenarios = req_data.get("scenarios")
+        if (
+            not isinstance(scenarios, list)
+            or not scenarios
+            or not all(
+                isinstance(scenario, list)
+                and all(isinstance(delta, dict) for delta in scenario)
+                for scenario in scenarios
+            )
+        ):
+            return {
+                "message": "scenarios must be a non empty list of lists of Evidence deltas",
+                "data": {
+                    "error": "INVALID_SCENARIOS",
+                    "message": "scenarios must be a non empty list of lists of Evidence deltas",
+                },
+                "success": False,
+            }, 400
+
+        user = models["User"].query.filter_by(id=uuid).first()
+        if not user:
+            return {
+                "message": "User not found",
+                "data": {"error": "USER_NOT_FOUND", "message": "User not found"},
+                "success": False,
+            }, 400
+
+        # NOTE: The Evidence of every scenario is resolved at once.
+        scenarios_evidence_changes, unresolved_deltas = resolve_hypothetical_evidence(
+            models, scenarios
+        )
+        if unresolved_deltas:
+            return {
+                "message": "Some Evidence deltas are not Knowledge Evidence",
+                "data": {
+                    "error": "INVALID_EVIDENCE",
+                    "message": "Some Evidence deltas are not Knowledge Evidence",
+                    "deltas": unresolved_deltas,
+                },
+                "success": False,
+            }, 400
+
+        simulation = user_knowledge_simulation(models, user)
+        changed_knowledge = [
+            simulation.simulate(evidence_changes)
+            for evidence_changes in scenarios_evidence_changes
+        ]
+
+        # NOTE: Only the Events of the Adaptative Objects whose Topic or Template changed
+        # can differ from the current ones, and every scenario is evaluated in one pass.
+        ancestry = knowledge_nodes_ancestry(
+            models,
+            {
+                node_id
+                for changed_nodes in changed_knowledge
+                for node_id in changed_nodes
+            },
+        )
+        baseline_events, *scenarios_events = find_scenarios_triggered_adaptative_events(
+            models,
+            user,
+            ancestry,
+            [simulation.knowledge_estimation]
+            + [
+                ChainMap(changed_nodes, simulation.knowledge_estimation)
+                for changed_nodes in changed_knowledge
+            ],
+        )
+        adaptative_event_schema = schemas["AdaptativeEvent_CompleteSchema"]()
+
+        def dump_triggered_adaptative_events(triggered_adaptative_events: dict) -> dict:
+            return {
+                str(adaptative_object_id): adaptative_event_schema.dump(
+                    obj=adaptative_events, many=True
+                )
+                for adaptative_object_id, adaptative_events in triggered_adaptative_events.items()
+            }
+
+        baseline_events = dump_triggered_adaptative_events(baseline_events)
+        return {
+            "message": "Knowledge Simulated Successfully",
+            "data": {
+                "scenarios": [
+                    {
+                        "knowledge": {
+                            str(node_id): {
+                                "expected_knowledge": {
+                                    "before": simulation.knowledge_estimation[
+                                        node_id
+                                    ].get("expected_knowledge"),
+                                    "after": node.get("expected_knowledge"),
+                                },
+                                "evidence_observed": {
+                                    "before": simulation.knowledge_estimation[node_id][
+                                        "evidence_observed"
+                                    ],
+                                    "after": node["evidence_observed"],
+                                },
+                            }
+                            for node_id, node in changed_nodes.items()
+                        },
+                        "triggered_events": triggered_events_diff(
+                            baseline_events,
+                            dump_triggered_adaptative_events(scenario_events),
+                        ),
+                    }
+                    for changed_nodes, scenario_events in zip(
+                        changed_knowledge, scenarios_events
+                    )
+                ]
+            },
+            "success": True,
+        }, 200
+
+    return simulate_user_knowledge_controller
@@ -0,0 +1,674 @@
+# -*- coding: utf-8 -*-
+"""Module containing the Rule Engine for the Adaptation Rules of the Adaptative Objects.
+
+The Adaptative Events and Adaptation Conditions of every Adaptative Object are compiled
+once into a flat list of (Event ID, Aggregator, Conditions, Event), where every Condition
+is a predicate closure over the variables of the User Model and Event holds the values
+needed to serialize it. The compiled rules are cached per process and dropped whenever
+the Rules Version Counter changes, so the triggered Events are served without Queries.
+
+The variables of the User Model are only computed when a Condition reads them, by the
+provider of their family (See LazyRuleVariables), so the Knowledge inference only runs
+if a Knowledge Condition is actually evaluated.
+
+Returns:
+    function: Functions for compiling and evaluating the Adaptation Rules.
+"""
+
+import operator
+from itertools import groupby
+from threading import Lock
+from functools import lru_cache
+from typing import Callable, Dict, Iterable, Iterator, List, Mapping, Tuple
+from uuid import UUID
+
+import numpy as np
+from flask_sqlalchemy.model import Model
+from src.services.utils.helpers.learning_style_bayesian_network_constructor.learning_style_bayesian_network_constructor import (
+    learning_style_bayesian_network_constructor,
+)
+from src.services.utils.helpers.user_knowledge_state.user_knowledge_state import (
+    user_knowledge_state,
+)
+from src.services.utils.helpers.version_counter.version_counter import (
+    RULES_VERSION,
+    get_version,
+)
+
+# Learning Style of every Learning Style variable_to_compare.
+LEARNING_STYLE_VARIABLES = {
+    "LEARNING_STYLE_AURAL_AFFINITY": "AURAL",
+    "LEARNING_STYLE_VISUAL_AFFINITY": "VISUAL",
+    "LEARNING_STYLE_READING_AFFINITY": "TEXTUAL",
+    "LEARNING_STYLE_KINESTHETIC_AFFINITY": "KINESTHETIC",
+}
+
+# Family of every variable_to_compare. The variables of a family are computed together.
+VARIABLE_FAMILIES = {
+    "TOPIC_KNOWLEDGE": "KNOWLEDGE",
+    "TEMPLATE_KNOWLEDGE": "KNOWLEDGE",
+    **{
+        variable_to_compare: "LEARNING_STYLE"
+        for variable_to_compare in LEARNING_STYLE_VARIABLES
+    },
+}
+
+# NOTE: all() and any() stop at the first Condition that decides the Event.
+CONDITION_AGGREGATORS = {"AND": all, "OR": any}
+
+# NOTE: The cache only holds plain values and closures, never ORM instances.
+_adaptation_rules_cache = {"version": None, "adaptation_rules": {}}
+_adaptation_rules_lock = Lock()
+
+
+def _compile_condition(
+    variable_to_compare: str, comparation_condition: str, value_to_compare: int
+) -> Callable[[Mapping], bool]:
+    """Function to compile an Adaptation Condition into a predicate over the User Model variables."""
+    threshold = value_to_compare / 100
+    compare = operator.le if comparation_condition == "lte" else operator.ge
+
+    def condition_met(variables: Mapping) -> bool:
+        # NOTE: A variable that does not apply to the Adaptative Object never meets a Condition.
+        value = variables.get(variable_to_compare)
+        return value is not None and compare(value, threshold)
+
+    return condition_met
+
+
+def _column_values(instance: Model) -> dict:
+    """Function to copy the column values of a Model instance into a plain dictionary."""
+    return {
+        column.key: getattr(instance, column.key)
+        for column in instance.__table__.columns
+    }
+
+
+def compile_adaptative_event(adaptative_event: dict) -> Tuple:
+    """Function to compile an Adaptative Event into an Adaptation Rule.
+
+    Args:
+        adaptative_event (dict): Columns of the Event and of its adaptation_conditions.
+            The condition_aggregator must be one of CONDITION_AGGREGATORS.
+
+    Returns:
+        Tuple: (Event ID, Aggregator, Conditions, Event) Adaptation Rule.
+    """
+    return (
+        adaptative_event["id"],
+        CONDITION_AGGREGATORS[adaptative_event["condition_aggregator"]],
+        tuple(
+            _compile_condition(
+                adaptation_condition["variable_to_compare"],
+                adaptation_condition["comparation_condition"],
+                adaptation_condition["value_to_compare"],
+            )
+            for adaptation_condition in adaptative_event["adaptation_conditions"]
+        ),
+        adaptative_event,
+    )
+
+
+def compile_objects_adaptation_rules(
+    models: Dict[str, Model], adaptative_object_ids: Iterable[UUID]
+) -> Dict[UUID, List[Tuple]]:
+    """Function to compile the Adaptation Rules of many Adaptative Objects.
+
+    Args:
+        models (Dict[str,Model]): Dictionary containing all models defined in the Database.
+        adaptative_object_ids (Iterable[UUID]): IDs of the Adaptative Objects.
+
+    Returns:
+        Dict[UUID, List[Tuple]]: (Event ID, Aggregator, Conditions, Event) of every Event that
+        can be triggered on every Adaptative Object, ordered by the relative_position of the
+        Events. Event holds the columns of the Event and of its Conditions, and serializes
+        with AdaptativeEvent_CompleteSchema like the Event instance itself.
+    """
+    compiled_rules = {
+        adaptative_object_id: [] for adaptative_object_id in adaptative_object_ids
+    }
+    if not compiled_rules:
+        return compiled_rules
+    # Get every Event alongside its Conditions in a single Query.
+    # NOTE: adaptation_conditions is a dynamic relationship, so it can not be eager loaded.
+    rows = (
+        models["AdaptativeEvent"]
+        .query.outerjoin(models["AdaptationCondition"])
+        .add_entity(models["AdaptationCondition"])
+        .filter(
+            models["AdaptativeEvent"].adaptative_object_id.in_(list(compiled_rules))
+        )
+        .order_by(
+            models["AdaptativeEvent"].adaptative_object_id,
+            models["AdaptativeEvent"].relative_position,
+            models["AdaptativeEvent"].id,
+            models["AdaptationCondition"].created_at,
+            models["AdaptationCondition"].id,
+        )
+        .all()
+    )
+
+    for adaptative_event, event_rows in groupby(rows, key=lambda row: row[0]):
+        # NOTE: Events without a valid aggregator are never triggered, so they are dropped.
+        if adaptative_event.condition_aggregator not in CONDITION_AGGREGATORS:
+            continue
+        adaptation_conditions = [
+            adaptation_condition
+            for _, adaptation_condition in event_rows
+            if adaptation_condition is not None
+        ]
+        compiled_rules[adaptative_event.adaptative_object_id].append(
+            compile_adaptative_event(
+                {
+                    **_column_values(adaptative_event),
+                    "adaptation_conditions": [
+                        _column_values(adaptation_condition)
+                        for adaptation_condition in adaptation_conditions
+                    ],
+                }
+            )
+        )
+    return compiled_rules
+
+
+def compile_adaptation_rules(
+    models: Dict[str, Model], adaptative_object_id: UUID
+) -> List[Tuple]:
+    """Function to compile the Adaptation Rules of an Adaptative Object.
+
+    Args:
+        models (Dict[str,Model]): Dictionary containing all models defined in the Database.
+        adaptative_object_id (UUID): ID of the Adaptative Object.
+
+    Returns:
+        List[Tuple]: (Event ID, Aggregator, Conditions) of every Event that can be
+        triggered, ordered by the relative_position of the Events.
+    """
+    return compile_objects_adaptation_rules(models, [adaptative_object_id])[
+        adaptative_object_id
+    ]
+
+
+def objects_adaptation_rules(
+    models: Dict[str, Model],
+    adaptative_object_ids: Iterable[UUID],
+    version: int = None,
+) -> Dict[UUID, List[Tuple]]:
+    """Function to get the compiled Adaptation Rules of many Adaptative Objects.
+
+    NOTE: The Rules missing from the cache are compiled together in a single Query.
+
+    Args:
+        models (Dict[str,Model]): Dictionary containing all models defined in the Database.
+        adaptative_object_ids (Iterable[UUID]): IDs of the Adaptative Objects.
+        version (int): Rules Version already read by the caller. Read from the Database if not given.
+
+    Returns:
+        Dict[UUID, List[Tuple]]: Compiled Adaptation Rules of every Adaptative Object
+        (See compile_adaptation_rules).
+    """
+    # NOTE: We read the version before loading the Rules. If they change while they are
+    # being compiled, the next request will see a newer version and compile them again.
+    if version is None:
+        version = get_version(models, RULES_VERSION)
+    with _adaptation_rules_lock:
+        if _adaptation_rules_cache["version"] != version:
+            _adaptation_rules_cache["version"] = version
+            _adaptation_rules_cache["adaptation_rules"] = {}
+        cached_rules = _adaptation_rules_cache["adaptation_rules"]
+        compiled_rules = {
+            adaptative_object_id: cached_rules.get(adaptative_object_id)
+            for adaptative_object_id in adaptative_object_ids
+        }
+    missing_object_ids = [
+        adaptative_object_id
+        for adaptative_object_id, object_rules in compiled_rules.items()
+        if object_rules is None
+    ]
+    if not missing_object_ids:
+        return compiled_rules
+
+    missing_rules = compile_objects_adaptation_rules(models, missing_object_ids)
+    with _adaptation_rules_lock:
+        if _adaptation_rules_cache["version"] == version:
+            _adaptation_rules_cache["adaptation_rules"].update(missing_rules)
+    compiled_rules.update(missing_rules)
+    return compiled_rules
+
+
+def adaptation_rules(
+    models: Dict[str, Model], adaptative_object_id: UUID, version: int = None
+) -> List[Tuple]:
+    """Function to get the compiled Adaptation Rules of an Adaptative Object.
+
+    Args:
+        models (Dict[str,Model]): Dictionary containing all models defined in the Database.
+        adaptative_object_id (UUID): ID of the Adaptative Object.
+        version (int): Rules Version already read by the caller. Read from the Database if not given.
+
+    Returns:
+        List[Tuple]: Compiled Adaptation Rules (See compile_adaptation_rules).
+    """
+    return objects_adaptation_rules(models, [adaptative_object_id], version)[
+        adaptative_object_id
+    ]
+
+
+def evaluate_adaptation_rules(
+    compiled_rules: List[Tuple], variables: Mapping
+) -> List[UUID]:
+    """Function to find the Events triggered by the variables of a User Model.
+
+    Args:
+        compiled_rules (List[Tuple]): Compiled Adaptation Rules (See compile_adaptation_rules).
+        variables (Mapping): Value of every variable_to_compare for the User.
+
+    Returns:
+        List[UUID]: IDs of the triggered Events, ordered by their relative_position.
+    """
+    return [
+        event_id
+        for event_id, aggregate, conditions, _ in compiled_rules
+        if aggregate(condition_met(variables) for condition_met in conditions)
+    ]
+
+
+class LazyRuleVariables(Mapping):
+    """Variables of a User Model that are computed by the provider of their family on first read.
+
+    Every provider is called at most once, and returns the value of every variable of its
+    family. Variables without a provider (e.g. TEMPLATE_KNOWLEDGE of a Topic) are missing.
+    """
+
+    def __init__(self, providers: Dict[str, Callable[[], Mapping]]):
+        self._providers = providers
+        self._family_values = {}
+
+    def _family(self, family: str) -> Mapping:
+        if family not in self._family_values:
+            provider = self._providers.get(family)
+            self._family_values[family] = provider() if provider else {}
+        return self._family_values[family]
+
+    def __getitem__(self, variable_to_compare: str) -> float:
+        return self._family(VARIABLE_FAMILIES[variable_to_compare])[variable_to_compare]
+
+    def __iter__(self) -> Iterator[str]:
+        for family in self._providers:
+            yield from self._family(family)
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+
+def user_model_estimators(
+    models: Dict[str, Model], current_user: Model, knowledge_node_ids: Iterable[UUID]
+) -> Dict[str, Callable[[], Mapping]]:
+    """Function to get the memoized estimators of the User Model shared by many Adaptative Objects.
+
+    Args:
+        models (Dict[str,Model]): Dictionary containing all models defined in the Database.
+        current_user (Model): Current User.
+        knowledge_node_ids (Iterable[UUID]): IDs of every Topic and Template whose Knowledge may be read.
+
+    Returns:
+        Dict[str, Callable[[], Mapping]]: Estimator of the Knowledge and of the Learning Styles,
+        each one estimated at most once.
+    """
+    knowledge_node_ids = list(dict.fromkeys(knowledge_node_ids))
+    return {
+        "KNOWLEDGE": lru_cache(maxsize=None)(
+            lambda: user_knowledge_state(models, current_user, knowledge_node_ids)
+        ),
+        "LEARNING_STYLE": lru_cache(maxsize=None)(
+            lambda: learning_style_bayesian_network_constructor(models, current_user)
+        ),
+    }
+
+
+def object_rule_variables(
+    estimators: Dict[str, Callable[[], Mapping]],
+    topic_id: UUID,
+    template_id: UUID = None,
+) -> LazyRuleVariables:
+    """Function to get the variables of an Adaptative Object from the estimators of the User Model.
+
+    Args:
+        estimators (Dict[str, Callable[[], Mapping]]): Estimators of the User Model (See user_model_estimators).
+        topic_id (UUID): ID of the Topic of the Adaptative Object.
+        template_id (UUID): ID of the Template of the Adaptative Object (If it has one).
+
+    Returns:
+        LazyRuleVariables: Value of every variable_to_compare, computed on first read.
+    """
+
+    def knowledge_variables() -> Dict[str, float]:
+        knowledge_estimation = estimators["KNOWLEDGE"]()
+        variables = {
+            "TOPIC_KNOWLEDGE": knowledge_estimation[topic_id]["expected_knowledge"]
+        }
+        if template_id is not None:
+            variables["TEMPLATE_KNOWLEDGE"] = knowledge_estimation[template_id][
+                "expected_knowledge"
+            ]
+        return variables
+
+    def learning_style_variables() -> Dict[str, float]:
+        learning_styles_values = estimators["LEARNING_STYLE"]()
+        return {
+            variable_to_compare: learning_styles_values[learning_style]
+            for variable_to_compare, learning_style in LEARNING_STYLE_VARIABLES.items()
+        }
+
+    return LazyRuleVariables(
+        {
+            "KNOWLEDGE": knowledge_variables,
+            "LEARNING_STYLE": learning_style_variables,
+        }
+    )
+
+
+def adaptation_rule_variables(
+    models: Dict[str, Model],
+    current_user: Model,
+    topic_id: UUID,
+    template_id: UUID = None,
+) -> LazyRuleVariables:
+    """Function to get the variables of the User Model for the Adaptation Rules of an Adaptative Object.
+
+    Args:
+        models (Dict[str,Model]): Dictionary containing all models defined in the Database.
+        current_user (Model): Current User.
+        topic_id (UUID): ID of the Topic of the Adaptative Object.
+        template_id (UUID): ID of the Template of the Adaptative Object (If it has one).
+
+    Returns:
+        LazyRuleVariables: Value of every variable_to_compare, computed on first read.
+    """
+    # NOTE: Only the Knowledge of the related Topic and Template is needed.
+    knowledge_node_ids = [topic_id] if template_id is None else [topic_id, template_id]
+    return object_rule_variables(
+        user_model_estimators(models, current_user, knowledge_node_ids),
+        topic_id,
+        template_id,
+    )
+
+
+def compile_threshold_index(
+    compiled_rules: Dict[UUID, List[Tuple]],
+    adaptative_object_ancestry: Dict[UUID, Tuple[UUID, UUID]],
+) -> dict:
+    """Function to compile the Adaptation Rules of many Adaptative Objects into a Threshold Index.
+
+    Every Condition is resolved to the variable it actually reads: the Knowledge of the
+    Topic or Template of its Adaptative Object (By Node ID), or a Learning Style (By
+    variable_to_compare). The thresholds of every variable are kept in sorted arrays, so
+    the Conditions met by a value are found with a binary search. The Conditions of every
+    Event are contiguous, and Events are resolved by counting the Conditions met.
+
+    Args:
+        compiled_rules (Dict[UUID, List[Tuple]]): Compiled Adaptation Rules of every
+            Adaptative Object (See objects_adaptation_rules).
+        adaptative_object_ancestry (Dict[UUID, Tuple[UUID, UUID]]): Topic ID and Template ID
+            (None for Topics) of every Adaptative Object.
+
+    Returns:
+        dict: Threshold Index of the Adaptation Rules.
+    """
+    adaptative_events = []
+    condition_starts = []
+    condition_ends = []
+    thresholds = {}
+    size = 0
+    for adaptative_object_id, object_rules in compiled_rules.items():
+        topic_id, template_id = adaptative_object_ancestry[adaptative_object_id]
+        variable_keys = {
+            "TOPIC_KNOWLEDGE": topic_id,
+            "TEMPLATE_KNOWLEDGE": template_id,
+            **{
+                variable_to_compare: variable_to_compare
+                for variable_to_compare in LEARNING_STYLE_VARIABLES
+            },
+        }
+        for _, aggregate, _, adaptative_event in object_rules:
+            adaptative_events.append(
+                (adaptative_object_id, aggregate is all, adaptative_event)
+            )
+            condition_starts.append(size)
+            for adaptation_condition in adaptative_event["adaptation_conditions"]:
+                variable_key = variable_keys.get(
+                    adaptation_condition["variable_to_compare"]
+                )
+                # NOTE: Conditions over variables that do not apply are kept, but never met.
+                if variable_key is not None:
+                    comparation_condition = (
+                        "lte"
+                        if adaptation_condition["comparation_condition"] == "lte"
+                        else "gte"
+                    )
+                    thresholds.setdefault(
+                        variable_key, {"lte": ([], []), "gte": ([], [])}
+                    )[comparation_condition][0].append(
+                        adaptation_condition["value_to_compare"] / 100
+                    )
+                    thresholds[variable_key][comparation_condition][1].append(size)
+                size += 1
+            condition_ends.append(size)
+
+    variables = {}
+    for variable_key, variable_thresholds in thresholds.items():
+        variables[variable_key] = {}
+        for comparation_condition, (
+            condition_thresholds,
+            conditions,
+        ) in variable_thresholds.items():
+            order = np.argsort(condition_thresholds, kind="stable")
+            variables[variable_key][comparation_condition] = (
+                np.asarray(condition_thresholds, dtype=float)[order],
+                np.asarray(conditions, dtype=int)[order],
+            )
+    return {
+        "adaptative_events": adaptative_events,
+        "is_and": np.array([is_and for _, is_and, _ in adaptative_events], dtype=bool),
+        "condition_starts": np.asarray(condition_starts, dtype=int),
+        "condition_ends": np.asarray(condition_ends, dtype=int),
+        "size": size,
+        "variables": variables,
+        "knowledge_node_ids": [
+            variable_key
+            for variable_key in variables
+            if variable_key not in LEARNING_STYLE_VARIABLES
+        ],
+        "learning_style_variables": [
+            variable_key
+            for variable_key in variables
+            if variable_key in LEARNING_STYLE_VARIABLES
+        ],
+    }
+
+
+def evaluate_threshold_index(index: dict, variable_values: Mapping) -> np.ndarray:
+    """Function to find the Events of a Threshold Index triggered by the variables of many User Models.
+
+    Args:
+        index (dict): Threshold Index (See compile_threshold_index).
+        variable_values (Mapping): Value of every indexed variable (Node ID or Learning Style
+            variable_to_compare), either a number or an array with one value per User.
+            Missing and NaN variables never meet a Condition.
+
+    Returns:
+        np.ndarray: Boolean matrix (Users x Events) of the triggered Events, in the order of
+        index["adaptative_events"].
+    """
+    values = {}
+    for variable_key in index["variables"]:
+        if variable_values.get(variable_key) is not None:
+            values[variable_key] = np.asarray(
+                variable_values[variable_key], dtype=float
+            )
+    samples = max([value.size for value in values.values()] or [1])
+
+    conditions_met = np.zeros((samples, index["size"]), dtype=bool)
+    for variable_key, value in values.items():
+        value = np.broadcast_to(value, (samples,))
+        # The "gte" Conditions met are a prefix of the sorted thresholds (threshold <= value),
+        # and the "lte" Conditions met are a suffix of them (threshold >= value).
+        # NOTE: NaN values are unknown, so they meet no Condition.
+        known = ~np.isnan(value)
+        condition_thresholds, conditions = index["variables"][variable_key]["gte"]
+        met_prefix = np.where(
+            known, np.searchsorted(condition_thresholds, value, side="right"), 0
+        )
+        conditions_met[:, conditions] = np.arange(conditions.size) < met_prefix[:, None]
+        condition_thresholds, conditions = index["variables"][variable_key]["lte"]
+        met_suffix = np.where(
+            known,
+            np.searchsorted(condition_thresholds, value, side="left"),
+            conditions.size,
+        )
+        conditions_met[:, conditions] = (
+            np.arange(conditions.size) >= met_suffix[:, None]
+        )
+
+    # NOTE: The Conditions of every Event are contiguous, so the Conditions met by every
+    # Event are the difference of the cumulative count at its bounds.
+    cumulative_met = np.zeros((samples, index["size"] + 1), dtype=int)
+    np.cumsum(conditions_met, axis=1, out=cumulative_met[:, 1:])
+    met_count = (
+        cumulative_met[:, index["condition_ends"]]
+        - cumulative_met[:, index["condition_starts"]]
+    )
+    return np.where(
+        index["is_and"],
+        met_count == index["condition_ends"] - index["condition_starts"],
+        met_count > 0,
+    )
+
+
+def _triggered_adaptative_events(
+    compiled_rules: List[Tuple], variables: Mapping
+) -> list:
+    """Function to get the serializable Events triggered by the variables of a User Model."""
+    triggered_event_ids = set(evaluate_adaptation_rules(compiled_rules, variables))
+    return [
+        adaptative_event
+        for event_id, _, _, adaptative_event in compiled_rules
+        if event_id in triggered_event_ids
+    ]
+
+
+def find_triggered_adaptative_events(
+    models: Dict[str, Model], adaptative_object_id: UUID, variables: Mapping
+) -> list:
+    """Function to get the Events of an Adaptative Object triggered by the variables of a User Model.
+
+    NOTE: The Events come from the compiled Rules, so they are serialized without any
+    further Query. Objects without Events never read the variables, so nothing is
+    inferred for them.
+
+    Args:
+        models (Dict[str,Model]): Dictionary containing all models defined in the Database.
+        adaptative_object_id (UUID): ID of the Adaptative Object.
+        variables (Mapping): Value of every variable_to_compare for the User.
+
+    Returns:
+        list: Triggered Adaptative Events (Serializable with AdaptativeEvent_CompleteSchema),
+        ordered by their relative_position.
+    """
+    return _triggered_adaptative_events(
+        adaptation_rules(models, adaptative_object_id), variables
+    )
+
+
+def find_objects_triggered_adaptative_events(
+    models: Dict[str, Model],
+    current_user: Model,
+    adaptative_object_ancestry: Dict[UUID, Tuple[UUID, UUID]],
+) -> Dict[UUID, list]:
+    """Function to get the Events triggered by the current user on many Adaptative Objects.
+
+    The Rules of every Adaptative Object are compiled together into a Threshold Index,
+    and the User Model is estimated at most once, only for the variables the Conditions read.
+
+    Args:
+        models (Dict[str,Model]): Dictionary containing all models defined in the Database.
+        current_user (Model): Current User.
+        adaptative_object_ancestry (Dict[UUID, Tuple[UUID, UUID]]): Topic ID and Template ID
+            (None for Topics) of every Adaptative Object.
+
+    Returns:
+        Dict[UUID, list]: Triggered Adaptative Events (Serializable with AdaptativeEvent_CompleteSchema)
+        of every Adaptative Object, ordered by their relative_position.
+    """
+    return find_scenarios_triggered_adaptative_events(
+        models, current_user, adaptative_object_ancestry
+    )[0]
+
+
+def find_scenarios_triggered_adaptative_events(
+    models: Dict[str, Model],
+    current_user: Model,
+    adaptative_object_ancestry: Dict[UUID, Tuple[UUID, UUID]],
+    knowledge_estimations: List[Mapping] = None,
+) -> List[Dict[UUID, list]]:
+    """Function to get the Events triggered on many Adaptative Objects for several Knowledge scenarios.
+
+    Every scenario is one row of the same Threshold Index evaluation, so scoring many
+    scenarios costs a single pass.
+
+    Args:
+        models (Dict[str,Model]): Dictionary containing all models defined in the Database.
+        current_user (Model): Current User (Whose Learning Styles are used in every scenario).
+        adaptative_object_ancestry (Dict[UUID, Tuple[UUID, UUID]]): Topic ID and Template ID
+            (None for Topics) of every Adaptative Object.
+        knowledge_estimations (List[Mapping]): Estimated Knowledge of every scenario (See
+            KnowledgeEstimation). The Knowledge State of the User if not given.
+
+    Returns:
+        List[Dict[UUID, list]]: Triggered Adaptative Events of every Adaptative Object, for
+        every scenario.
+    """
+    compiled_rules = objects_adaptation_rules(models, adaptative_object_ancestry)
+    index = compile_threshold_index(compiled_rules, adaptative_object_ancestry)
+    scenarios = 1 if knowledge_estimations is None else len(knowledge_estimations)
+
+    # NOTE: Only the variables read by some Condition are estimated.
+    variable_values = {}
+    if index["knowledge_node_ids"]:
+        if knowledge_estimations is None:
+            knowledge_estimations = [
+                user_knowledge_state(models, current_user, index["knowledge_node_ids"])
+            ]
+        for node_id in index["knowledge_node_ids"]:
+            variable_values[node_id] = [
+                knowledge_estimation[node_id].get("expected_knowledge", np.nan)
+                for knowledge_estimation in knowledge_estimations
+            ]
+    if index["learning_style_variables"]:
+        learning_styles_values = learning_style_bayesian_network_constructor(
+            models, current_user
+        )
+        for variable_to_compare in index["learning_style_variables"]:
+            variable_values[variable_to_compare] = learning_styles_values[
+                LEARNING_STYLE_VARIABLES[variable_to_compare]
+            ]
+
+    triggered = np.broadcast_to(
+        evaluate_threshold_index(index, variable_values),
+        (scenarios, len(index["adaptative_events"])),
+    )
+    scenarios_triggered_adaptative_events = []
+    for scenario_triggered in triggered:
+        triggered_adaptative_events = {
+            adaptative_object_id: []
+            for adaptative_object_id in adaptative_object_ancestry
+        }
+        for (adaptative_object_id, _, adaptative_event), event_triggered in zip(
+            index["adaptative_events"], scenario_triggered
+        ):
+            if event_triggered:
+                triggered_adaptative_events[adaptative_object_id].append(
+                    adaptative_event
+                )
+        scenarios_triggered_adaptative_events.append(triggered_adaptative_events)
+    return scenarios_triggered_adaptative_events
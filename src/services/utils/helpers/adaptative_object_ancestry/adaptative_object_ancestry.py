@@ -0,0 +1,380 @@
+# -*- coding: utf-8 -*-
+"""Module containing the Helper Functions to find the Topic and Template of Adaptative Objects.
+
+Every Adaptative Object belongs to exactly one Topic, Template, Page or Test Question.
+Its ancestry is the (Topic ID, Template ID) pair whose Knowledge its Adaptation
+Conditions compare against. The Template ID of the Adaptative Object of a Topic is None.
+
+The ancestry of every Adaptative Object is kept in an in-memory index, rebuilt whenever
+the Domain Version changes, so resolving the context of an object, or the Adaptative
+Objects of a Template or Practice Test, costs no Queries.
+
+Returns:
+    function: Functions for finding the ancestry of Adaptative Objects.
+"""
+
+from threading import Lock
+from typing import Dict, Iterable, Mapping, Optional, Tuple
+from uuid import UUID
+
+from flask_sqlalchemy.model import Model
+from sqlalchemy import null
+from src.services.utils.helpers.version_counter.version_counter import (
+    DOMAIN_VERSION,
+    get_version,
+)
+
+# Models whose instances own an Adaptative Object.
+ADAPTATIVE_OBJECT_OWNERS = ("Topic", "Template", "Page", "TestQuestion")
+
+# Scopes of Adaptative Objects a request can ask for. Exactly one of them must be given.
+ADAPTATIVE_OBJECT_SCOPES = ("template_id", "practice_test_id", "adaptative_object_ids")
+
+# NOTE: The index only holds IDs, never ORM instances.
+_ancestry_index = {"version": None, "index": None}
+_ancestry_index_lock = Lock()
+
+
+class AdaptativeObjectScopeError(ValueError):
+    """Error raised when the requested scope of Adaptative Objects is invalid.
+
+    Args:
+        error (str): Error code returned to the client.
+        message (str): Description of the error.
+    """
+
+    def __init__(self, error: str, message: str):
+        super().__init__(message)
+        self.error = error
+        self.message = message
+
+
+def _ancestry_queries(models: Dict[str, Model]) -> Dict[str, object]:
+    """Function to build the Query of the ancestry of every kind of Adaptative Object.
+
+    Every Query returns (Owner ID, Adaptative Object ID, Topic ID, Template ID) rows and
+    can be filtered further by the caller.
+    """
+    return {
+        "Topic": models["Topic"].query.with_entities(
+            models["Topic"].id,
+            models["Topic"].adaptative_object_id,
+            models["Topic"].id,
+            null().label("template_id"),
+        ),
+        "Template": models["Template"].query.with_entities(
+            models["Template"].id,
+            models["Template"].adaptative_object_id,
+            models["Template"].topic_id,
+            models["Template"].id,
+        ),
+        "Page": models["Page"]
+        .query.join(models["Template"])
+        .with_entities(
+            models["Page"].id,
+            models["Page"].adaptative_object_id,
+            models["Template"].topic_id,
+            models["Template"].id,
+        ),
+        "TestQuestion": models["TestQuestion"]
+        .query.join(models["PracticeTest"])
+        .join(models["Page"])
+        .join(models["Template"])
+        .with_entities(
+            models["TestQuestion"].id,
+            models["TestQuestion"].adaptative_object_id,
+            models["Template"].topic_id,
+            models["Template"].id,
+        ),
+    }
+
+
+def _as_uuid(value) -> Optional[UUID]:
+    """Function to parse an ID coming from a request. None if it is not a valid UUID."""
+    if isinstance(value, UUID):
+        return value
+    try:
+        return UUID(str(value))
+    except ValueError:
+        return None
+
+
+def build_ancestry_index(models: Dict[str, Model]) -> Dict[str, dict]:
+    """Function to build the ancestry index of every Adaptative Object.
+
+    Args:
+        models (Dict[str,Model]): Dictionary containing all models defined in the Database.
+
+    Returns:
+        Dict[str, dict]: The ancestry of every Adaptative Object under "AdaptativeObject",
+            the (Adaptative Object ID, Topic ID, Template ID) of every owner under the
+            name of its Model, and the ancestry of the Adaptative Objects contained in
+            every Template and related to every Practice Test under "TemplateObjects"
+            and "PracticeTestObjects".
+    """
+    index = {"AdaptativeObject": {}}
+    for model_name, query in _ancestry_queries(models).items():
+        index[model_name] = {}
+        for owner_id, adaptative_object_id, topic_id, template_id in query.all():
+            index[model_name][owner_id] = (adaptative_object_id, topic_id, template_id)
+            index["AdaptativeObject"][adaptative_object_id] = (topic_id, template_id)
+
+    # NOTE: Objects created while the index is built may miss their parents, and they
+    # are skipped until the index is rebuilt for the next Domain Version.
+    # Every Template contains its Topic, itself, its Pages and their Test Questions.
+    index["TemplateObjects"] = {}
+    for template_id, (adaptative_object_id, topic_id, _) in index["Template"].items():
+        if topic_id in index["Topic"]:
+            index["TemplateObjects"][template_id] = {
+                index["Topic"][topic_id][0]: (topic_id, None),
+                adaptative_object_id: (topic_id, template_id),
+            }
+    for model_name in ("Page", "TestQuestion"):
+        for adaptative_object_id, topic_id, template_id in index[model_name].values():
+            if template_id in index["TemplateObjects"]:
+                index["TemplateObjects"][template_id][adaptative_object_id] = (
+                    topic_id,
+                    template_id,
+                )
+
+    # Every Practice Test is related to the Topic, Template and Page of its Page, and
+    # to its Test Questions.
+    index["PracticeTestObjects"] = {}
+    for practice_test_id, page_id in models["PracticeTest"].query.with_entities(
+        models["PracticeTest"].id, models["PracticeTest"].page_id
+    ):
+        template_objects = index["TemplateObjects"].get(
+            index["Page"].get(page_id, (None, None, None))[2]
+        )
+        if template_objects is not None:
+            page_adaptative_object_id, topic_id, template_id = index["Page"][page_id]
+            index["PracticeTestObjects"][practice_test_id] = {
+                index["Topic"][topic_id][0]: (topic_id, None),
+                index["Template"][template_id][0]: (topic_id, template_id),
+                page_adaptative_object_id: (topic_id, template_id),
+            }
+    for test_question_id, practice_test_id in models[
+        "TestQuestion"
+    ].query.with_entities(
+        models["TestQuestion"].id, models["TestQuestion"].practice_test_id
+    ):
+        if (
+            test_question_id in index["TestQuestion"]
+            and practice_test_id in index["PracticeTestObjects"]
+        ):
+            adaptative_object_id, topic_id, template_id = index["TestQuestion"][
+                test_question_id
+            ]
+            index["PracticeTestObjects"][practice_test_id][adaptative_object_id] = (
+                topic_id,
+                template_id,
+            )
+    return index
+
+
+def ancestry_index(models: Dict[str, Model], version: int = None) -> Dict[str, dict]:
+    """Function to get the ancestry index, rebuilding it if the Domain Model changed.
+
+    Args:
+        models (Dict[str,Model]): Dictionary containing all models defined in the Database.
+        version (int): Domain Version already read by the caller. Read from the Database if not given.
+
+    Returns:
+        Dict[str, dict]: Ancestry index (See build_ancestry_index).
+    """
+    if version is None:
+        version = get_version(models, DOMAIN_VERSION)
+    with _ancestry_index_lock:
+        if _ancestry_index["version"] == version:
+            return _ancestry_index["index"]
+
+    # NOTE: The index is built outside of the lock. If the Domain Model changes meanwhile,
+    # the next request will see a newer version and build it again.
+    index = build_ancestry_index(models)
+    with _ancestry_index_lock:
+        _ancestry_index["version"] = version
+        _ancestry_index["index"] = index
+    return index
+
+
+def find_object_context(
+    models: Dict[str, Model], model_name: str, owner_id, version: int = None
+) -> Optional[Tuple[UUID, UUID, UUID]]:
+    """Function to find the Adaptative Object, Topic and Template of a Topic, Template, Page or Test Question.
+
+    Args:
+        models (Dict[str,Model]): Dictionary containing all models defined in the Database.
+        model_name (str): Name of the Model of the owner. One of ADAPTATIVE_OBJECT_OWNERS.
+        owner_id (UUID | str): ID of the owner.
+        version (int): Domain Version already read by the caller. Read from the Database if not given.
+
+    Returns:
+        Optional[Tuple[UUID, UUID, UUID]]: (Adaptative Object ID, Topic ID, Template ID),
+            or None if the owner does not exist.
+    """
+    owner_id = _as_uuid(owner_id)
+    if owner_id is None:
+        return None
+    return ancestry_index(models, version)[model_name].get(owner_id)
+
+
+def adaptative_object_ancestry(
+    models: Dict[str, Model], adaptative_object_ids: Iterable[UUID], version: int = None
+) -> Dict[UUID, Tuple[UUID, UUID]]:
+    """Function to find the Topic and Template of many Adaptative Objects.
+
+    Args:
+        models (Dict[str,Model]): Dictionary containing all models defined in the Database.
+        adaptative_object_ids (Iterable[UUID | str]): IDs of the Adaptative Objects.
+        version (int): Domain Version already read by the caller. Read from the Database if not given.
+
+    Returns:
+        Dict[UUID, Tuple[UUID, UUID]]: (Topic ID, Template ID) of every Adaptative Object found.
+    """
+    adaptative_object_ids = [
+        _as_uuid(adaptative_object_id) for adaptative_object_id in adaptative_object_ids
+    ]
+    if not adaptative_object_ids:
+        return {}
+    index = ancestry_index(models, version)["AdaptativeObject"]
+    return {
+        adaptative_object_id: index[adaptative_object_id]
+        for adaptative_object_id in adaptative_object_ids
+        if adaptative_object_id in index
+    }
+
+
+def knowledge_nodes_ancestry(
+    models: Dict[str, Model], knowledge_node_ids: Iterable[UUID], version: int = None
+) -> Dict[UUID, Tuple[UUID, UUID]]:
+    """Function to find the Adaptative Objects whose Conditions may read the Knowledge of some nodes.
+
+    Args:
+        models (Dict[str,Model]): Dictionary containing all models defined in the Database.
+        knowledge_node_ids (Iterable[UUID]): IDs of the Topics and Templates.
+        version (int): Domain Version already read by the caller. Read from the Database if not given.
+
+    Returns:
+        Dict[UUID, Tuple[UUID, UUID]]: (Topic ID, Template ID) of every Adaptative Object
+        whose Topic or Template is one of the nodes.
+    """
+    knowledge_node_ids = set(knowledge_node_ids)
+    if not knowledge_node_ids:
+        return {}
+    return {
+        adaptative_object_id: (topic_id, template_id)
+        for adaptative_object_id, (topic_id, template_id) in ancestry_index(
+            models, version
+        )["AdaptativeObject"].items()
+        if topic_id in knowledge_node_ids or template_id in knowledge_node_ids
+    }
+
+
+def template_ancestry(
+    models: Dict[str, Model], template_id, version: int = None
+) -> Dict[UUID, Tuple[UUID, UUID]]:
+    """Function to find the ancestry of every Adaptative Object contained in a Template.
+
+    The Topic of the Template, the Template itself, its Pages and the Test Questions of
+    its Practice Tests are included.
+
+    Args:
+        models (Dict[str,Model]): Dictionary containing all models defined in the Database.
+        template_id (UUID | str): ID of the Template.
+        version (int): Domain Version already read by the caller. Read from the Database if not given.
+
+    Returns:
+        Dict[UUID, Tuple[UUID, UUID]]: (Topic ID, Template ID) of every Adaptative Object,
+            empty if the Template does not exist.
+    """
+    return dict(
+        ancestry_index(models, version)["TemplateObjects"].get(
+            _as_uuid(template_id), {}
+        )
+    )
+
+
+def practice_test_ancestry(
+    models: Dict[str, Model], practice_test_id, version: int = None
+) -> Dict[UUID, Tuple[UUID, UUID]]:
+    """Function to find the ancestry of every Adaptative Object related to a Practice Test.
+
+    The Topic, Template and Page of the Practice Test and its Test Questions are included.
+
+    Args:
+        models (Dict[str,Model]): Dictionary containing all models defined in the Database.
+        practice_test_id (UUID | str): ID of the Practice Test.
+        version (int): Domain Version already read by the caller. Read from the Database if not given.
+
+    Returns:
+        Dict[UUID, Tuple[UUID, UUID]]: (Topic ID, Template ID) of every Adaptative Object,
+            empty if the Practice Test does not exist.
+    """
+    return dict(
+        ancestry_index(models, version)["PracticeTestObjects"].get(
+            _as_uuid(practice_test_id), {}
+        )
+    )
+
+
+def scope_ancestry(
+    models: Dict[str, Model], scope: Mapping, version: int = None
+) -> Dict[UUID, Tuple[UUID, UUID]]:
+    """Function to find the ancestry of every Adaptative Object in the scope of a request.
+
+    The scope contains exactly one of:
+        template_id (str): Every Topic, Template, Page & Test Question of the Template.
+        practice_test_id (str): The Topic, Template & Page of the Practice Test and its Test Questions.
+        adaptative_object_ids (List[str]): The listed Adaptative Objects.
+
+    Args:
+        models (Dict[str,Model]): Dictionary containing all models defined in the Database.
+        scope (Mapping): Request body or args with the scope.
+        version (int): Domain Version already read by the caller. Read from the Database if not given.
+
+    Raises:
+        AdaptativeObjectScopeError: If the scope is invalid, or its Template or Practice Test does not exist.
+
+    Returns:
+        Dict[UUID, Tuple[UUID, UUID]]: (Topic ID, Template ID) of every Adaptative Object.
+    """
+    scopes = [
+        scope_name
+        for scope_name in ADAPTATIVE_OBJECT_SCOPES
+        if scope.get(scope_name) is not None
+    ]
+    if len(scopes) != 1:
+        raise AdaptativeObjectScopeError(
+            "INVALID_SCOPE",
+            "Exactly one of template_id, practice_test_id or adaptative_object_ids is required",
+        )
+
+    if scopes[0] == "template_id":
+        ancestry = template_ancestry(models, scope["template_id"], version)
+        if not ancestry:
+            raise AdaptativeObjectScopeError("TEMPLATE_NOT_FOUND", "Template not found")
+        return ancestry
+    if scopes[0] == "practice_test_id":
+        ancestry = practice_test_ancestry(models, scope["practice_test_id"], version)
+        if not ancestry:
+            raise AdaptativeObjectScopeError(
+                "PRACTICE_TEST_NOT_FOUND", "Practice Test not found"
+            )
+        return ancestry
+
+    adaptative_object_ids = scope["adaptative_object_ids"]
+    try:
+        if not isinstance(adaptative_object_ids, list) or not all(
+            isinstance(adaptative_object_id, str)
+            for adaptative_object_id in adaptative_object_ids
+        ):
+            raise TypeError("adaptative_object_ids must be a list of strings")
+        adaptative_object_ids = [
+            UUID(adaptative_object_id) for adaptative_object_id in adaptative_object_ids
+        ]
+    except (TypeError, ValueError) as error:
+        raise AdaptativeObjectScopeError(
+            "INVALID_ADAPTATIVE_OBJECT_IDS",
+            "adaptative_object_ids must be a list of UUIDs",
+        ) from error
+    return adaptative_object_ancestry(models, adaptative_object_ids, version)
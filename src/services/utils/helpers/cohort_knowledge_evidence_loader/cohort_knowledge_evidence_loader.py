@@ -0,0 +1,67 @@
+# -*- coding: utf-8 -*-
+"""Module containing the Helper Function to load the Knowledge Evidence observed for many Users.
+
+Returns:
+    function: Function for loading the Knowledge Evidence of a group of Users.
+"""
+
+from typing import Dict, Iterable, Set
+from uuid import UUID
+
+from flask_sqlalchemy.model import Model
+
+
+def cohort_knowledge_evidence_loader(
+    models: Dict[str, Model], user_ids: Iterable[UUID]
+) -> Dict[UUID, Dict[str, Set[UUID]]]:
+    """Function to load the Knowledge Evidence of a group of Users in a fixed number of Queries.
+
+    Args:
+        models (Dict[str,Model]): Dictionary containing all models defined in the Database.
+        user_ids (Iterable[UUID]): IDs of the Users.
+
+    Returns:
+        Dict[UUID, Dict[str, Set[UUID]]]: Dictionary from User ID to the same Evidence
+        returned by knowledge_evidence_loader for that User.
+    """
+    user_ids = list(user_ids)
+    knowledge_evidence = {
+        user_id: {"passed_practice_tests": set(), "fired_interactions": set()}
+        for user_id in user_ids
+    }
+
+    # Get the Pages of all of the Practice Tests the users have passed.
+    # NOTE: A Practice Test is passed only if the acquired score reaches the approval score.
+    passed_practice_tests = (
+        models["PracticeTest"]
+        .query.join(models["TestAttempt"])
+        .filter(
+            models["TestAttempt"].user_id.in_(user_ids),
+            models["TestAttempt"].acquired_score
+            >= models["PracticeTest"].approval_score,
+        )
+        .with_entities(models["TestAttempt"].user_id, models["PracticeTest"].page_id)
+        .all()
+    )
+    for user_id, page_id in passed_practice_tests:
+        knowledge_evidence[user_id]["passed_practice_tests"].add(page_id)
+
+    # Get all of the Measurable Interactions fired by the users.
+    # NOTE: We filter the Measurable Interactions so that we only get
+    # the ones that are not related to learning styles.
+    fired_interactions = (
+        models["MeasurableInteraction"]
+        .query.join(models["InteractionFired"])
+        .filter(
+            models["InteractionFired"].user_id.in_(user_ids),
+            models["MeasurableInteraction"].learning_style_attribute.is_(None),
+        )
+        .with_entities(
+            models["InteractionFired"].user_id, models["MeasurableInteraction"].id
+        )
+        .all()
+    )
+    for user_id, interaction_id in fired_interactions:
+        knowledge_evidence[user_id]["fired_interactions"].add(interaction_id)
+
+    return knowledge_evidence
@@ -0,0 +1,73 @@
+# -*- coding: utf-8 -*-
+"""Module containing the Helper Function to estimate the Knowledge of a whole cohort of Users.
+
+The Evidence of every User is loaded as one Users x Evidence matrix and the Leaky OR Model
+is propagated for all of them at once, so that the cost of a cohort does not grow with
+one query and one network evaluation per User.
+
+Returns:
+    function: Function for estimating the Knowledge of a group of Users.
+"""
+
+from typing import Dict, Iterable
+from uuid import UUID
+
+import numpy as np
+from flask_sqlalchemy.model import Model
+from src.services.utils.helpers.cohort_knowledge_evidence_loader.cohort_knowledge_evidence_loader import (
+    cohort_knowledge_evidence_loader,
+)
+from src.services.utils.helpers.domain_knowledge_graph.domain_knowledge_graph import (
+    domain_knowledge_graph,
+)
+from src.services.utils.helpers.knowledge_inference_engine.knowledge_inference_engine import (
+    compiled_knowledge_inference_engine,
+    evaluate_knowledge_inference_engine_batch,
+    knowledge_evidence_matrix,
+)
+
+
+def cohort_knowledge_inference(
+    models: Dict[str, Model], user_ids: Iterable[UUID]
+) -> dict:
+    """Function to estimate the Knowledge of a group of Users in a single batched pass.
+
+    Args:
+        models (Dict[str,Model]): Dictionary containing all models defined in the Database.
+        user_ids (Iterable[UUID]): IDs of the Users.
+
+    Returns:
+        dict: Dictionary containing the User IDs (Rows), the Topic and Template IDs and
+        Entity Types (Columns), and the expected_knowledge and evidence_observed matrices.
+        NOTE: Topics inside a cycle have no estimation and are not included.
+    """
+    user_ids = list(user_ids)
+    inference_engine = compiled_knowledge_inference_engine(
+        domain_knowledge_graph(models)
+    )
+    knowledge_evidence = cohort_knowledge_evidence_loader(models, user_ids)
+
+    evidence_observed = knowledge_evidence_matrix(
+        inference_engine,
+        [
+            knowledge_evidence[user_id]["passed_practice_tests"]
+            | knowledge_evidence[user_id]["fired_interactions"]
+            for user_id in user_ids
+        ],
+    )
+    expected_knowledge = evaluate_knowledge_inference_engine_batch(
+        inference_engine, evidence_observed
+    )
+
+    estimated_nodes = np.flatnonzero(
+        inference_engine["latent"] & (inference_engine["node_levels"] > 0)
+    )
+    return {
+        "user_ids": user_ids,
+        "node_ids": [inference_engine["node_ids"][index] for index in estimated_nodes],
+        "entity_types": [
+            inference_engine["entity_types"][index] for index in estimated_nodes
+        ],
+        "expected_knowledge": expected_knowledge[:, estimated_nodes],
+        "evidence_observed": evidence_observed[:, estimated_nodes],
+    }
@@ -0,0 +1,188 @@
+# -*- coding: utf-8 -*-
+"""Module containing the Helper Functions to answer Conditional Requests (ETag / If-None-Match).
+
+The ETag of a response is a digest of everything its body depends on: the request
+itself and the Version Counters of the data it serializes. A client that sends back
+the ETag it already has in If-None-Match gets a 304 without a body, and the server
+skips the inference and serialization work for it. The responses serializing Models
+whose Content Version is not tracked get the digest of their serialized rows instead,
+so they still save the body, but not the work.
+
+Returns:
+    function: Functions for computing ETags and answering Conditional Requests.
+"""
+
+import hashlib
+import json
+from typing import Any, Dict, List, Optional
+
+from flask import request
+from flask_marshmallow.schema import Schema
+from flask_sqlalchemy.model import Model
+from marshmallow import fields
+from sqlalchemy import select
+from werkzeug.http import quote_etag
+from src.services.utils.helpers.version_counter.version_counter import (
+    UNTRACKED_CONTENT_MODELS,
+    get_content_counter_name,
+)
+
+
+def compute_etag(*parts) -> str:
+    """Function to compute a strong ETag from the values a response depends on.
+
+    Args:
+        *parts: Values the response depends on. They are compared by their string form.
+
+    Returns:
+        str: Unquoted ETag.
+    """
+    return hashlib.sha1(
+        "\x1f".join(str(part) for part in parts).encode("utf-8")
+    ).hexdigest()
+
+
+def is_not_modified(etag: str) -> bool:
+    """Function to check if the client of the current request already has the response.
+
+    Args:
+        etag (str): Unquoted ETag of the response.
+
+    Returns:
+        bool: True if the ETag matches the If-None-Match header of the request.
+    """
+    return request.if_none_match.contains(etag)
+
+
+def etag_headers(etag: str) -> Dict[str, str]:
+    """Function to get the headers carrying the ETag of a response.
+
+    Args:
+        etag (str): Unquoted ETag of the response.
+
+    Returns:
+        Dict[str, str]: Response headers.
+    """
+    return {"ETag": quote_etag(etag)}
+
+
+def not_modified_response(etag: str) -> tuple:
+    """Function to get the response for a client that already has the current response.
+
+    Args:
+        etag (str): Unquoted ETag of the response.
+
+    Returns:
+        tuple: Empty body, 304 status and ETag headers.
+    """
+    return "", 304, etag_headers(etag)
+
+
+def schema_model_names(schema: Schema) -> List[str]:
+    """Function to find the Models serialized by a Schema, including its Nested Schemas.
+
+    Args:
+        schema (Schema): Schema class or instance.
+
+    Returns:
+        List[str]: Sorted names of the Models.
+    """
+    model_names = set()
+    visited_schemas = set()
+    pending_schemas = [schema]
+    while pending_schemas:
+        schema_class = pending_schemas.pop()
+        if not isinstance(schema_class, type):
+            schema_class = type(schema_class)
+        if schema_class in visited_schemas:
+            continue
+        visited_schemas.add(schema_class)
+        model = getattr(schema_class.opts, "model", None)
+        if model is not None:
+            model_names.add(model.__name__)
+        pending_schemas.extend(
+            field.nested
+            for field in schema_class._declared_fields.values()
+            if isinstance(field, fields.Nested) and not isinstance(field.nested, str)
+        )
+    return sorted(model_names)
+
+
+def get_content_versions(model: Model, model_names: List[str]) -> Dict[str, int]:
+    """Function to read the Content Versions of several Models in a single Query.
+
+    NOTE: The generic controllers only have access to their Model, so the Version
+    Counter table is read through its metadata.
+
+    Args:
+        model (Model): Any Model of the Database.
+        model_names (List[str]): Names of the Models.
+
+    Returns:
+        Dict[str, int]: Content Version of every Model. 0 if it was never bumped.
+    """
+    version_counter_table = model.metadata.tables["version_counter"]
+    counter_names = {
+        get_content_counter_name(model_name): model_name for model_name in model_names
+    }
+    counters = dict(
+        model.query.session.execute(
+            select(
+                version_counter_table.c.counter_name,
+                version_counter_table.c.counter_value,
+            ).where(version_counter_table.c.counter_name.in_(list(counter_names)))
+        ).all()
+    )
+    return {
+        model_name: counters.get(counter_name, 0)
+        for counter_name, model_name in counter_names.items()
+    }
+
+
+def content_etag(model: Model, schema: Schema, *parts) -> Optional[str]:
+    """Function to compute the ETag of a response serializing instances of a Model.
+
+    The ETag changes whenever any of the Models the Schema serializes changes.
+
+    Args:
+        model (Model): Model of the serialized instances.
+        schema (Schema): Schema of the response.
+        *parts: Request values the response depends on (e.g. the ID or the sort key).
+
+    Returns:
+        Optional[str]: Unquoted ETag. None if the Schema serializes a Model whose
+        Content Version is not tracked (See serialized_etag).
+    """
+    model_names = sorted({model.__name__, *schema_model_names(schema)})
+    if not UNTRACKED_CONTENT_MODELS.isdisjoint(model_names):
+        return None
+    content_versions = get_content_versions(model, model_names)
+    return compute_etag(
+        model.__name__,
+        schema.__name__,
+        *parts,
+        *(f"{name}={content_versions[name]}" for name in model_names),
+    )
+
+
+def serialized_etag(model: Model, schema: Schema, serialized: Any, *parts) -> str:
+    """Function to compute the ETag of a response from the rows it serializes.
+
+    NOTE: Used when the Content Versions cannot tell whether the response changed, so
+    the rows are read and serialized before the ETag is known.
+
+    Args:
+        model (Model): Model of the serialized instances.
+        schema (Schema): Schema of the response.
+        serialized (Any): Serialized instances of the response.
+        *parts: Request values the response depends on (e.g. the ID or the sort key).
+
+    Returns:
+        str: Unquoted ETag.
+    """
+    return compute_etag(
+        model.__name__,
+        schema.__name__,
+        *parts,
+        json.dumps(serialized, sort_keys=True, default=str),
+    )
@@ -0,0 +1,264 @@
+# -*- coding: utf-8 -*-
+"""Module containing the Helper Function to load the Domain Knowledge Graph.
+
+The Domain Knowledge Graph is the user independent part of the Knowledge Bayesian Network
+(Topics, Templates, Practice Tests, Measurable Interactions and the Relations between them).
+It is cached per process and rebuilt only when the Domain Version Counter changes.
+
+Returns:
+    function: Function for loading the cached Domain Knowledge Graph.
+"""
+
+from collections import deque
+from threading import Lock
+from typing import Dict, Iterable, List, Tuple
+
+from easygraph.classes.directed_graph import DiGraph
+from flask_sqlalchemy.model import Model
+from src.services.utils.helpers.version_counter.version_counter import (
+    DOMAIN_VERSION,
+    get_version,
+)
+
+# NOTE: The cache only holds plain data (IDs, Weights and Parameters) and never ORM
+# instances, because those get detached from the session that loaded them.
+_domain_knowledge_graph_cache = {"version": None, "domain_knowledge_graph": None}
+_domain_knowledge_graph_lock = Lock()
+
+
+def topic_precedence_layers(
+    topic_ids: Iterable, precedences: Iterable[Tuple]
+) -> List[List]:
+    """Function to group the Topics by their layer in the Topic Precedence DAG.
+
+    The first layer holds the Topics without Predecessors and every other Topic is one
+    layer above its deepest Predecessor, so reading the layers in order is a valid
+    topological order (Kahn's Algorithm).
+
+    NOTE: Topics inside a cycle (Or after one) are never reachable and are left out.
+
+    Args:
+        topic_ids (Iterable): IDs of all of the Topics.
+        precedences (Iterable[Tuple]): (predecessor_id, successor_id) pairs of the Relations.
+
+    Returns:
+        List[List]: Topic IDs of every layer.
+    """
+    successors = {topic_id: [] for topic_id in topic_ids}
+    pending_predecessors = dict.fromkeys(successors, 0)
+    for predecessor_id, successor_id in precedences:
+        successors[predecessor_id].append(successor_id)
+        pending_predecessors[successor_id] += 1
+
+    topic_layers = {
+        topic_id: 0 for topic_id, pending in pending_predecessors.items() if not pending
+    }
+    topics_to_visit = deque(topic_layers)
+    layers = []
+    while topics_to_visit:
+        topic_id = topics_to_visit.popleft()
+        layer = topic_layers[topic_id]
+        if layer == len(layers):
+            layers.append([])
+        layers[layer].append(topic_id)
+        for successor_id in successors[topic_id]:
+            pending_predecessors[successor_id] -= 1
+            if not pending_predecessors[successor_id]:
+                topic_layers[successor_id] = layer + 1
+                topics_to_visit.append(successor_id)
+    return layers
+
+
+def build_domain_knowledge_graph(models: Dict[str, Model]) -> dict:
+    """Function to build the Domain Knowledge Graph from the Database.
+
+    Args:
+        models (Dict[str,Model]): Dictionary containing all models defined in the Database.
+
+    Returns:
+        dict: Dictionary containing the Network (Without any Evidence observed), its Edge
+        Weights, the Topic and Template IDs, the IDs of the Root Topics and the layers
+        of the Topic Precedence DAG.
+    """
+    # Get all of the Domain Model Topics.
+    domain_model_topics = models["Topic"].query.all()
+
+    # Get all of the Topic Precedence Relations.
+    topic_precedence_relations = models["TopicPrecedence"].query.all()
+
+    # Construct a Directed Graph of the Topics.
+    network = DiGraph()
+
+    # Create an Auxiliary Dictionary to store the Edges.
+    edges = {}
+    # Add all of the Topics as Nodes.
+    for topic in domain_model_topics:
+        network.add_node(
+            topic.id,
+            **{
+                "default_knowledge": topic.default_knowledge,
+                "leak_parameter": topic.leak_parameter / 100,
+                "entity_type": "topic",
+            }
+        )
+
+    # Add all of the Topic Precedence Relations as Edges.
+    # NOTE: We add the Edges in the Reverse Direction to the Graph.
+    # Because in a Bayesian Network of Knowdlege, the Successor is the Cause and the
+    # Predecessor is the logical Effect.
+    for relation in topic_precedence_relations:
+        network.add_edge(
+            relation.predecessor_id,
+            relation.successor_id,
+            **{
+                "knowledge_weight": relation.knowledge_weight,
+            }
+        )
+        edges[
+            (relation.predecessor_id, relation.successor_id)
+        ] = relation.knowledge_weight
+
+    # Get all of the Templates.
+    templates = models["Template"].query.all()
+
+    # Add all of the Templates as Nodes and all Template -> Topic Relationships.
+    for template in templates:
+        network.add_node(
+            template.id,
+            **{
+                "default_knowledge": template.default_knowledge,
+                "leak_parameter": template.leak_parameter / 100,
+                "entity_type": "template",
+            }
+        )
+        network.add_edge(
+            template.id,
+            template.topic_id,
+            **{
+                "knowledge_weight": template.knowledge_weight,
+            }
+        )
+        edges[(template.id, template.topic_id)] = template.knowledge_weight
+
+    # Get all of the Practice Tests alongside their Page and Template.
+    practice_tests = (
+        models["PracticeTest"]
+        .query.join(models["Page"])
+        .with_entities(
+            models["Page"].id,
+            models["Page"].template_id,
+            models["PracticeTest"].adaptation_weight,
+        )
+        .all()
+    )
+
+    # Add all of the Practice Tests as Nodes and all Practice Test -> Template Relationships.
+    # NOTE: No evidence is observed in the Domain Knowledge Graph.
+    for page_id, template_id, adaptation_weight in practice_tests:
+        network.add_node(
+            page_id,
+            **{
+                "evidence_observed": False,
+                "entity_type": "practice_test",
+            }
+        )
+        network.add_edge(
+            page_id,
+            template_id,
+            **{
+                "knowledge_weight": adaptation_weight,
+            }
+        )
+        edges[(page_id, template_id)] = adaptation_weight
+
+    # Get all of the Measurable Interactions alongside the Template of their Learning Content.
+    measurable_interactions = (
+        models["MeasurableInteraction"]
+        .query.join(models["LearningContent"])
+        .join(models["Page"])
+        .with_entities(
+            models["MeasurableInteraction"].id,
+            models["MeasurableInteraction"].interaction_weight,
+            models["Page"].template_id,
+        )
+        .all()
+    )
+
+    # Add all of the Measurable Interactions as Nodes and all Interaction -> Template Relationships.
+    for interaction_id, interaction_weight, template_id in measurable_interactions:
+        network.add_node(
+            interaction_id,
+            **{
+                "evidence_observed": False,
+                "entity_type": "interaction",
+            }
+        )
+        network.add_edge(
+            interaction_id,
+            template_id,
+            **{
+                "knowledge_weight": interaction_weight,
+            }
+        )
+        edges[(interaction_id, template_id)] = interaction_weight
+
+    # We get the Topics that have no Predecessors from the already loaded Relations.
+    topics_with_predecessors = {
+        relation.successor_id for relation in topic_precedence_relations
+    }
+
+    # NOTE: The layers are computed once per Domain Version, so that the Topics can be
+    # estimated in a single sweep without looking for ready Successors.
+    topic_layers = topic_precedence_layers(
+        [topic.id for topic in domain_model_topics],
+        [
+            (relation.predecessor_id, relation.successor_id)
+            for relation in topic_precedence_relations
+        ],
+    )
+
+    return {
+        "network": network,
+        "edges": edges,
+        "topic_ids": [topic.id for topic in domain_model_topics],
+        "template_ids": [template.id for template in templates],
+        "root_topic_ids": [
+            topic.id
+            for topic in domain_model_topics
+            if topic.id not in topics_with_predecessors
+        ],
+        "topic_layers": topic_layers,
+        "topic_order": [topic_id for layer in topic_layers for topic_id in layer],
+    }
+
+
+def domain_knowledge_graph(models: Dict[str, Model], version: int = None) -> dict:
+    """Function to get the Domain Knowledge Graph, rebuilding it only if the Domain changed.
+
+    NOTE: The returned Graph is shared between requests and must not be modified.
+    Copy the network before setting any evidence on it.
+
+    Args:
+        models (Dict[str,Model]): Dictionary containing all models defined in the Database.
+        version (int): Domain Version already read by the caller. Read from the Database if not given.
+
+    Returns:
+        dict: Dictionary containing the Domain Knowledge Graph.
+    """
+    # NOTE: We read the version before loading the Domain. If the Domain changes while
+    # the Graph is being built, the next request will see a newer version and rebuild it.
+    if version is None:
+        version = get_version(models, DOMAIN_VERSION)
+    with _domain_knowledge_graph_lock:
+        if _domain_knowledge_graph_cache["version"] == version:
+            return _domain_knowledge_graph_cache["domain_knowledge_graph"]
+
+    new_domain_knowledge_graph = build_domain_knowledge_graph(models)
+    new_domain_knowledge_graph["version"] = version
+
+    with _domain_knowledge_graph_lock:
+        _domain_knowledge_graph_cache["version"] = version
+        _domain_knowledge_graph_cache[
+            "domain_knowledge_graph"
+        ] = new_domain_knowledge_graph
+    return new_domain_knowledge_graph
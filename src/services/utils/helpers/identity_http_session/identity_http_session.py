@@ -0,0 +1,148 @@
+# -*- coding: utf-8 -*-
+"""Module containing the shared HTTP Session used for the Google Identity calls.
+
+Every worker process keeps one pooled, keep-alive Session, so that logins, token
+refreshes and the fetching of the Firebase public keys reuse their TCP and TLS
+connections. Requests have a timeout and failed connections or unavailable
+responses are retried with an exponential backoff (POSTs only when the API did not
+handle them). The Base URLs of the Identity
+Toolkit and Secure Token APIs are read from the environment, so that a local
+stand-in server can be used instead.
+
+Returns:
+    function: Functions for making requests to the Google Identity APIs.
+"""
+
+from os import environ, getpid
+from threading import Lock
+
+import requests
+from google.auth.transport.requests import Request
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# Default Base URLs of the Google Identity APIs.
+IDENTITY_TOOLKIT_BASE_URL = "https://identitytoolkit.googleapis.com"
+SECURE_TOKEN_BASE_URL = "https://securetoken.googleapis.com"
+
+# Connect and read timeouts (In seconds) of every request.
+REQUEST_TIMEOUT = (3.05, 10)
+
+# Number of hosts whose connections are pooled, and connections kept per host.
+POOL_CONNECTIONS = 4
+POOL_MAXSIZE = 16
+
+# Statuses of the responses to a POST that mean the API did not handle the request.
+# NOTE: A 502 or 504 may be sent after the API handled it, so those POSTs are not
+# retried, and the password changes and sign ups are never applied twice.
+UNPROCESSED_POST_STATUSES = frozenset({429, 503})
+
+
+class IdentityRetry(Retry):
+    """Retry policy that only retries the POSTs the API did not handle."""
+
+    def is_retry(
+        self, method: str, status_code: int, has_retry_after: bool = False
+    ) -> bool:
+        if method.upper() == "POST" and status_code not in UNPROCESSED_POST_STATUSES:
+            return False
+        return super().is_retry(method, status_code, has_retry_after)
+
+
+# NOTE: Only failures that happen before the API handles the request are retried.
+RETRY = IdentityRetry(
+    total=3,
+    connect=3,
+    read=0,
+    status=2,
+    backoff_factor=0.2,
+    status_forcelist=(429, 502, 503, 504),
+    allowed_methods=frozenset({"GET", "POST"}),
+    raise_on_status=False,
+)
+
+_http_session = {"pid": None, "session": None}
+_http_session_lock = Lock()
+
+
+def create_http_session() -> requests.Session:
+    """Function to create a pooled, keep-alive Session that retries with backoff.
+
+    Returns:
+        requests.Session: New Session.
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=POOL_CONNECTIONS,
+        pool_maxsize=POOL_MAXSIZE,
+        max_retries=RETRY,
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+def get_http_session() -> requests.Session:
+    """Function to get the Session shared by the current worker process.
+
+    Returns:
+        requests.Session: Shared Session.
+    """
+    # NOTE: uWSGI forks its workers after loading the app, and pooled connections
+    # must not be shared between processes.
+    with _http_session_lock:
+        if _http_session["pid"] != getpid():
+            _http_session["session"] = create_http_session()
+            _http_session["pid"] = getpid()
+        return _http_session["session"]
+
+
+def get_transport_request() -> Request:
+    """Function to get a google.auth transport that uses the shared Session.
+
+    Returns:
+        Request: google.auth transport.
+    """
+    return Request(session=get_http_session())
+
+
+def identity_toolkit_url(path: str) -> str:
+    """Function to build the URL of an Identity Toolkit endpoint.
+
+    Args:
+        path (str): Path of the endpoint (E.g. accounts:signInWithPassword).
+
+    Returns:
+        str: URL of the endpoint.
+    """
+    base_url = environ.get("IDENTITY_TOOLKIT_BASE_URL", IDENTITY_TOOLKIT_BASE_URL)
+    return f"{base_url.rstrip('/')}/v1/{path}"
+
+
+def secure_token_url(path: str) -> str:
+    """Function to build the URL of a Secure Token endpoint.
+
+    Args:
+        path (str): Path of the endpoint (E.g. token).
+
+    Returns:
+        str: URL of the endpoint.
+    """
+    base_url = environ.get("SECURE_TOKEN_BASE_URL", SECURE_TOKEN_BASE_URL)
+    return f"{base_url.rstrip('/')}/v1/{path}"
+
+
+def identity_post(url: str, **kwargs) -> requests.Response:
+    """Function to make a POST request to a Google Identity API with the shared Session.
+
+    Args:
+        url (str): URL of the endpoint.
+        **kwargs: Arguments of requests.Session.post. The Google API Key is sent as
+            the key query param.
+
+    Returns:
+        requests.Response: Response of the API.
+    """
+    kwargs.setdefault("timeout", REQUEST_TIMEOUT)
+    params = {"key": environ.get("GOOGLE_API_KEY"), **kwargs.pop("params", {})}
+    return get_http_session().post(url, params=params, **kwargs)
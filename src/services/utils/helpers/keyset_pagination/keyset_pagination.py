@@ -0,0 +1,280 @@
+# -*- coding: utf-8 -*-
+"""Module containing the Helper Functions for Keyset (Cursor) Pagination.
+
+Offset Pagination skips every row before the requested page and counts all of them,
+so it gets slower the deeper the page. Keyset Pagination seeks past the last row of
+the previous page instead, comparing (sort_key, id) with the values stored in an
+opaque cursor, which an index on those columns answers directly. Counting the rows
+is optional, either exactly or from the estimate of the query planner.
+
+Returns:
+    function: Functions for paginating queries with cursors.
+"""
+
+import base64
+import binascii
+import json
+import uuid
+from datetime import date, datetime
+from typing import Any, Dict, Tuple
+
+from flask_sqlalchemy.model import Model
+from sqlalchemy import and_, or_, tuple_
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.orm import Query
+from sqlalchemy.sql.expression import ClauseElement, Executable
+
+# Number of items of a page when the page_size param is missing.
+DEFAULT_PAGE_SIZE = 20
+
+# Ways of counting the total items. By default they are not counted.
+COUNT_MODES = ("exact", "estimated")
+
+
+class PaginationError(ValueError):
+    """Error raised when the pagination params are invalid.
+
+    Args:
+        error (str): Error code returned to the client.
+        message (str): Description of the error.
+    """
+
+    def __init__(self, error: str, message: str):
+        super().__init__(message)
+        self.error = error
+        self.message = message
+
+
+class Explain(Executable, ClauseElement):
+    """EXPLAIN statement of a query, whose plan includes the estimated row count."""
+
+    inherit_cache = False
+
+    def __init__(self, statement):
+        self.statement = statement
+
+
+@compiles(Explain, "postgresql")
+def _compile_explain(element: Explain, compiler, **kwargs) -> str:
+    return "EXPLAIN (FORMAT JSON) " + compiler.process(element.statement, **kwargs)
+
+
+def _parse_sort_key(model: Model, sort_key: str) -> Tuple[Any, bool]:
+    """Function to find the column and direction of a sort_key (E.g. "created_at desc")."""
+    column_name, _, direction = (sort_key or "id").strip().partition(" ")
+    direction = direction.strip().lower() or "asc"
+    column = model.__table__.columns.get(column_name)
+    if column is None or direction not in ("asc", "desc"):
+        raise PaginationError(
+            "INVALID_SORT_KEY", f"Cannot paginate with the sort key: {sort_key}"
+        )
+    return getattr(model, column.key), direction == "desc"
+
+
+def _serialize_value(value):
+    """Function to convert a value of the sort key to JSON."""
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, uuid.UUID):
+        return str(value)
+    return value
+
+
+def _deserialize_value(column, value):
+    """Function to convert a JSON value of a cursor to the type of its column."""
+    if value is None:
+        return None
+    try:
+        python_type = column.type.python_type
+    except NotImplementedError:
+        return value
+    if python_type is datetime:
+        return datetime.fromisoformat(value)
+    if python_type is date:
+        return date.fromisoformat(value)
+    if python_type is uuid.UUID:
+        return uuid.UUID(value)
+    if not isinstance(value, python_type):
+        raise ValueError(f"Expected a value of type {python_type.__name__}")
+    return value
+
+
+def encode_cursor(sort_key: str, sort_value, item_id) -> str:
+    """Function to encode the opaque cursor pointing after an item.
+
+    Args:
+        sort_key (str): Sort Key of the pagination.
+        sort_value (Any): Value of the sort key of the item.
+        item_id (UUID): ID of the item.
+
+    Returns:
+        str: URL-safe cursor.
+    """
+    payload = json.dumps(
+        [sort_key, _serialize_value(sort_value), _serialize_value(item_id)]
+    )
+    return base64.urlsafe_b64encode(payload.encode("utf-8")).decode("ascii")
+
+
+def decode_cursor(model: Model, sort_key: str, cursor: str) -> tuple:
+    """Function to decode an opaque cursor.
+
+    Args:
+        model (Model): Model of the paginated items.
+        sort_key (str): Sort Key of the pagination, which must be the one of the cursor.
+        cursor (str): URL-safe cursor.
+
+    Raises:
+        PaginationError: If the cursor is malformed or was created for another sort key.
+
+    Returns:
+        tuple: Value of the sort key and ID of the item the cursor points after.
+    """
+    sort_column, _ = _parse_sort_key(model, sort_key)
+    try:
+        cursor_sort_key, sort_value, item_id = json.loads(
+            base64.urlsafe_b64decode(cursor.encode("ascii"))
+        )
+        if cursor_sort_key != sort_key:
+            raise ValueError("The cursor belongs to another sort key")
+        return (
+            _deserialize_value(sort_column, sort_value),
+            _deserialize_value(model.id, item_id),
+        )
+    except (ValueError, TypeError, binascii.Error) as error:
+        raise PaginationError("INVALID_CURSOR", "Invalid pagination cursor") from error
+
+
+def estimate_count(query: Query) -> int:
+    """Function to estimate the number of rows of a query, from the plan of PostgreSQL.
+
+    Args:
+        query (Query): Query to estimate.
+
+    Returns:
+        int: Estimated number of rows.
+    """
+    plan = query.session.execute(Explain(query.order_by(None).statement)).scalar()
+    return int(plan[0]["Plan"]["Plan Rows"])
+
+
+def keyset_paginate(
+    query: Query,
+    model: Model,
+    sort_key: str = None,
+    after: str = None,
+    page_size: int = DEFAULT_PAGE_SIZE,
+    count: str = None,
+) -> Dict[str, Any]:
+    """Function to get the page of a query that follows a cursor.
+
+    Args:
+        query (Query): Filtered query of the paginated items, without ordering.
+        model (Model): Model of the paginated items.
+        sort_key (str): Column to sort by, optionally followed by asc or desc. The
+            items are sorted by their ID by default, which also breaks the ties.
+        after (str): Cursor returned with the previous page. The first page is
+            returned if it is empty.
+        page_size (int): Maximum number of items of the page.
+        count (str): Whether the total items are counted ("exact"), estimated
+            ("estimated") or not counted (None).
+
+    Raises:
+        PaginationError: If any of the params is invalid.
+
+    Returns:
+        Dict[str, Any]: Items of the page, cursor of the next page (None on the last
+            one), and the total items if they were counted.
+    """
+    if page_size < 1:
+        raise PaginationError("INVALID_PAGE_SIZE", "The page size must be positive")
+    if count is not None and count not in COUNT_MODES:
+        raise PaginationError(
+            "INVALID_COUNT", f"The count must be one of: {', '.join(COUNT_MODES)}"
+        )
+    sort_key = sort_key.strip() if sort_key else "id"
+    sort_column, descending = _parse_sort_key(model, sort_key)
+    id_column = model.id
+    filtered_query = query
+
+    if after:
+        sort_value, item_id = decode_cursor(model, sort_key, after)
+        seek = tuple_(sort_column, id_column)
+        # NOTE: PostgreSQL sorts NULLs as the largest values, so they come last in
+        # ascending order and first in descending order.
+        if sort_value is None:
+            remaining_items = and_(
+                sort_column.is_(None),
+                id_column < item_id if descending else id_column > item_id,
+            )
+            if descending:
+                remaining_items = or_(remaining_items, sort_column.isnot(None))
+        elif descending:
+            remaining_items = seek < tuple_(sort_value, item_id)
+        else:
+            remaining_items = or_(
+                seek > tuple_(sort_value, item_id), sort_column.is_(None)
+            )
+        query = query.filter(remaining_items)
+
+    if descending:
+        query = query.order_by(sort_column.desc(), id_column.desc())
+    else:
+        query = query.order_by(sort_column.asc(), id_column.asc())
+    # One more item is read to know whether there is a next page.
+    items = query.limit(page_size + 1).all()
+    has_next = len(items) > page_size
+    items = items[:page_size]
+
+    page = {
+        "items": items,
+        "page_size": page_size,
+        "next_cursor": (
+            encode_cursor(sort_key, getattr(items[-1], sort_column.key), items[-1].id)
+            if has_next
+            else None
+        ),
+    }
+    if count == "exact":
+        page["total_items"] = filtered_query.order_by(None).count()
+    elif count == "estimated":
+        page["total_items"] = estimate_count(filtered_query)
+    return page
+
+
+def keyset_pagination_response(
+    query: Query, model: Model, schema, args
+) -> Tuple[dict, int]:
+    """Function to build the response of a Controller paginated with cursors.
+
+    Args:
+        query (Query): Filtered query of the paginated items, without ordering.
+        model (Model): Model of the paginated items.
+        schema (Schema): Schema of the items.
+        args (MultiDict): Request args, with the after cursor and optionally the
+            sort_key, page_size and count params.
+
+    Returns:
+        Tuple[dict, int]: Response and status code.
+    """
+    try:
+        page = keyset_paginate(
+            query,
+            model,
+            sort_key=args.get("sort_key"),
+            after=args.get("after"),
+            page_size=args.get("page_size", DEFAULT_PAGE_SIZE, type=int),
+            count=args.get("count") or None,
+        )
+    except PaginationError as error:
+        return {
+            "success": False,
+            "message": error.message,
+            "data": {"error": error.error, "message": error.message},
+        }, 400
+    page["items"] = schema().dump(obj=page["items"], many=True)
+    return {
+        "message": "Model Bulk Data Found Successfully",
+        "data": page,
+        "success": True,
+    }, 200
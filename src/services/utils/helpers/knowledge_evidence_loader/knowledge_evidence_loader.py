@@ -0,0 +1,80 @@
+# -*- coding: utf-8 -*-
+"""Module containing the Helper Function to load the Knowledge Evidence observed for a User.
+
+Returns:
+    function: Function for loading the users Knowledge Evidence.
+"""
+
+from typing import Dict, Iterable, Set
+from uuid import UUID
+
+from flask_sqlalchemy.model import Model
+
+
+def knowledge_evidence_loader(
+    models: Dict[str, Model], current_user, template_ids: Iterable[UUID] = None
+) -> Dict[str, Set[UUID]]:
+    """Function to load all of the Knowledge Evidence observed for a User in a fixed number of Queries.
+
+    Args:
+        models (Dict[str,Model]): Dictionary containing all models defined in the Database.
+        current_user (): Instance of the Currently Authenticated User
+        template_ids (Iterable[UUID]): IDs of the Templates whose Evidence is needed.
+            The Evidence of every Template is loaded if not given.
+
+    Returns:
+        Dict[str, Set[UUID]]: Dictionary containing the IDs of the Pages whose Practice Test was
+        passed by the User and the IDs of the Measurable Interactions fired by the User.
+    """
+    if template_ids is not None:
+        template_ids = list(template_ids)
+        # NOTE: No Template means no Evidence, so there is nothing to load.
+        if not template_ids:
+            return {"passed_practice_tests": set(), "fired_interactions": set()}
+
+    # Get the Pages of all of the Practice Tests the user has passed.
+    # NOTE: A Practice Test is passed only if the acquired score reaches the approval score.
+    passed_practice_tests = (
+        models["PracticeTest"]
+        .query.join(models["TestAttempt"])
+        .filter(
+            models["TestAttempt"].user_id == current_user.id,
+            models["TestAttempt"].acquired_score
+            >= models["PracticeTest"].approval_score,
+        )
+    )
+    if template_ids is not None:
+        passed_practice_tests = passed_practice_tests.join(models["Page"]).filter(
+            models["Page"].template_id.in_(template_ids)
+        )
+    passed_practice_tests = passed_practice_tests.with_entities(
+        models["PracticeTest"].page_id
+    ).all()
+
+    # Get all of the Measurable Interactions fired by the user.
+    # NOTE: We filter the Measurable Interactions so that we only get
+    # the ones that are not related to learning styles.
+    fired_interactions = (
+        models["MeasurableInteraction"]
+        .query.join(models["InteractionFired"])
+        .filter(
+            models["InteractionFired"].user_id == current_user.id,
+            models["MeasurableInteraction"].learning_style_attribute.is_(None),
+        )
+    )
+    if template_ids is not None:
+        fired_interactions = (
+            fired_interactions.join(models["LearningContent"])
+            .join(models["Page"])
+            .filter(models["Page"].template_id.in_(template_ids))
+        )
+    fired_interactions = fired_interactions.with_entities(
+        models["MeasurableInteraction"].id
+    ).all()
+
+    return {
+        "passed_practice_tests": {page_id for (page_id,) in passed_practice_tests},
+        "fired_interactions": {
+            interaction_id for (interaction_id,) in fired_interactions
+        },
+    }
@@ -0,0 +1,493 @@
+# -*- coding: utf-8 -*-
+"""Module containing the Array Backed Inference Engine for the Knowledge Bayesian Network.
+
+The Domain Knowledge Graph is compiled once per Domain Version into dense NumPy arrays:
+Node IDs are interned into integers and the parents of every node are stored as CSR
+arrays (indptr, parents, weights), grouped by topological level. The Leaky OR Model is
+then evaluated one level at a time in vectorized form.
+
+NOTE: knowledge_bayesian_network_constructor is kept as the reference implementation.
+
+Returns:
+    function: Function for estimating the users Knowledge with the compiled Engine.
+"""
+
+import heapq
+from collections import OrderedDict, deque
+from collections.abc import Mapping
+from threading import Lock
+from typing import Any, Dict, Iterable, List
+
+import numpy as np
+from flask_sqlalchemy.model import Model
+from src.services.utils.helpers.domain_knowledge_graph.domain_knowledge_graph import (
+    domain_knowledge_graph,
+)
+from src.services.utils.helpers.knowledge_evidence_loader.knowledge_evidence_loader import (
+    knowledge_evidence_loader,
+)
+
+# Entity Types whose Knowledge is estimated (The rest of the nodes are Evidence).
+LATENT_ENTITY_TYPES = {"topic", "template"}
+
+# Maximum number of Ancestor Closures cached per compiled Engine.
+MAX_ANCESTOR_CLOSURES = 256
+
+
+class KnowledgeEstimation(Mapping):
+    """Read Only Mapping from Node ID to the estimated Knowledge of the Node.
+
+    Every value is a dictionary with the same attributes the reference network sets
+    on its nodes (expected_knowledge and evidence_observed).
+    """
+
+    def __init__(
+        self,
+        node_index: Dict,
+        expected_knowledge: np.ndarray,
+        evidence_observed: np.ndarray,
+    ):
+        self.node_index = node_index
+        self.expected_knowledge = expected_knowledge
+        self.evidence_observed = evidence_observed
+
+    def __getitem__(self, node_id) -> dict:
+        index = self.node_index[node_id]
+        node = {"evidence_observed": bool(self.evidence_observed[index])}
+        # NOTE: Evidence nodes (And Topics inside a cycle) have no expected knowledge.
+        if not np.isnan(self.expected_knowledge[index]):
+            node["expected_knowledge"] = float(self.expected_knowledge[index])
+        return node
+
+    def __iter__(self):
+        return iter(self.node_index)
+
+    def __len__(self) -> int:
+        return len(self.node_index)
+
+
+def _compile_level(
+    level_nodes: np.ndarray,
+    indptr: np.ndarray,
+    parents: np.ndarray,
+    edge_factors: np.ndarray,
+    leak_factors: np.ndarray,
+    thresholds: np.ndarray,
+) -> dict:
+    """Function to store the parents of the nodes of one level as CSR arrays."""
+    parent_counts = indptr[level_nodes + 1] - indptr[level_nodes]
+    edge_positions = np.concatenate(
+        [np.arange(indptr[index], indptr[index + 1]) for index in level_nodes]
+    ).astype(np.int64)
+    level_indptr = np.concatenate(([0], np.cumsum(parent_counts)))
+    # NOTE: np.multiply.reduceat cannot handle empty segments, so we only
+    # reduce the segments of the nodes that have parents.
+    non_empty = parent_counts > 0
+    return {
+        "nodes": level_nodes,
+        "indptr": level_indptr,
+        "parents": parents[edge_positions],
+        "edge_factors": edge_factors[edge_positions],
+        "non_empty": non_empty,
+        "segment_starts": level_indptr[:-1][non_empty],
+        "leak_factors": leak_factors[level_nodes],
+        "thresholds": thresholds[level_nodes],
+    }
+
+
+def compile_knowledge_inference_engine(domain_graph: dict) -> dict:
+    """Function to compile the Domain Knowledge Graph into the arrays used by the Engine.
+
+    Args:
+        domain_graph (dict): Domain Knowledge Graph (See domain_knowledge_graph).
+
+    Returns:
+        dict: Dictionary containing the Node Index and the CSR arrays of every level.
+    """
+    network = domain_graph["network"]
+
+    # We intern every Node ID into a dense integer.
+    node_ids = list(network.nodes)
+    node_index = {node_id: index for index, node_id in enumerate(node_ids)}
+    size = len(node_ids)
+
+    # We store the parents of every node alongside the factor (1 - weight) of the edge.
+    parents = [[] for _ in range(size)]
+    edge_factors = [[] for _ in range(size)]
+    children = [[] for _ in range(size)]
+    for (predecessor, successor), knowledge_weight in domain_graph["edges"].items():
+        parents[node_index[successor]].append(node_index[predecessor])
+        edge_factors[node_index[successor]].append(1 - knowledge_weight / 100)
+        children[node_index[predecessor]].append(node_index[successor])
+
+    latent = np.array(
+        [
+            network.nodes[node_id].get("entity_type") in LATENT_ENTITY_TYPES
+            for node_id in node_ids
+        ],
+        dtype=bool,
+    )
+    leak_factors = np.array(
+        [1 - network.nodes[node_id].get("leak_parameter", 0) for node_id in node_ids]
+    )
+    thresholds = np.array(
+        [
+            network.nodes[node_id].get("default_knowledge", 0) / 100
+            for node_id in node_ids
+        ]
+    )
+
+    # We compute the topological level of every node (Kahn's Algorithm).
+    # NOTE: Evidence nodes are on level 0 and every latent node is one level
+    # above its deepest parent. Nodes inside a cycle never get a level.
+    levels = np.full(size, -1)
+    pending_parents = [len(node_parents) for node_parents in parents]
+    nodes_to_visit = deque(index for index in range(size) if not pending_parents[index])
+    for index in nodes_to_visit:
+        levels[index] = 1 if latent[index] else 0
+    while nodes_to_visit:
+        index = nodes_to_visit.popleft()
+        for child in children[index]:
+            levels[child] = max(levels[child], levels[index] + 1)
+            pending_parents[child] -= 1
+            if not pending_parents[child]:
+                nodes_to_visit.append(child)
+
+    # We store the parents of every node as a single CSR array, so that a single
+    # node (Or a subgraph) can be recomputed without the rest of the network.
+    indptr = np.concatenate(
+        ([0], np.cumsum([len(node_parents) for node_parents in parents]))
+    )
+    parents = np.array(
+        [parent for node_parents in parents for parent in node_parents],
+        dtype=np.int64,
+    )
+    edge_factors = np.array(
+        [factor for node_factors in edge_factors for factor in node_factors],
+        dtype=float,
+    )
+
+    # We group the latent nodes by level and store their parents as CSR arrays.
+    compiled_levels = []
+    for level in range(1, levels.max(initial=0) + 1):
+        level_nodes = np.flatnonzero((levels == level) & latent)
+        if level_nodes.size:
+            compiled_levels.append(
+                _compile_level(
+                    level_nodes,
+                    indptr,
+                    parents,
+                    edge_factors,
+                    leak_factors,
+                    thresholds,
+                )
+            )
+
+    return {
+        "node_index": node_index,
+        "node_ids": node_ids,
+        "entity_types": [
+            network.nodes[node_id].get("entity_type") for node_id in node_ids
+        ],
+        "size": size,
+        "levels": compiled_levels,
+        "node_levels": levels,
+        "indptr": indptr,
+        "parents": parents,
+        "edge_factors": edge_factors,
+        "children": children,
+        "latent": latent,
+        "leak_factors": leak_factors,
+        "thresholds": thresholds,
+        # NOTE: The least recently used closures are evicted first.
+        "ancestor_index": OrderedDict(),
+        "ancestor_index_lock": Lock(),
+    }
+
+
+def compiled_knowledge_inference_engine(domain_graph: dict) -> dict:
+    """Function to get the compiled Engine of a Domain Knowledge Graph.
+
+    NOTE: The Engine is compiled once per Domain Version and cached alongside the Graph.
+
+    Args:
+        domain_graph (dict): Domain Knowledge Graph (See domain_knowledge_graph).
+
+    Returns:
+        dict: Compiled Engine (See compile_knowledge_inference_engine).
+    """
+    if "inference_engine" not in domain_graph:
+        domain_graph["inference_engine"] = compile_knowledge_inference_engine(
+            domain_graph
+        )
+    return domain_graph["inference_engine"]
+
+
+def knowledge_ancestor_closure(engine: dict, node_ids: Iterable) -> dict:
+    """Function to get the subgraph needed to estimate the Knowledge of some nodes.
+
+    The Knowledge of a node only depends on its ancestors, so only the levels of the
+    ancestor closure of the target nodes have to be evaluated.
+
+    NOTE: The most recently used closures are cached in the Engine (Per set of target
+    nodes), so they are usually computed once per Domain Version.
+
+    Args:
+        engine (dict): Compiled Engine (See compile_knowledge_inference_engine).
+        node_ids (Iterable): IDs of the target Topics and Templates.
+
+    Returns:
+        dict: Dictionary containing the indexes of the nodes of the closure (And their
+        boolean mask), the CSR arrays of its levels and the IDs of its Templates.
+    """
+    node_index = engine["node_index"]
+    # NOTE: Nodes created after the Domain Version was read are not in the Engine yet.
+    targets = frozenset(
+        node_index[node_id] for node_id in node_ids if node_id in node_index
+    )
+    with engine["ancestor_index_lock"]:
+        closure = engine["ancestor_index"].get(targets)
+        if closure is not None:
+            engine["ancestor_index"].move_to_end(targets)
+            return closure
+
+    in_closure = np.zeros(engine["size"], dtype=bool)
+    in_closure[list(targets)] = True
+    nodes_to_visit = list(targets)
+    while nodes_to_visit:
+        index = nodes_to_visit.pop()
+        start, end = engine["indptr"][index], engine["indptr"][index + 1]
+        for parent in engine["parents"][start:end]:
+            if not in_closure[parent]:
+                in_closure[parent] = True
+                nodes_to_visit.append(parent)
+
+    closure_levels = []
+    for level in engine["levels"]:
+        level_nodes = level["nodes"][in_closure[level["nodes"]]]
+        if level_nodes.size:
+            closure_levels.append(
+                _compile_level(
+                    level_nodes,
+                    engine["indptr"],
+                    engine["parents"],
+                    engine["edge_factors"],
+                    engine["leak_factors"],
+                    engine["thresholds"],
+                )
+            )
+    closure_nodes = np.flatnonzero(in_closure)
+    closure = {
+        "nodes": closure_nodes,
+        "in_closure": in_closure,
+        "levels": closure_levels,
+        "template_ids": [
+            engine["node_ids"][index]
+            for index in closure_nodes
+            if engine["entity_types"][index] == "template"
+        ],
+    }
+    with engine["ancestor_index_lock"]:
+        engine["ancestor_index"][targets] = closure
+        engine["ancestor_index"].move_to_end(targets)
+        while len(engine["ancestor_index"]) > MAX_ANCESTOR_CLOSURES:
+            engine["ancestor_index"].popitem(last=False)
+    return closure
+
+
+def knowledge_evidence_matrix(engine: dict, evidence_ids: List[Iterable]) -> np.ndarray:
+    """Function to build the matrix of the observed Evidence of many users.
+
+    Args:
+        engine (dict): Compiled Engine (See compile_knowledge_inference_engine).
+        evidence_ids (List[Iterable]): IDs of the Evidence nodes observed for every user.
+
+    Returns:
+        np.ndarray: Boolean matrix (users x nodes) of the observed Evidence.
+    """
+    node_index = engine["node_index"]
+    rows, columns = [], []
+    for row, user_evidence_ids in enumerate(evidence_ids):
+        for evidence_id in user_evidence_ids:
+            # NOTE: Evidence created after the Domain Version was read is not in the Engine yet.
+            if evidence_id in node_index:
+                rows.append(row)
+                columns.append(node_index[evidence_id])
+    evidence_observed = np.zeros((len(evidence_ids), engine["size"]), dtype=bool)
+    evidence_observed[rows, columns] = True
+    return evidence_observed
+
+
+def evaluate_knowledge_inference_engine_batch(
+    engine: dict, evidence_observed: np.ndarray, levels: List[dict] = None
+) -> np.ndarray:
+    """Function to estimate the Knowledge of many users at once.
+
+    NOTE: Every row is one user, so every level is evaluated for all of the users with
+    the same array operations.
+
+    Args:
+        engine (dict): Compiled Engine (See compile_knowledge_inference_engine).
+        evidence_observed (np.ndarray): Boolean matrix (users x nodes) of the observed
+            Evidence. It is updated in place with the flags of the latent nodes.
+        levels (List[dict]): Levels to evaluate. Every level of the Engine if not given.
+
+    Returns:
+        np.ndarray: Matrix (users x nodes) of the expected knowledge (NaN for Evidence nodes
+        and for the nodes that were not evaluated).
+    """
+    users = evidence_observed.shape[0]
+    expected_knowledge = np.full((users, engine["size"]), np.nan)
+
+    # For estimation we use Leaky OR Model, one level at a time.
+    for level in engine["levels"] if levels is None else levels:
+        # We take a parent into account only if it's evidence_observed flag is True.
+        factors = np.where(
+            evidence_observed[:, level["parents"]], level["edge_factors"], 1.0
+        )
+        expected_knowledge_modifier = np.ones((users, level["nodes"].size))
+        if factors.size:
+            expected_knowledge_modifier[:, level["non_empty"]] = np.multiply.reduceat(
+                factors, level["segment_starts"], axis=1
+            )
+        level_knowledge = 1 - expected_knowledge_modifier * level["leak_factors"]
+        expected_knowledge[:, level["nodes"]] = level_knowledge
+        # NOTE: We set it to True only if the expected_knowledge is greater than the default_knowledge.
+        evidence_observed[:, level["nodes"]] = level_knowledge > level["thresholds"]
+
+    return expected_knowledge
+
+
+def evaluate_knowledge_inference_engine(
+    engine: dict, evidence_ids: Iterable, node_ids: Iterable = None
+) -> KnowledgeEstimation:
+    """Function to estimate the Knowledge for a set of observed Evidence.
+
+    Args:
+        engine (dict): Compiled Engine (See compile_knowledge_inference_engine).
+        evidence_ids (Iterable): IDs of the Evidence nodes observed for the user.
+        node_ids (Iterable): IDs of the target Topics and Templates. If given, only
+            their ancestor closure is evaluated.
+
+    Returns:
+        KnowledgeEstimation: Estimated Knowledge of every node (Or of the ancestor
+        closure of the target nodes).
+    """
+    evidence_observed = knowledge_evidence_matrix(engine, [evidence_ids])
+    expected_knowledge = evaluate_knowledge_inference_engine_batch(
+        engine,
+        evidence_observed,
+        None
+        if node_ids is None
+        else knowledge_ancestor_closure(engine, node_ids)["levels"],
+    )
+    return KnowledgeEstimation(
+        engine["node_index"], expected_knowledge[0], evidence_observed[0]
+    )
+
+
+def propagate_knowledge_evidence(
+    engine: dict,
+    knowledge_estimation: KnowledgeEstimation,
+    evidence_changes: Dict[Any, bool],
+    evaluated_nodes: np.ndarray = None,
+) -> set:
+    """Function to update an estimation in place after some Evidence changed.
+
+    Only the descendants of the changed Evidence are recomputed. A node's children are
+    only revisited when its evidence_observed flag flips, because the Leaky OR Model
+    of a child only depends on the flags of its parents.
+
+    Args:
+        engine (dict): Compiled Engine used to build the estimation.
+        knowledge_estimation (KnowledgeEstimation): Estimation to update.
+        evidence_changes (Dict[Any, bool]): New evidence_observed flag of every changed Evidence node.
+        evaluated_nodes (np.ndarray): Boolean mask of the nodes the estimation evaluated,
+            if it only evaluated an ancestor closure. The rest of the nodes are never
+            recomputed, because their parents may not have been evaluated.
+
+    Returns:
+        set: Indexes of the nodes whose estimation was recomputed.
+    """
+    node_index = engine["node_index"]
+    expected_knowledge = knowledge_estimation.expected_knowledge
+    evidence_observed = knowledge_estimation.evidence_observed
+
+    # We use a heap ordered by level so that every node is recomputed after its parents.
+    nodes_to_update = []
+    queued_nodes = set()
+    for evidence_id, observed in evidence_changes.items():
+        # NOTE: Evidence created after the Domain Version was read is not in the Engine yet.
+        index = node_index.get(evidence_id)
+        if index is None or evidence_observed[index] == observed:
+            continue
+        evidence_observed[index] = observed
+        for child in engine["children"][index]:
+            if child not in queued_nodes and (
+                evaluated_nodes is None or evaluated_nodes[child]
+            ):
+                queued_nodes.add(child)
+                heapq.heappush(nodes_to_update, (engine["node_levels"][child], child))
+
+    updated_nodes = set()
+    while nodes_to_update:
+        _, index = heapq.heappop(nodes_to_update)
+        # NOTE: Nodes inside a cycle are never estimated.
+        if engine["node_levels"][index] < 0:
+            continue
+        start, end = engine["indptr"][index], engine["indptr"][index + 1]
+        expected_knowledge_modifier = np.prod(
+            np.where(
+                evidence_observed[engine["parents"][start:end]],
+                engine["edge_factors"][start:end],
+                1.0,
+            )
+        )
+        expected_knowledge[index] = (
+            1 - expected_knowledge_modifier * engine["leak_factors"][index]
+        )
+        updated_nodes.add(index)
+        observed = expected_knowledge[index] > engine["thresholds"][index]
+        if observed == evidence_observed[index]:
+            continue
+        evidence_observed[index] = observed
+        for child in engine["children"][index]:
+            if child not in queued_nodes and (
+                evaluated_nodes is None or evaluated_nodes[child]
+            ):
+                queued_nodes.add(child)
+                heapq.heappush(nodes_to_update, (engine["node_levels"][child], child))
+
+    return updated_nodes
+
+
+def knowledge_inference_engine(
+    models: Dict[str, Model], current_user, node_ids: Iterable = None
+) -> KnowledgeEstimation:
+    """Function to estimate the Knowledge of the User with the compiled Engine.
+
+    Args:
+        models (Dict[str,Model]): Dictionary containing all models defined in the Database.
+        current_user (): Instance of the Currently Authenticated User
+        node_ids (Iterable): IDs of the target Topics and Templates. If given, only their
+            ancestor closure is evaluated and only the Evidence of its Templates is loaded.
+
+    Returns:
+        KnowledgeEstimation: Estimated Knowledge of every Topic and Template (Or of the
+        ancestor closure of the target nodes).
+    """
+    domain_graph = domain_knowledge_graph(models)
+    inference_engine = compiled_knowledge_inference_engine(domain_graph)
+    knowledge_evidence = knowledge_evidence_loader(
+        models,
+        current_user,
+        None
+        if node_ids is None
+        else knowledge_ancestor_closure(inference_engine, node_ids)["template_ids"],
+    )
+    return evaluate_knowledge_inference_engine(
+        inference_engine,
+        knowledge_evidence["passed_practice_tests"]
+        | knowledge_evidence["fired_interactions"],
+        node_ids,
+    )
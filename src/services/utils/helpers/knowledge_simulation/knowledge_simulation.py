@@ -0,0 +1,188 @@
+# -*- coding: utf-8 -*-
+"""Module containing the Helper Functions to simulate hypothetical Evidence on the Knowledge of a User.
+
+A simulation starts from the Knowledge State of the User and keeps an in-memory copy of
+it. Every scenario (A set of hypothetical Evidence changes) is propagated incrementally
+through the descendants of the changed Evidence only, and the copy is restored from the
+Knowledge State right after. Nothing is ever written to the Database, so scoring many
+candidate actions only costs their propagation.
+
+Returns:
+    function: Functions for simulating hypothetical Evidence.
+"""
+
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+from uuid import UUID
+
+import numpy as np
+from flask_sqlalchemy.model import Model
+from src.services.utils.helpers.domain_knowledge_graph.domain_knowledge_graph import (
+    domain_knowledge_graph,
+)
+from src.services.utils.helpers.knowledge_inference_engine.knowledge_inference_engine import (
+    KnowledgeEstimation,
+    compiled_knowledge_inference_engine,
+    knowledge_inference_engine,
+    propagate_knowledge_evidence,
+)
+from src.services.utils.helpers.user_knowledge_state.user_knowledge_state import (
+    user_knowledge_state,
+)
+
+
+class KnowledgeSimulation:
+    """In-memory copy of the Knowledge State of a User to propagate hypothetical Evidence on.
+
+    NOTE: The Knowledge State is shared between requests, so it is never modified.
+    """
+
+    def __init__(self, engine: dict, knowledge_estimation: KnowledgeEstimation):
+        self.engine = engine
+        self.knowledge_estimation = knowledge_estimation
+        self._simulated_estimation = KnowledgeEstimation(
+            engine["node_index"],
+            knowledge_estimation.expected_knowledge.copy(),
+            knowledge_estimation.evidence_observed.copy(),
+        )
+
+    def simulate(self, evidence_changes: Dict[Any, bool]) -> Dict[Any, dict]:
+        """Function to propagate hypothetical Evidence changes.
+
+        Args:
+            evidence_changes (Dict[Any, bool]): Hypothetical evidence_observed flag of every
+                changed Evidence node.
+
+        Returns:
+            Dict[Any, dict]: Estimated Knowledge (See KnowledgeEstimation) of every Topic and
+            Template whose expected_knowledge or evidence_observed flag changed.
+        """
+        node_ids = self.engine["node_ids"]
+        simulated_estimation = self._simulated_estimation
+        updated_nodes = propagate_knowledge_evidence(
+            self.engine, simulated_estimation, evidence_changes
+        )
+        changed_nodes = {
+            node_ids[index]: simulated_estimation[node_ids[index]]
+            for index in updated_nodes
+            if simulated_estimation.evidence_observed[index]
+            != self.knowledge_estimation.evidence_observed[index]
+            or not np.isclose(
+                simulated_estimation.expected_knowledge[index],
+                self.knowledge_estimation.expected_knowledge[index],
+                equal_nan=True,
+            )
+        }
+
+        # We restore the touched nodes, so that every scenario starts from the Knowledge State.
+        restored_nodes = list(updated_nodes) + [
+            self.engine["node_index"][evidence_id]
+            for evidence_id in evidence_changes
+            if evidence_id in self.engine["node_index"]
+        ]
+        simulated_estimation.expected_knowledge[
+            restored_nodes
+        ] = self.knowledge_estimation.expected_knowledge[restored_nodes]
+        simulated_estimation.evidence_observed[
+            restored_nodes
+        ] = self.knowledge_estimation.evidence_observed[restored_nodes]
+        return changed_nodes
+
+
+def user_knowledge_simulation(models: Dict[str, Model], user) -> KnowledgeSimulation:
+    """Function to start a simulation from the current Knowledge State of a User.
+
+    Args:
+        models (Dict[str,Model]): Dictionary containing all models defined in the Database.
+        user (Model): User whose Knowledge is simulated.
+
+    Returns:
+        KnowledgeSimulation: Simulation of the Knowledge of the User.
+    """
+    knowledge_estimation = user_knowledge_state(models, user)
+    engine = compiled_knowledge_inference_engine(domain_knowledge_graph(models))
+    # NOTE: If the Domain Model changed after the Knowledge State was read, the state
+    # belongs to an older Engine and is estimated again with the current one.
+    if knowledge_estimation.node_index is not engine["node_index"]:
+        knowledge_estimation = knowledge_inference_engine(models, user)
+    return KnowledgeSimulation(engine, knowledge_estimation)
+
+
+def resolve_hypothetical_evidence(
+    models: Dict[str, Model], scenarios: List[List[dict]]
+) -> Tuple[List[Dict[Any, bool]], List[dict]]:
+    """Function to find the Evidence nodes changed by the hypothetical Evidence deltas of every scenario.
+
+    Every delta is either {"practice_test_id": ID, "passed": bool} or
+    {"measurable_interaction_id": ID, "fired": bool}. "passed" and "fired" default to True.
+    The deltas of every scenario are resolved with the same (At most two) Queries.
+
+    Args:
+        models (Dict[str,Model]): Dictionary containing all models defined in the Database.
+        scenarios (List[List[dict]]): Hypothetical Evidence deltas of every scenario.
+
+    Returns:
+        Tuple[List[Dict[Any, bool]], List[dict]]: New evidence_observed flag of every changed
+        Evidence node for every scenario, and the deltas that are not Knowledge Evidence.
+    """
+    evidence_deltas = [delta for scenario in scenarios for delta in scenario]
+    practice_test_ids = {
+        _parse_uuid(delta.get("practice_test_id")) for delta in evidence_deltas
+    } - {None}
+    measurable_interaction_ids = {
+        _parse_uuid(delta.get("measurable_interaction_id")) for delta in evidence_deltas
+    } - {None}
+
+    # NOTE: A Practice Test is observed through the node of its Page.
+    practice_test_pages = {}
+    if practice_test_ids:
+        practice_test_pages = dict(
+            models["PracticeTest"]
+            .query.filter(models["PracticeTest"].id.in_(practice_test_ids))
+            .with_entities(models["PracticeTest"].id, models["PracticeTest"].page_id)
+            .all()
+        )
+    # NOTE: Interactions related to learning styles are not Knowledge Evidence.
+    knowledge_interaction_ids = set()
+    if measurable_interaction_ids:
+        knowledge_interaction_ids = {
+            interaction_id
+            for (interaction_id,) in models["MeasurableInteraction"]
+            .query.filter(
+                models["MeasurableInteraction"].id.in_(measurable_interaction_ids),
+                models["MeasurableInteraction"].learning_style_attribute.is_(None),
+            )
+            .with_entities(models["MeasurableInteraction"].id)
+            .all()
+        }
+
+    scenarios_evidence_changes = []
+    unresolved_deltas = []
+    for scenario in scenarios:
+        evidence_changes = {}
+        for delta in scenario:
+            practice_test_id = _parse_uuid(delta.get("practice_test_id"))
+            measurable_interaction_id = _parse_uuid(
+                delta.get("measurable_interaction_id")
+            )
+            if practice_test_id in practice_test_pages:
+                evidence_changes[practice_test_pages[practice_test_id]] = bool(
+                    delta.get("passed", True)
+                )
+            elif measurable_interaction_id in knowledge_interaction_ids:
+                evidence_changes[measurable_interaction_id] = bool(
+                    delta.get("fired", True)
+                )
+            else:
+                unresolved_deltas.append(delta)
+        scenarios_evidence_changes.append(evidence_changes)
+    return scenarios_evidence_changes, unresolved_deltas
+
+
+def _parse_uuid(value) -> Optional[UUID]:
+    """Function to parse an ID coming from a request. None if it is not a valid UUID."""
+    if value is None or isinstance(value, UUID):
+        return value
+    try:
+        return UUID(str(value))
+    except ValueError:
+        return None
@@ -0,0 +1,186 @@
+# -*- coding: utf-8 -*-
+"""Module containing the Helper Functions to compute and keep the Learning Style Affinities.
+
+The Affinity of a user to a Learning Style is the Noisy-OR of the weights of the
+Interactions of that Learning Style fired by the user. It is stored next to the VARK
+values of the user (See LearningStyle) and updated in the same transaction that records
+every fired Interaction, so reads never aggregate the Interactions again.
+
+Returns:
+    function: Functions for computing, updating and rebuilding the Learning Style Affinities.
+"""
+
+from typing import Dict
+from uuid import UUID
+
+from flask_sqlalchemy import SQLAlchemy
+from flask_sqlalchemy.model import Model
+from sqlalchemy import Float, case, cast, func, select
+from src.services.utils.helpers.version_counter.version_counter import (
+    bump_version,
+    get_learning_style_counter_name,
+)
+
+# Column of the LearningStyle Model storing the Affinity of every Learning Style.
+LEARNING_STYLE_AFFINITY_COLUMNS = {
+    "VISUAL": "visual_affinity",
+    "AURAL": "aural_affinity",
+    "KINESTHETIC": "kinesthetic_affinity",
+    "TEXTUAL": "textual_affinity",
+}
+
+# NOTE: exp() of a double precision below this value underflows in Postgres.
+MIN_LOG_AFFINITY_MODIFIER = -700
+
+
+def _learning_style_affinities_query(models: Dict[str, Model]):
+    """Function to build the grouped aggregate of the Affinities of every user and Learning Style.
+
+    The Noisy-OR formula is expected_affinity = 1 - prod(1 - interaction_weight / 100).
+    NOTE: The product is computed as exp(sum(ln(1 - interaction_weight / 100))), so that
+    the Interactions never leave the Database. Any Interaction with a weight of 100
+    turns the product into 0, and ln(0) is undefined, so those are checked apart.
+    """
+    interaction_weight = models["MeasurableInteraction"].interaction_weight
+    return (
+        models["InteractionFired"]
+        .query.join(models["MeasurableInteraction"])
+        .filter(models["MeasurableInteraction"].learning_style_attribute.isnot(None))
+        .group_by(
+            models["InteractionFired"].user_id,
+            models["MeasurableInteraction"].learning_style_attribute,
+        )
+        .with_entities(
+            models["InteractionFired"].user_id,
+            models["MeasurableInteraction"].learning_style_attribute,
+            1
+            - case(
+                (func.bool_or(interaction_weight >= 100), 0.0),
+                else_=func.exp(
+                    func.greatest(
+                        func.coalesce(
+                            func.sum(
+                                func.ln(1 - cast(interaction_weight, Float) / 100)
+                            ).filter(interaction_weight < 100),
+                            0.0,
+                        ),
+                        MIN_LOG_AFFINITY_MODIFIER,
+                    )
+                ),
+            ),
+        )
+    )
+
+
+def compute_learning_style_affinities(
+    models: Dict[str, Model], user_id: UUID
+) -> Dict[str, float]:
+    """Function to compute the Affinities of a user from all of its fired Interactions.
+
+    Args:
+        models (Dict[str,Model]): Dictionary containing all models defined in the Database.
+        user_id (UUID): ID of the User.
+
+    Returns:
+        Dict[str, float]: Affinity of every Learning Style the user fired Interactions of.
+    """
+    return {
+        learning_style: expected_affinity
+        for _, learning_style, expected_affinity in _learning_style_affinities_query(
+            models
+        )
+        .filter(models["InteractionFired"].user_id == user_id)
+        .all()
+    }
+
+
+def update_learning_style_affinities(
+    db: SQLAlchemy, models: Dict[str, Model], user_id: UUID, measurable_interaction_id
+):
+    """Function to apply a newly fired Interaction to the stored Affinities of a user.
+
+    NOTE: Must be called in the same transaction that records the fired Interaction. The
+    update is a single statement, so concurrent Interactions of the same user never
+    overwrite each other. Interactions without a Learning Style do not change anything.
+
+    Args:
+        db (SQLAlchemy): Database Object containing the Models.
+        models (Dict[str,Model]): Dictionary containing all models defined in the Database.
+        user_id (UUID): ID of the User.
+        measurable_interaction_id (UUID): ID of the fired Measurable Interaction.
+
+    Returns:
+        bool: Whether the Affinities of the User were updated.
+    """
+    learning_style = models["LearningStyle"].__table__
+    measurable_interaction = models["MeasurableInteraction"].__table__
+    affinity_factor = 1 - cast(measurable_interaction.c.interaction_weight, Float) / 100
+    updated_learning_styles = db.session.execute(
+        learning_style.update()
+        .where(
+            learning_style.c.user_id == user_id,
+            measurable_interaction.c.id == measurable_interaction_id,
+            measurable_interaction.c.learning_style_attribute.isnot(None),
+        )
+        .values(
+            {
+                column_name: case(
+                    (
+                        measurable_interaction.c.learning_style_attribute
+                        == learning_style_attribute,
+                        1
+                        - (1 - func.coalesce(learning_style.c[column_name], 0.0))
+                        * affinity_factor,
+                    ),
+                    else_=learning_style.c[column_name],
+                )
+                for learning_style_attribute, column_name in LEARNING_STYLE_AFFINITY_COLUMNS.items()
+            }
+        )
+    ).rowcount
+    if updated_learning_styles:
+        bump_version(db, get_learning_style_counter_name(user_id))
+    return bool(updated_learning_styles)
+
+
+def rebuild_learning_style_affinities(db: SQLAlchemy, models: Dict[str, Model]) -> int:
+    """Function to recompute the stored Affinities of every user (e.g. after a data migration).
+
+    Args:
+        db (SQLAlchemy): Database Object containing the Models.
+        models (Dict[str,Model]): Dictionary containing all models defined in the Database.
+
+    Returns:
+        int: Number of Learning Styles rebuilt.
+    """
+    learning_style = models["LearningStyle"].__table__
+    affinities = _learning_style_affinities_query(models).subquery()
+    user_id, learning_style_attribute, expected_affinity = affinities.c
+    with db.engine.begin() as connection:
+        rebuilt_learning_styles = connection.execute(
+            learning_style.update().values(
+                {
+                    column_name: None
+                    for column_name in LEARNING_STYLE_AFFINITY_COLUMNS.values()
+                }
+            )
+        ).rowcount
+        for (
+            attribute_value,
+            column_name,
+        ) in LEARNING_STYLE_AFFINITY_COLUMNS.items():
+            connection.execute(
+                learning_style.update()
+                .where(
+                    learning_style.c.user_id == user_id,
+                    learning_style_attribute == attribute_value,
+                )
+                .values({column_name: expected_affinity})
+            )
+    # NOTE: The Learning Style of every User may have changed.
+    for (learning_style_user_id,) in db.session.execute(
+        select(learning_style.c.user_id)
+    ).all():
+        bump_version(db, get_learning_style_counter_name(learning_style_user_id))
+    db.session.commit()
+    return rebuilt_learning_styles
@@ -8,6 +8,9 @@ Returns:
 from typing import Dict
 
 from flask_sqlalchemy.model import Model
+from src.services.utils.helpers.learning_style_affinity.learning_style_affinity import (
+    LEARNING_STYLE_AFFINITY_COLUMNS,
+)
 
 
 def learning_style_bayesian_network_constructor(
@@ -35,30 +38,18 @@ def learning_style_bayesian_network_constructor(
         "KINESTHETIC": False,
         "TEXTUAL": False,
     }
+    # A "Bayesian Network" simulation of each Learning Style is kept next to the VARK
+    # values, so that the Interactions do not have to be aggregated on every read.
+    # NOTE: See learning_style_affinity for how the Noisy-OR Affinities are kept.
     for learning_style in LEARNING_STYLES:
-        # A New "Bayesian Network" simulation is created for each Learning Style
-        found_interactions = (
-            models["InteractionFired"]
-            .query.filter_by(user_id=current_user.id)
-            .join(models["MeasurableInteraction"])
-            .filter_by(learning_style_attribute=learning_style)
-        ).all()
-        if found_interactions:
+        expected_affinity = getattr(
+            vark_learning_style_values, LEARNING_STYLE_AFFINITY_COLUMNS[learning_style]
+        )
+        if expected_affinity is not None:
             # If the Learning Style has interactions, then we set the corresponding flag to True
             learning_style_interactions_found[learning_style] = True
-            # And we proceed to calculate the expected value for the Learning Style affinity
-
-            # To calculate such expected value we follow the Noisy-OR formula
-            expected_affinity = 1
-            expected_affinity_modifier = 1
-            for interaction in found_interactions:
-                expected_affinity_modifier *= (
-                    1 - interaction.measurable_interaction.interaction_weight / 100
-                )
             # NOTE: In this case the Leaky parameter is set to 0, so there is no
             # default affinity for the Learning Style
-            expected_affinity -= expected_affinity_modifier
-            # We then set the expected value for the Learning Style
             learning_style_values[learning_style] = expected_affinity
 
             # This simulates a Shallow Bayesian Network, where the Learning Style
@@ -0,0 +1,148 @@
+# -*- coding: utf-8 -*-
+"""Module containing the Cache of the Principals of the authenticated Users.
+
+A Principal is the User together with its Roles and Learning Style, loaded in a
+single joined query. It is kept detached from every session, per process and for a
+few seconds, and merged into the session of every request without querying the
+Database. Controllers that change a User, its Roles or its Learning Style must
+invalidate its Principal. The other worker processes see the change once the
+Principal expires.
+
+The Learning Style is also changed by the fired Interactions of any process, so the
+Principal keeps the Learning Style Version it was loaded with. Readers that already
+know the current Version refresh the Learning Style only if it changed.
+
+Returns:
+    function: Functions for loading and invalidating the cached Principals.
+"""
+
+import time
+import uuid
+from collections import OrderedDict
+from threading import Lock
+from typing import Callable
+
+from flask_sqlalchemy.model import Model
+from sqlalchemy import select
+from sqlalchemy.orm import Session, joinedload, object_session
+from src.services.utils.helpers.version_counter.version_counter import (
+    get_learning_style_counter_name,
+)
+
+# Seconds a Principal is served for before it is loaded again.
+PRINCIPAL_TTL_SECONDS = 30
+
+# Maximum number of Principals kept per process.
+MAX_PRINCIPALS = 4096
+
+# NOTE: The least recently used Principals are evicted first.
+_principal_cache = OrderedDict()
+_principal_cache_lock = Lock()
+
+
+def _as_uuid(user_id) -> uuid.UUID:
+    """Function to parse the ID of a User. Returns None if it is not a valid UUID."""
+    if isinstance(user_id, uuid.UUID):
+        return user_id
+    try:
+        return uuid.UUID(str(user_id))
+    except ValueError:
+        return None
+
+
+def load_principal(
+    user_model: Model, user_id, clock: Callable[[], float] = time.monotonic
+):
+    """Function to get a User, with its Roles and Learning Style, attached to the current session.
+
+    Args:
+        user_model (Model): User Model.
+        user_id (UUID | str): ID of the User.
+        clock (Callable[[], float]): Function returning the current time in seconds.
+
+    Returns:
+        Model: Instance of the User, or None if it does not exist.
+    """
+    user_id = _as_uuid(user_id)
+    if user_id is None:
+        return None
+    session = user_model.query.session
+
+    with _principal_cache_lock:
+        entry = _principal_cache.get(user_id)
+        if entry is not None and clock() >= entry["expires_at"]:
+            del _principal_cache[user_id]
+            entry = None
+        if entry is not None:
+            _principal_cache.move_to_end(user_id)
+    if entry is None:
+        # NOTE: The Principal is loaded by its own session, and closing it detaches
+        # the instances. They are never attached to a session, so that they are not
+        # expired by its commits nor shared between requests.
+        # The Learning Style Version is read by the same query, so it always matches
+        # the loaded Learning Style.
+        version_counter = user_model.metadata.tables["version_counter"]
+        learning_style_version = (
+            select(version_counter.c.counter_value)
+            .where(
+                version_counter.c.counter_name
+                == get_learning_style_counter_name(user_id)
+            )
+            .scalar_subquery()
+        )
+        with Session(bind=session.get_bind(mapper=user_model.__mapper__)) as loader:
+            row = (
+                loader.query(user_model, learning_style_version)
+                .options(
+                    joinedload(user_model.role), joinedload(user_model.learning_style)
+                )
+                .filter(user_model.id == user_id)
+                .one_or_none()
+            )
+        if row is None:
+            return None
+        entry = {
+            "user": row[0],
+            "learning_style_version": row[1] or 0,
+            "expires_at": clock() + PRINCIPAL_TTL_SECONDS,
+        }
+        with _principal_cache_lock:
+            _principal_cache[user_id] = entry
+            while len(_principal_cache) > MAX_PRINCIPALS:
+                _principal_cache.popitem(last=False)
+
+    # Merging without loading copies the cached state into the session, without SQL.
+    return session.merge(entry["user"], load=False)
+
+
+def refresh_learning_style(principal, learning_style_version: int):
+    """Function to read the Learning Style of a Principal again if its Version changed since it was cached.
+
+    NOTE: The Triggered Adaptative Events computed from the Learning Style are cached
+    with the Learning Style Version, so they must never be computed from older values.
+
+    Args:
+        principal (Model): Instance of the User returned by load_principal.
+        learning_style_version (int): Current Learning Style Version of the User.
+    """
+    with _principal_cache_lock:
+        entry = _principal_cache.get(principal.id)
+        if (
+            entry is not None
+            and entry["learning_style_version"] == learning_style_version
+        ):
+            return
+        # The next request loads the Principal with the new Learning Style.
+        _principal_cache.pop(principal.id, None)
+    if principal.learning_style is not None:
+        object_session(principal).refresh(principal.learning_style)
+
+
+def invalidate_principal(user_id):
+    """Function to drop the cached Principal of a User.
+
+    Args:
+        user_id (UUID | str): ID of the User.
+    """
+    with _principal_cache_lock:
+        _principal_cache.pop(_as_uuid(user_id), None)
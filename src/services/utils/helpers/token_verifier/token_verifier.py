@@ -0,0 +1,244 @@
+# -*- coding: utf-8 -*-
+"""Module containing the Verifiers of the ID Tokens accepted by the Auth Middleware.
+
+Firebase verifies the ID Tokens by default. Load tests and offline deployments can
+use the Local Verifier instead, which verifies RS256 tokens against public keys read
+from a file, without any network I/O. The Verifier is chosen with the AUTH_VERIFIER
+environment variable, and the Local Verifier reads its keys from the file in
+LOCAL_JWT_PUBLIC_KEYS_FILE. The local tokens are minted with the mint-local-tokens
+command.
+
+Returns:
+    function: Functions for getting the Verifier and for minting the local tokens.
+"""
+
+import hashlib
+import json
+import time
+from abc import ABC, abstractmethod
+from os import environ
+from threading import Lock
+from typing import Callable, Dict, Tuple, Union
+
+from google.auth import crypt, jwt
+
+# NOTE: google-auth uses cryptography when it is installed, and rsa otherwise.
+# Both of them read PKCS#1 keys.
+try:
+    from cryptography.hazmat.primitives import serialization
+    from cryptography.hazmat.primitives.asymmetric import rsa
+except ImportError:
+    import rsa
+
+    serialization = None
+from src.services.utils.helpers.verified_token_cache.verified_token_cache import (
+    CLOCK_SKEW_SECONDS,
+    verify_cached_token,
+    verify_firebase_id_token,
+)
+
+# Issuer and Audience of the local tokens.
+LOCAL_TOKEN_ISSUER = "sha-local"
+
+# Key ID of the local keys, when the key file contains a single key.
+LOCAL_KEY_ID = "local"
+
+_token_verifier = {"verifier": None}
+_token_verifier_lock = Lock()
+
+
+class TokenVerifier(ABC):
+    """Base class of the Verifiers of the ID Tokens."""
+
+    @abstractmethod
+    def verify(self, id_token: str) -> dict:
+        """Method to verify an ID Token.
+
+        Args:
+            id_token (str): Encoded ID Token.
+
+        Raises:
+            ValueError: If the token is malformed, expired or its signature is invalid.
+
+        Returns:
+            dict: Decoded claims of the token. The ID of the User is its user_id.
+        """
+
+
+class FirebaseTokenVerifier(TokenVerifier):
+    """Verifier of the ID Tokens issued by Firebase Authentication."""
+
+    def verify(self, id_token: str) -> dict:
+        return verify_firebase_id_token(id_token)
+
+
+class LocalTokenVerifier(TokenVerifier):
+    """Verifier of the RS256 tokens signed with local keys."""
+
+    def __init__(self, public_keys: Union[str, Dict[str, str]]):
+        """Creates a Local Verifier.
+
+        Args:
+            public_keys (Union[str, Dict[str, str]]): Public key in PEM format, or the
+                public key of every key ID.
+        """
+        self.public_keys = public_keys
+        # NOTE: Tokens verified with other keys are never accepted from the cache.
+        self.namespace = (
+            "local:"
+            + hashlib.sha256(
+                json.dumps(public_keys, sort_keys=True).encode("utf-8")
+            ).hexdigest()
+        )
+
+    @classmethod
+    def from_file(cls, public_keys_file: str) -> "LocalTokenVerifier":
+        """Creates a Local Verifier with the public keys of a file.
+
+        Args:
+            public_keys_file (str): Path of a PEM public key, or of a JSON object with
+                the PEM public key of every key ID.
+
+        Returns:
+            LocalTokenVerifier: New Local Verifier.
+        """
+        with open(public_keys_file, encoding="utf-8") as keys_file:
+            public_keys = keys_file.read()
+        if public_keys.lstrip().startswith("{"):
+            public_keys = json.loads(public_keys)
+        return cls(public_keys)
+
+    def decode(self, id_token: str) -> dict:
+        """Method to decode an ID Token, checking its signature, expiry, audience and issuer.
+
+        Args:
+            id_token (str): Encoded ID Token.
+
+        Raises:
+            ValueError: If the token is not a valid local token.
+
+        Returns:
+            dict: Decoded claims of the token.
+        """
+        claims = jwt.decode(
+            id_token,
+            certs=self.public_keys,
+            audience=LOCAL_TOKEN_ISSUER,
+            clock_skew_in_seconds=CLOCK_SKEW_SECONDS,
+        )
+        if claims.get("iss") != LOCAL_TOKEN_ISSUER:
+            raise ValueError(
+                f"Token issued by {claims.get('iss')} instead of the local issuer"
+            )
+        return claims
+
+    def verify(self, id_token: str) -> dict:
+        return verify_cached_token(id_token, self.decode, self.namespace)
+
+
+def create_token_verifier() -> TokenVerifier:
+    """Function to create the Verifier configured by the environment.
+
+    Raises:
+        ValueError: If the Verifier is unknown, or the Local Verifier has no key file.
+
+    Returns:
+        TokenVerifier: Configured Verifier.
+    """
+    verifier_name = environ.get("AUTH_VERIFIER", "firebase").lower()
+    if verifier_name == "firebase":
+        return FirebaseTokenVerifier()
+    if verifier_name == "local":
+        public_keys_file = environ.get("LOCAL_JWT_PUBLIC_KEYS_FILE")
+        if not public_keys_file:
+            raise ValueError(
+                "LOCAL_JWT_PUBLIC_KEYS_FILE must be set to use the local Verifier"
+            )
+        return LocalTokenVerifier.from_file(public_keys_file)
+    raise ValueError(f"Unknown Auth Verifier: {verifier_name}")
+
+
+def get_token_verifier() -> TokenVerifier:
+    """Function to get the Verifier of the current process, creating it on first use.
+
+    Returns:
+        TokenVerifier: Configured Verifier.
+    """
+    with _token_verifier_lock:
+        if _token_verifier["verifier"] is None:
+            _token_verifier["verifier"] = create_token_verifier()
+        return _token_verifier["verifier"]
+
+
+def generate_local_keys(key_size: int = 2048) -> Tuple[str, str]:
+    """Function to generate a key pair for signing the local tokens.
+
+    Args:
+        key_size (int): Size of the RSA key in bits.
+
+    Returns:
+        Tuple[str, str]: Private and public keys in PKCS#1 PEM format.
+    """
+    if serialization is None:
+        public_key, private_key = rsa.newkeys(key_size)
+        return (
+            private_key.save_pkcs1().decode("utf-8"),
+            public_key.save_pkcs1().decode("utf-8"),
+        )
+
+    private_key = rsa.generate_private_key(public_exponent=65537, key_size=key_size)
+    return (
+        private_key.private_bytes(
+            serialization.Encoding.PEM,
+            serialization.PrivateFormat.TraditionalOpenSSL,
+            serialization.NoEncryption(),
+        ).decode("utf-8"),
+        private_key.public_key()
+        .public_bytes(serialization.Encoding.PEM, serialization.PublicFormat.PKCS1)
+        .decode("utf-8"),
+    )
+
+
+def load_local_signer(private_key_file: str, key_id: str = LOCAL_KEY_ID):
+    """Function to load the signer of the local tokens.
+
+    Args:
+        private_key_file (str): Path of the private key, in PEM format.
+        key_id (str): Key ID written in the header of the tokens.
+
+    Returns:
+        crypt.Signer: Signer of the local tokens.
+    """
+    with open(private_key_file, encoding="utf-8") as key_file:
+        return crypt.RSASigner.from_string(key_file.read(), key_id)
+
+
+def mint_local_token(
+    signer,
+    user_id,
+    expires_in: int = 3600,
+    clock: Callable[[], float] = time.time,
+) -> str:
+    """Function to mint a local token for a User.
+
+    Args:
+        signer (crypt.Signer): Signer of the local tokens.
+        user_id (UUID | str): ID of the User.
+        expires_in (int): Seconds until the token expires.
+        clock (Callable[[], float]): Function returning the current time in seconds.
+
+    Returns:
+        str: Encoded token.
+    """
+    issued_at = int(clock())
+    return jwt.encode(
+        signer,
+        {
+            "iss": LOCAL_TOKEN_ISSUER,
+            "aud": LOCAL_TOKEN_ISSUER,
+            "sub": str(user_id),
+            "user_id": str(user_id),
+            "iat": issued_at,
+            "exp": issued_at + expires_in,
+        },
+    ).decode("utf-8")
@@ -0,0 +1,180 @@
+# -*- coding: utf-8 -*-
+"""Module containing the Cache of the serialized Triggered Adaptative Events.
+
+The Events an Adaptative Object triggers for a User only change when the Evidence or
+the Learning Style of the User, the Domain Model or the Adaptation Rules change. Every
+cached response is stamped with the Evidence, Learning Style, Domain and Rules Versions
+it was computed for, and is only served while all of them are current. Entries are kept per process, evicted least
+recently used first, and their total size is capped.
+
+Returns:
+    function: Functions for reading the cached Triggered Adaptative Events and comparing them.
+"""
+
+import json
+from collections import OrderedDict
+from threading import Lock
+from typing import Callable, Dict, List
+from uuid import UUID
+
+from flask_sqlalchemy.model import Model
+from src.services.utils.helpers.conditional_request.conditional_request import (
+    compute_etag,
+)
+from src.services.utils.helpers.version_counter.version_counter import (
+    DOMAIN_VERSION,
+    RULES_VERSION,
+    get_evidence_counter_name,
+    get_learning_style_counter_name,
+    get_versions,
+)
+
+# Maximum size (In bytes of serialized JSON) of the cached responses kept per process.
+MAX_TRIGGERED_EVENTS_CACHE_BYTES = 16 * 1024 * 1024
+
+# NOTE: The least recently used responses are evicted first.
+_triggered_events_cache = OrderedDict()
+_triggered_events_cache_lock = Lock()
+_triggered_events_cache_size = {"bytes": 0}
+
+
+def triggered_events_versions(models: Dict[str, Model], user_id: UUID) -> tuple:
+    """Function to read the Versions the Triggered Adaptative Events of a User depend on.
+
+    Args:
+        models (Dict[str,Model]): Dictionary containing all models defined in the Database.
+        user_id (UUID): ID of the User.
+
+    Returns:
+        tuple: Evidence and Learning Style Versions of the User, Domain Version and
+        Rules Version.
+    """
+    evidence_counter_name = get_evidence_counter_name(user_id)
+    learning_style_counter_name = get_learning_style_counter_name(user_id)
+    versions = get_versions(
+        models,
+        [
+            evidence_counter_name,
+            learning_style_counter_name,
+            DOMAIN_VERSION,
+            RULES_VERSION,
+        ],
+    )
+    return (
+        versions[evidence_counter_name],
+        versions[learning_style_counter_name],
+        versions[DOMAIN_VERSION],
+        versions[RULES_VERSION],
+    )
+
+
+def triggered_events_etag(
+    user_id: UUID, adaptative_object_id: UUID, versions: tuple
+) -> str:
+    """Function to compute the ETag of the Triggered Adaptative Events of an Adaptative Object.
+
+    Args:
+        user_id (UUID): ID of the User.
+        adaptative_object_id (UUID): ID of the Adaptative Object.
+        versions (tuple): Versions returned by triggered_events_versions.
+
+    Returns:
+        str: Unquoted ETag.
+    """
+    return compute_etag("triggered_events", user_id, adaptative_object_id, *versions)
+
+
+def _evict_triggered_events(cache_key: tuple):
+    """Function to drop a cached response. Must be called holding the cache lock."""
+    entry = _triggered_events_cache.pop(cache_key, None)
+    if entry is not None:
+        _triggered_events_cache_size["bytes"] -= entry["size"]
+
+
+def cached_triggered_adaptative_events(
+    models: Dict[str, Model],
+    user_id: UUID,
+    adaptative_object_id: UUID,
+    compute_triggered_adaptative_events: Callable[[], List[dict]],
+    versions: tuple = None,
+) -> List[dict]:
+    """Function to get the serialized Triggered Adaptative Events, computing them only if they are stale.
+
+    Args:
+        models (Dict[str,Model]): Dictionary containing all models defined in the Database.
+        user_id (UUID): ID of the User.
+        adaptative_object_id (UUID): ID of the Adaptative Object.
+        compute_triggered_adaptative_events (Callable[[], List[dict]]): Function that
+            computes and serializes the Triggered Adaptative Events on a miss.
+        versions (tuple): Versions returned by triggered_events_versions, if the caller
+            already read them. Otherwise they are read here.
+
+    Returns:
+        List[dict]: Serialized Triggered Adaptative Events.
+    """
+    cache_key = (user_id, adaptative_object_id)
+    # NOTE: We read the versions before computing the Events. If any of them changes
+    # meanwhile, the next request will see a newer version and compute them again.
+    if versions is None:
+        versions = triggered_events_versions(models, user_id)
+    with _triggered_events_cache_lock:
+        entry = _triggered_events_cache.get(cache_key)
+        if entry is not None and entry["versions"] == versions:
+            _triggered_events_cache.move_to_end(cache_key)
+            return entry["triggered_adaptative_events"]
+
+    triggered_adaptative_events = compute_triggered_adaptative_events()
+    size = len(json.dumps(triggered_adaptative_events, default=str))
+
+    with _triggered_events_cache_lock:
+        _evict_triggered_events(cache_key)
+        if size <= MAX_TRIGGERED_EVENTS_CACHE_BYTES:
+            _triggered_events_cache[cache_key] = {
+                "versions": versions,
+                "size": size,
+                "triggered_adaptative_events": triggered_adaptative_events,
+            }
+            _triggered_events_cache_size["bytes"] += size
+        while _triggered_events_cache_size["bytes"] > MAX_TRIGGERED_EVENTS_CACHE_BYTES:
+            _evict_triggered_events(next(iter(_triggered_events_cache)))
+    return triggered_adaptative_events
+
+
+def triggered_events_diff(
+    previous_events: Dict[str, List[dict]], current_events: Dict[str, List[dict]]
+) -> Dict[str, dict]:
+    """Function to find the Triggered Adaptative Events added and removed on every Adaptative Object.
+
+    Args:
+        previous_events (Dict[str, List[dict]]): Serialized Events of every Adaptative Object before.
+        current_events (Dict[str, List[dict]]): Serialized Events of every Adaptative Object now.
+
+    Returns:
+        Dict[str, dict]: The "added" Events and the "removed" Event IDs of every Adaptative
+            Object that changed. Events whose content changed are sent again as added.
+    """
+    diff = {}
+    for adaptative_object_id in previous_events.keys() | current_events.keys():
+        previous_object_events = {
+            event["id"]: event
+            for event in previous_events.get(adaptative_object_id, [])
+        }
+        current_object_events = {
+            event["id"]: event for event in current_events.get(adaptative_object_id, [])
+        }
+        added_events = [
+            event
+            for event_id, event in current_object_events.items()
+            if previous_object_events.get(event_id) != event
+        ]
+        removed_event_ids = [
+            event_id
+            for event_id in previous_object_events
+            if event_id not in current_object_events
+        ]
+        if added_events or removed_event_ids:
+            diff[adaptative_object_id] = {
+                "added": added_events,
+                "removed": removed_event_ids,
+            }
+    return diff
@@ -0,0 +1,208 @@
+# -*- coding: utf-8 -*-
+"""Module containing the Helper Functions to push the changes of the Triggered Adaptative Events.
+
+A stream is a Server-Sent Events response driven by the Versions the Triggered Adaptative
+Events of a User depend on (See triggered_events_versions). The ID of every message holds
+the Versions it was computed for and the Events the client was sent, so a client that
+reconnects with Last-Event-ID resumes the stream on any worker:
+    - If no Version changed, nothing is evaluated and no message is sent.
+    - If only the Evidence or the Learning Style changed (e.g. after a fired Interaction
+      or a Test Attempt was committed), the Events are evaluated once and only the Events
+      added or removed on every Adaptative Object are pushed ("diff").
+    - Otherwise, every Event is pushed ("snapshot").
+
+NOTE: Streams are bounded, so they never pin a worker. On the sync workers of uWSGI a
+stream closes right after checking the Versions, and the client reconnects after
+STREAM_RETRY_MILLISECONDS. On cooperative (gevent) workers, a stream waits up to
+STREAM_MAX_WAIT_SECONDS for a Version to change before closing.
+
+Returns:
+    function: Functions for streaming the changes of the Triggered Adaptative Events.
+"""
+
+import base64
+import json
+import time
+from typing import Callable, Dict, Iterator, List, Optional, Set, Tuple
+from uuid import UUID
+
+from src.services.utils.helpers.triggered_events_cache.triggered_events_cache import (
+    triggered_events_diff,
+)
+
+try:
+    from gevent import monkey
+except ImportError:
+    monkey = None
+
+# Milliseconds the client waits before reconnecting to a closed stream.
+STREAM_RETRY_MILLISECONDS = 2000
+
+# Seconds a stream waits for a Version to change on cooperative workers.
+STREAM_MAX_WAIT_SECONDS = 25
+
+# Seconds between every read of the Versions of a waiting stream.
+STREAM_POLL_INTERVAL_SECONDS = 1
+
+# Maximum length of a message ID. Larger sets of Events are not kept in the ID, and the
+# next change is pushed as a snapshot.
+MAX_STREAM_EVENT_ID_LENGTH = 4096
+
+
+def cooperative_workers() -> bool:
+    """Function to check if the workers serve many requests at once (gevent).
+
+    Returns:
+        bool: True if the blocking calls of the process were patched by gevent.
+    """
+    return monkey is not None and monkey.is_module_patched("socket")
+
+
+def format_server_sent_event(event: str, data, event_id: str = None) -> str:
+    """Function to format a message of the Server-Sent Events protocol.
+
+    Args:
+        event (str): Name of the event.
+        data (Any): JSON serializable payload of the event.
+        event_id (str): ID of the event (Sent back by the client as Last-Event-ID).
+
+    Returns:
+        str: Formatted message.
+    """
+    message = f"event: {event}\n"
+    if event_id is not None:
+        message += f"id: {event_id}\n"
+    return message + f"data: {json.dumps(data, default=str)}\n\n"
+
+
+def encode_stream_event_id(
+    versions: tuple, triggered_adaptative_events: Dict[str, List[dict]]
+) -> str:
+    """Function to build the ID of a message from its Versions and the Events the client holds.
+
+    Args:
+        versions (tuple): Versions returned by triggered_events_versions.
+        triggered_adaptative_events (Dict[str, List[dict]]): Serialized Events of every
+            Adaptative Object.
+
+    Returns:
+        str: Message ID.
+    """
+    event_id = ".".join(map(str, versions))
+    triggered_event_ids = b"".join(
+        UUID(adaptative_object_id).bytes + UUID(str(adaptative_event["id"])).bytes
+        for adaptative_object_id, adaptative_events in triggered_adaptative_events.items()
+        for adaptative_event in adaptative_events
+    )
+    encoded_event_ids = base64.urlsafe_b64encode(triggered_event_ids).decode()
+    if len(event_id) + len(encoded_event_ids) + 1 > MAX_STREAM_EVENT_ID_LENGTH:
+        return event_id
+    return f"{event_id}.{encoded_event_ids}"
+
+
+def decode_stream_event_id(
+    event_id: Optional[str],
+) -> Tuple[Optional[tuple], Optional[Dict[str, Set[str]]]]:
+    """Function to read the Versions and the Events the client holds from the ID of a message.
+
+    Args:
+        event_id (Optional[str]): Last-Event-ID sent by the client.
+
+    Returns:
+        Tuple[Optional[tuple], Optional[Dict[str, Set[str]]]]: Versions of the message, and
+            the IDs of the Events of every Adaptative Object. None if they are unknown.
+    """
+    if not event_id:
+        return None, None
+    parts = event_id.split(".")
+    try:
+        versions = tuple(int(version) for version in parts[:4])
+        if len(versions) != 4 or len(parts) > 5:
+            return None, None
+        if len(parts) == 4:
+            return versions, None
+        triggered_event_ids = base64.urlsafe_b64decode(parts[4].encode())
+    except ValueError:
+        return None, None
+    if len(triggered_event_ids) % 32:
+        return versions, None
+
+    previous_event_ids = {}
+    for offset in range(0, len(triggered_event_ids), 32):
+        adaptative_object_id = str(
+            UUID(bytes=triggered_event_ids[offset : offset + 16])
+        )
+        previous_event_ids.setdefault(adaptative_object_id, set()).add(
+            str(UUID(bytes=triggered_event_ids[offset + 16 : offset + 32]))
+        )
+    return versions, previous_event_ids
+
+
+def stream_triggered_events_changes(
+    versions: tuple,
+    read_versions: Callable[[], tuple],
+    compute_triggered_adaptative_events: Callable[[tuple], Dict[str, List[dict]]],
+    last_event_id: str = None,
+    end_transaction: Callable[[], None] = None,
+    max_wait: float = 0,
+    sleep: Callable[[float], None] = time.sleep,
+    clock: Callable[[], float] = time.monotonic,
+) -> Iterator[str]:
+    """Function to stream the change of the Triggered Adaptative Events since the last message of a client.
+
+    Args:
+        versions (tuple): Versions already read by the caller (See triggered_events_versions).
+        read_versions (Callable[[], tuple]): Function that reads the Versions again.
+        compute_triggered_adaptative_events (Callable[[tuple], Dict[str, List[dict]]]):
+            Function that evaluates and serializes the Events of every Adaptative Object
+            for the given Versions.
+        last_event_id (str): Last-Event-ID sent by the client, if it is resuming the stream.
+        end_transaction (Callable[[], None]): Function called before waiting, so that no
+            connection is held idle in a transaction.
+        max_wait (float): Seconds to wait for a Version to change.
+        sleep (Callable[[float], None]): Function used to wait between the reads.
+        clock (Callable[[], float]): Monotonic clock in seconds.
+
+    Yields:
+        str: Server-Sent Events messages.
+    """
+    yield f"retry: {STREAM_RETRY_MILLISECONDS}\n\n"
+    last_versions, previous_event_ids = decode_stream_event_id(last_event_id)
+    started_at = clock()
+    while versions == last_versions and clock() - started_at < max_wait:
+        if end_transaction is not None:
+            end_transaction()
+        sleep(STREAM_POLL_INTERVAL_SECONDS)
+        versions = read_versions()
+    if versions == last_versions:
+        return
+
+    triggered_adaptative_events = compute_triggered_adaptative_events(versions)
+    event_id = encode_stream_event_id(versions, triggered_adaptative_events)
+    # NOTE: The content of the Events only changes with the Domain or the Rules, so the
+    # client only needs the IDs of the Events it holds to find the diff.
+    if previous_event_ids is None or last_versions[2:] != versions[2:]:
+        yield format_server_sent_event(
+            "snapshot", triggered_adaptative_events, event_id
+        )
+        return
+
+    previous_events = {}
+    for adaptative_object_id, event_ids in previous_event_ids.items():
+        current_events = {
+            str(adaptative_event["id"]): adaptative_event
+            for adaptative_event in triggered_adaptative_events.get(
+                adaptative_object_id, []
+            )
+        }
+        previous_events[adaptative_object_id] = [
+            current_events.get(previous_event_id, {"id": previous_event_id})
+            for previous_event_id in event_ids
+        ]
+    diff = triggered_events_diff(previous_events, triggered_adaptative_events)
+    if diff:
+        yield format_server_sent_event("diff", diff, event_id)
+    else:
+        # NOTE: A message without data is not dispatched, but still moves the
+        # Last-Event-ID of the client to the current Versions.
+        yield f"id: {event_id}\n\n"
@@ -0,0 +1,332 @@
+# -*- coding: utf-8 -*-
+"""Module containing the Helper Functions to read and write the User Knowledge Snapshots.
+
+A User Knowledge Snapshot materializes the estimated Knowledge of a User for every Topic
+and Template, stamped with the Domain and Evidence Versions it was computed for, so that
+any worker can answer a read without recomputing the whole network.
+
+NOTE: Snapshots are written on their own connection, so that writing them never commits
+(Or expires the instances of) the session of the current request. Inside of a request,
+the write is deferred until the response is closed, after the session of the request
+released its connection, so that a request never holds two connections of the pool.
+A failed write only loses the Snapshot, never the response.
+
+Returns:
+    function: Functions for reading and writing the User Knowledge Snapshots.
+"""
+
+from typing import Callable, Dict, Iterable, List, Optional
+
+import numpy as np
+from flask import after_this_request, has_request_context
+from flask_sqlalchemy import SQLAlchemy
+from flask_sqlalchemy.model import Model
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.exc import SQLAlchemyError
+from src.services.utils.helpers.cohort_knowledge_evidence_loader.cohort_knowledge_evidence_loader import (
+    cohort_knowledge_evidence_loader,
+)
+from src.services.utils.helpers.domain_knowledge_graph.domain_knowledge_graph import (
+    domain_knowledge_graph,
+)
+from src.services.utils.helpers.knowledge_inference_engine.knowledge_inference_engine import (
+    KnowledgeEstimation,
+    compiled_knowledge_inference_engine,
+    evaluate_knowledge_inference_engine_batch,
+    knowledge_evidence_matrix,
+)
+from src.services.utils.helpers.version_counter.version_counter import (
+    DOMAIN_VERSION,
+    get_evidence_counter_name,
+    get_version,
+    get_versions,
+)
+
+# Maximum number of Snapshot rows written per statement.
+SNAPSHOT_BATCH_SIZE = 1000
+
+
+def user_knowledge_snapshot_rows(
+    user_id,
+    domain_version: int,
+    evidence_version: int,
+    inference_engine: dict,
+    knowledge_estimation: KnowledgeEstimation,
+    node_indexes: Iterable[int],
+) -> List[dict]:
+    """Function to build the Snapshot rows of the given nodes.
+
+    NOTE: Only the Topics and Templates with an estimated Knowledge are included.
+
+    Args:
+        user_id (UUID): ID of the User.
+        domain_version (int): Domain Version the estimation was computed for.
+        evidence_version (int): Evidence Version the estimation was computed for.
+        inference_engine (dict): Compiled Engine used to build the estimation.
+        knowledge_estimation (KnowledgeEstimation): Estimated Knowledge of the User.
+        node_indexes (Iterable[int]): Indexes of the nodes to include.
+
+    Returns:
+        List[dict]: Snapshot rows of the nodes.
+    """
+    return [
+        {
+            "user_id": user_id,
+            "node_id": inference_engine["node_ids"][index],
+            "entity_type": inference_engine["entity_types"][index],
+            "expected_knowledge": float(knowledge_estimation.expected_knowledge[index]),
+            "evidence_observed": bool(knowledge_estimation.evidence_observed[index]),
+            "domain_version": domain_version,
+            "evidence_version": evidence_version,
+        }
+        for index in node_indexes
+        if inference_engine["latent"][index]
+        and not np.isnan(knowledge_estimation.expected_knowledge[index])
+    ]
+
+
+def _upsert_user_knowledge_snapshot_rows(connection, table, rows: List[dict]):
+    """Function to insert or update Snapshot rows, never replacing a newer row."""
+    # NOTE: We write the rows in batches to stay below the limit of bound parameters.
+    for start in range(0, len(rows), SNAPSHOT_BATCH_SIZE):
+        statement = insert(table).values(rows[start : start + SNAPSHOT_BATCH_SIZE])
+        statement = statement.on_conflict_do_update(
+            constraint="unique_user_knowledge_snapshot",
+            set_={
+                "entity_type": statement.excluded.entity_type,
+                "expected_knowledge": statement.excluded.expected_knowledge,
+                "evidence_observed": statement.excluded.evidence_observed,
+                "domain_version": statement.excluded.domain_version,
+                "evidence_version": statement.excluded.evidence_version,
+            },
+            where=(table.c.domain_version <= statement.excluded.domain_version)
+            & (table.c.evidence_version <= statement.excluded.evidence_version),
+        )
+        connection.execute(statement)
+
+
+def _write_user_knowledge_snapshot(
+    models: Dict[str, Model],
+    write: Callable[[object], None],
+    on_error: Callable[[], None] = None,
+):
+    """Function to run a Snapshot write in its own transaction, after the current request if there is one."""
+    # NOTE: The Engine is read now, because the Application Context is gone once the
+    # response is closed.
+    engine = models["UserKnowledgeSnapshot"].query.session.get_bind()
+
+    def run_write():
+        try:
+            with engine.begin() as connection:
+                write(connection)
+        except SQLAlchemyError:
+            if on_error is not None:
+                on_error()
+
+    if not has_request_context():
+        run_write()
+        return
+
+    @after_this_request
+    def write_after_response(response):
+        response.call_on_close(run_write)
+        return response
+
+
+def load_user_knowledge_snapshot(
+    models: Dict[str, Model],
+    user_id,
+    domain_version: int,
+    evidence_version: int,
+    node_ids: Iterable,
+) -> Optional[dict]:
+    """Function to read the current Snapshot of some Topics and Templates of a User.
+
+    Args:
+        models (Dict[str,Model]): Dictionary containing all models defined in the Database.
+        user_id (UUID): ID of the User.
+        domain_version (int): Current Domain Version.
+        evidence_version (int): Current Evidence Version of the User.
+        node_ids (Iterable): IDs of the Topics and Templates to read.
+
+    Returns:
+        Optional[dict]: Dictionary from Node ID to its expected_knowledge and evidence_observed.
+        None if any of the nodes has no current Snapshot.
+    """
+    node_ids = set(node_ids)
+    snapshots = (
+        models["UserKnowledgeSnapshot"]
+        .query.filter(
+            models["UserKnowledgeSnapshot"].user_id == user_id,
+            models["UserKnowledgeSnapshot"].node_id.in_(node_ids),
+            models["UserKnowledgeSnapshot"].domain_version == domain_version,
+            models["UserKnowledgeSnapshot"].evidence_version == evidence_version,
+        )
+        .with_entities(
+            models["UserKnowledgeSnapshot"].node_id,
+            models["UserKnowledgeSnapshot"].expected_knowledge,
+            models["UserKnowledgeSnapshot"].evidence_observed,
+        )
+        .all()
+    )
+    if len(snapshots) < len(node_ids):
+        return None
+    return {
+        node_id: {
+            "expected_knowledge": expected_knowledge,
+            "evidence_observed": evidence_observed,
+        }
+        for node_id, expected_knowledge, evidence_observed in snapshots
+    }
+
+
+def store_user_knowledge_snapshot(
+    models: Dict[str, Model],
+    user_id,
+    domain_version: int,
+    evidence_version: int,
+    inference_engine: dict,
+    knowledge_estimation: KnowledgeEstimation,
+    connection=None,
+):
+    """Function to write the Snapshot of every Topic and Template of a User.
+
+    NOTE: Without a connection, the Snapshot is written after the current request.
+
+    Args:
+        models (Dict[str,Model]): Dictionary containing all models defined in the Database.
+        user_id (UUID): ID of the User.
+        domain_version (int): Domain Version the estimation was computed for.
+        evidence_version (int): Evidence Version the estimation was computed for.
+        inference_engine (dict): Compiled Engine used to build the estimation.
+        knowledge_estimation (KnowledgeEstimation): Estimated Knowledge of the User.
+        connection (Connection): Connection to write with. A new transaction is used if not given.
+    """
+    rows = user_knowledge_snapshot_rows(
+        user_id,
+        domain_version,
+        evidence_version,
+        inference_engine,
+        knowledge_estimation,
+        range(inference_engine["size"]),
+    )
+    table = models["UserKnowledgeSnapshot"].__table__
+    if connection is not None:
+        _upsert_user_knowledge_snapshot_rows(connection, table, rows)
+        return
+    _write_user_knowledge_snapshot(
+        models,
+        lambda connection: _upsert_user_knowledge_snapshot_rows(
+            connection, table, rows
+        ),
+    )
+
+
+def update_user_knowledge_snapshot(
+    models: Dict[str, Model],
+    user_id,
+    domain_version: int,
+    evidence_version: int,
+    rows: List[dict],
+    node_ids: Iterable = None,
+    on_error: Callable[[], None] = None,
+):
+    """Function to move the Snapshot of a User one Evidence Version forward, after the current request.
+
+    NOTE: Only the rows of the recomputed nodes are rewritten. The rest of the rows of the
+    previous Evidence Version are still current, so only their version stamp is moved.
+    If the estimation only evaluated some nodes, the rows of the other nodes are left
+    behind, because the new Evidence may have changed them.
+
+    Args:
+        models (Dict[str,Model]): Dictionary containing all models defined in the Database.
+        user_id (UUID): ID of the User.
+        domain_version (int): Domain Version the estimation was computed for.
+        evidence_version (int): New Evidence Version of the User.
+        rows (List[dict]): Snapshot rows of the recomputed nodes (See
+            user_knowledge_snapshot_rows).
+        node_ids (Iterable): IDs of the Topics and Templates the estimation evaluated.
+            Every one of them if not given.
+        on_error (Callable[[], None]): Function called if the Snapshot cannot be written.
+    """
+    table = models["UserKnowledgeSnapshot"].__table__
+    current_rows = (
+        table.c.user_id == user_id,
+        table.c.domain_version == domain_version,
+        table.c.evidence_version == evidence_version - 1,
+    )
+    if node_ids is not None:
+        current_rows += (table.c.node_id.in_(list(node_ids)),)
+
+    def write(connection):
+        connection.execute(
+            table.update()
+            .where(*current_rows)
+            .values(evidence_version=evidence_version)
+        )
+        _upsert_user_knowledge_snapshot_rows(connection, table, rows)
+
+    _write_user_knowledge_snapshot(models, write, on_error)
+
+
+def rebuild_user_knowledge_snapshots(
+    db: SQLAlchemy, models: Dict[str, Model], batch_size: int = 500
+) -> int:
+    """Function to rebuild the Snapshots of every User (e.g. after a content migration).
+
+    Args:
+        db (SQLAlchemy): Database Object containing the Models.
+        models (Dict[str,Model]): Dictionary containing all models defined in the Database.
+        batch_size (int): Number of Users whose Evidence is loaded at once.
+
+    Returns:
+        int: Number of Users whose Snapshots were rebuilt.
+    """
+    # NOTE: We read the versions before loading the Domain and the Evidence, so that
+    # Snapshots built from data that changed meanwhile are already stale.
+    domain_version = get_version(models, DOMAIN_VERSION)
+    inference_engine = compiled_knowledge_inference_engine(
+        domain_knowledge_graph(models, domain_version)
+    )
+    user_ids = [
+        user_id
+        for (user_id,) in models["User"]
+        .query.with_entities(models["User"].id)
+        .order_by(models["User"].id)
+        .all()
+    ]
+
+    for start in range(0, len(user_ids), batch_size):
+        batch_user_ids = user_ids[start : start + batch_size]
+        evidence_versions = get_versions(
+            models, [get_evidence_counter_name(user_id) for user_id in batch_user_ids]
+        )
+        knowledge_evidence = cohort_knowledge_evidence_loader(models, batch_user_ids)
+        # NOTE: The Knowledge of the whole batch is estimated in a single pass.
+        evidence_observed = knowledge_evidence_matrix(
+            inference_engine,
+            [
+                knowledge_evidence[user_id]["passed_practice_tests"]
+                | knowledge_evidence[user_id]["fired_interactions"]
+                for user_id in batch_user_ids
+            ],
+        )
+        expected_knowledge = evaluate_knowledge_inference_engine_batch(
+            inference_engine, evidence_observed
+        )
+        with db.engine.begin() as connection:
+            for row, user_id in enumerate(batch_user_ids):
+                store_user_knowledge_snapshot(
+                    models,
+                    user_id,
+                    domain_version,
+                    evidence_versions[get_evidence_counter_name(user_id)],
+                    inference_engine,
+                    KnowledgeEstimation(
+                        inference_engine["node_index"],
+                        expected_knowledge[row],
+                        evidence_observed[row],
+                    ),
+                    connection=connection,
+                )
+    return len(user_ids)
@@ -0,0 +1,226 @@
+# -*- coding: utf-8 -*-
+"""Module containing the Helper Functions to keep the Knowledge State of every User.
+
+The Knowledge State of a User is the estimation of the Inference Engine for the
+Evidence the User has observed. It is kept per process, stamped with the Domain and
+Evidence Versions it was computed for. Reads only recompute it when one of those
+versions changed, and writes of new Evidence re-propagate only the affected subgraph.
+Every recomputation and update is also materialized as a User Knowledge Snapshot,
+so that other workers can answer reads of a few nodes without recomputing. Reads of a
+few nodes that miss both only evaluate the ancestor closure of those nodes, and keep
+it as a state that new Evidence is propagated through. Later reads of other nodes
+extend the closure of the state.
+
+Returns:
+    function: Functions for reading and updating the users Knowledge State.
+"""
+
+from collections import OrderedDict
+from threading import Lock
+from collections.abc import Mapping
+from typing import Dict, Iterable
+
+import numpy as np
+from flask_sqlalchemy.model import Model
+from src.services.utils.helpers.domain_knowledge_graph.domain_knowledge_graph import (
+    domain_knowledge_graph,
+)
+from src.services.utils.helpers.knowledge_evidence_loader.knowledge_evidence_loader import (
+    knowledge_evidence_loader,
+)
+from src.services.utils.helpers.knowledge_inference_engine.knowledge_inference_engine import (
+    KnowledgeEstimation,
+    compiled_knowledge_inference_engine,
+    evaluate_knowledge_inference_engine,
+    knowledge_ancestor_closure,
+    propagate_knowledge_evidence,
+)
+from src.services.utils.helpers.user_knowledge_snapshot.user_knowledge_snapshot import (
+    load_user_knowledge_snapshot,
+    store_user_knowledge_snapshot,
+    update_user_knowledge_snapshot,
+    user_knowledge_snapshot_rows,
+)
+from src.services.utils.helpers.version_counter.version_counter import (
+    DOMAIN_VERSION,
+    get_evidence_counter_name,
+    get_versions,
+)
+
+# Maximum number of User Knowledge States kept per process.
+MAX_USER_KNOWLEDGE_STATES = 1024
+
+# NOTE: The least recently used states are evicted first.
+_user_knowledge_states = OrderedDict()
+_user_knowledge_states_lock = Lock()
+
+
+def _state_covers(state: dict, node_ids: Iterable) -> bool:
+    """Function to check whether a Knowledge State estimated every requested node."""
+    if state["evaluated_nodes"] is None:
+        return True
+    if node_ids is None:
+        return False
+    node_index = state["inference_engine"]["node_index"]
+    # NOTE: Nodes created after the Domain Version was read are not in the Engine yet.
+    return all(
+        state["evaluated_nodes"][node_index[node_id]]
+        for node_id in node_ids
+        if node_id in node_index
+    )
+
+
+def user_knowledge_state(
+    models: Dict[str, Model], current_user, node_ids: Iterable = None
+) -> Mapping:
+    """Function to get the Knowledge State of the User, recomputing it only if it is stale.
+
+    Args:
+        models (Dict[str,Model]): Dictionary containing all models defined in the Database.
+        current_user (): Instance of the Currently Authenticated User
+        node_ids (Iterable): IDs of the Topics and Templates the caller needs. If given, a
+            current User Knowledge Snapshot of those nodes is used before recomputing,
+            and only their ancestor closure is recomputed.
+
+    Returns:
+        Mapping: Estimated Knowledge of the Topics and Templates (At least the requested
+        ones if node_ids is given, every one of them otherwise).
+    """
+    evidence_counter_name = get_evidence_counter_name(current_user.id)
+    # NOTE: We read the versions before loading the Domain and the Evidence. If any of
+    # them changes meanwhile, the next request will see a newer version and recompute.
+    versions = get_versions(models, [DOMAIN_VERSION, evidence_counter_name])
+    target_ids = None if node_ids is None else set(node_ids)
+    with _user_knowledge_states_lock:
+        state = _user_knowledge_states.get(current_user.id)
+        if (
+            state is not None
+            and state["domain_version"] == versions[DOMAIN_VERSION]
+            and state["evidence_version"] == versions[evidence_counter_name]
+        ):
+            if _state_covers(state, target_ids):
+                _user_knowledge_states.move_to_end(current_user.id)
+                return state["knowledge_estimation"]
+            # NOTE: The recomputed state keeps estimating the nodes this one did.
+            if target_ids is not None:
+                target_ids |= state["node_ids"]
+
+    if node_ids is not None:
+        knowledge_snapshot = load_user_knowledge_snapshot(
+            models,
+            current_user.id,
+            versions[DOMAIN_VERSION],
+            versions[evidence_counter_name],
+            node_ids,
+        )
+        if knowledge_snapshot is not None:
+            return knowledge_snapshot
+
+    domain_graph = domain_knowledge_graph(models, versions[DOMAIN_VERSION])
+    inference_engine = compiled_knowledge_inference_engine(domain_graph)
+    closure = (
+        None
+        if target_ids is None
+        else knowledge_ancestor_closure(inference_engine, target_ids)
+    )
+    knowledge_evidence = knowledge_evidence_loader(
+        models, current_user, None if closure is None else closure["template_ids"]
+    )
+    knowledge_estimation = evaluate_knowledge_inference_engine(
+        inference_engine,
+        knowledge_evidence["passed_practice_tests"]
+        | knowledge_evidence["fired_interactions"],
+        target_ids,
+    )
+
+    # NOTE: A partial estimation is kept alongside the mask of the nodes it evaluated,
+    # so that new Evidence is only propagated through them. Its Snapshot only has the
+    # rows of those nodes.
+    with _user_knowledge_states_lock:
+        _user_knowledge_states[current_user.id] = {
+            "domain_version": versions[DOMAIN_VERSION],
+            "evidence_version": versions[evidence_counter_name],
+            "inference_engine": inference_engine,
+            "knowledge_estimation": knowledge_estimation,
+            "node_ids": None if target_ids is None else frozenset(target_ids),
+            "evaluated_nodes": None if closure is None else closure["in_closure"],
+        }
+        _user_knowledge_states.move_to_end(current_user.id)
+        while len(_user_knowledge_states) > MAX_USER_KNOWLEDGE_STATES:
+            _user_knowledge_states.popitem(last=False)
+    store_user_knowledge_snapshot(
+        models,
+        current_user.id,
+        versions[DOMAIN_VERSION],
+        versions[evidence_counter_name],
+        inference_engine,
+        knowledge_estimation,
+    )
+    return knowledge_estimation
+
+
+def update_user_knowledge_state(
+    models: Dict[str, Model], user_id, evidence_version: int, evidence_ids: Iterable
+):
+    """Function to apply newly observed Evidence to the Knowledge State of a User.
+
+    NOTE: Must be called after the Evidence and the bumped Evidence Version were committed.
+    If the kept state is not exactly one version behind, it is dropped and the next read
+    recomputes it. If its Snapshot cannot be written, the state is dropped as well, so
+    that the next read recomputes both of them instead of failing the saved Evidence.
+
+    Args:
+        models (Dict[str,Model]): Dictionary containing all models defined in the Database.
+        user_id (UUID): ID of the User.
+        evidence_version (int): Evidence Version returned by bump_version.
+        evidence_ids (Iterable): IDs of the newly observed Evidence nodes.
+    """
+    with _user_knowledge_states_lock:
+        state = _user_knowledge_states.get(user_id)
+        if state is None:
+            return
+        if state["evidence_version"] != evidence_version - 1:
+            del _user_knowledge_states[user_id]
+            return
+        updated_nodes = propagate_knowledge_evidence(
+            state["inference_engine"],
+            state["knowledge_estimation"],
+            {evidence_id: True for evidence_id in evidence_ids},
+            state["evaluated_nodes"],
+        )
+        state["evidence_version"] = evidence_version
+        # NOTE: The rows are built while holding the lock, so that no other thread
+        # updates the estimation meanwhile. They are written after releasing it.
+        rows = user_knowledge_snapshot_rows(
+            user_id,
+            state["domain_version"],
+            evidence_version,
+            state["inference_engine"],
+            state["knowledge_estimation"],
+            updated_nodes,
+        )
+        evaluated_node_ids = (
+            None
+            if state["evaluated_nodes"] is None
+            else [
+                state["inference_engine"]["node_ids"][index]
+                for index in np.flatnonzero(
+                    state["evaluated_nodes"] & state["inference_engine"]["latent"]
+                )
+            ]
+        )
+
+    def drop_state():
+        with _user_knowledge_states_lock:
+            if _user_knowledge_states.get(user_id) is state:
+                del _user_knowledge_states[user_id]
+
+    update_user_knowledge_snapshot(
+        models,
+        user_id,
+        state["domain_version"],
+        evidence_version,
+        rows,
+        evaluated_node_ids,
+        on_error=drop_state,
+    )
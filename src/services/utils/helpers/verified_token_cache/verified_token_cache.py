@@ -0,0 +1,178 @@
+# -*- coding: utf-8 -*-
+"""Module containing the Caches used for verifying the Firebase ID Tokens.
+
+Verifying an ID Token needs the public keys Firebase signs them with, which are
+fetched over HTTP, and an RSA signature check. The keys are kept per process for as
+long as the max-age of their Cache-Control header allows. Already verified tokens
+are kept by their digest, evicted least recently used first, together with their
+decoded claims, until the token expires. Repeated requests with the same token then
+need neither network I/O nor cryptography.
+
+Returns:
+    function: Functions for verifying the Firebase ID Tokens.
+"""
+
+import hashlib
+import json
+import re
+import time
+from collections import OrderedDict
+from threading import Lock
+from typing import Callable, Dict
+
+from google.auth import exceptions, jwt
+from google.auth.transport import Request as TransportRequest
+from src.services.utils.helpers.identity_http_session.identity_http_session import (
+    get_transport_request,
+)
+
+# URL of the public keys (As x509 certificates) Firebase signs the ID Tokens with.
+FIREBASE_CERTS_URL = "https://www.googleapis.com/robot/v1/metadata/x509/securetoken@system.gserviceaccount.com"
+
+# Clock skew (In seconds) tolerated when validating the iat and exp claims.
+CLOCK_SKEW_SECONDS = 60
+
+# Maximum number of verified tokens kept per process.
+MAX_VERIFIED_TOKENS = 1024
+
+_MAX_AGE_PATTERN = re.compile(r"(?:^|,)\s*max-age\s*=\s*(\d+)", re.IGNORECASE)
+
+_firebase_certs_cache = {}
+_firebase_certs_cache_lock = Lock()
+
+# NOTE: The least recently used tokens are evicted first.
+_verified_tokens = OrderedDict()
+_verified_tokens_lock = Lock()
+
+
+def parse_max_age(cache_control: str) -> int:
+    """Function to read the max-age directive of a Cache-Control header.
+
+    Args:
+        cache_control (str): Value of the Cache-Control header.
+
+    Returns:
+        int: Seconds the response may be cached for. 0 if it must not be cached.
+    """
+    if not cache_control or "no-store" in cache_control.lower():
+        return 0
+    match = _MAX_AGE_PATTERN.search(cache_control)
+    return int(match.group(1)) if match else 0
+
+
+def get_firebase_certs(
+    request: TransportRequest = None,
+    certs_url: str = FIREBASE_CERTS_URL,
+    clock: Callable[[], float] = time.time,
+) -> Dict[str, str]:
+    """Function to get the public keys of Firebase, fetching them only if they expired.
+
+    Args:
+        request (TransportRequest): Object used for the HTTP requests. Defaults to
+            the shared Session of the worker process.
+        certs_url (str): URL of the public keys.
+        clock (Callable[[], float]): Function returning the current time in seconds.
+
+    Raises:
+        TransportError: If the public keys could not be fetched.
+
+    Returns:
+        Dict[str, str]: x509 certificate of every key id.
+    """
+    with _firebase_certs_cache_lock:
+        entry = _firebase_certs_cache.get(certs_url)
+        if entry is not None and clock() < entry["expires_at"]:
+            return entry["certs"]
+
+    if request is None:
+        request = get_transport_request()
+    response = request(certs_url, method="GET")
+    if response.status != 200:
+        raise exceptions.TransportError(f"Could not fetch certificates at {certs_url}")
+    certs = json.loads(response.data.decode("utf-8"))
+    max_age = parse_max_age(response.headers.get("Cache-Control"))
+
+    # NOTE: Concurrent misses may fetch the keys more than once, the last one wins.
+    with _firebase_certs_cache_lock:
+        _firebase_certs_cache[certs_url] = {
+            "certs": certs,
+            "expires_at": clock() + max_age,
+        }
+    return certs
+
+
+def verify_cached_token(
+    id_token: str,
+    decode_token: Callable[[str], dict],
+    namespace: str,
+    clock: Callable[[], float] = time.time,
+) -> dict:
+    """Function to verify a token only if it was not already verified.
+
+    Args:
+        id_token (str): Encoded token.
+        decode_token (Callable[[str], dict]): Function that verifies and decodes the
+            token, raising ValueError if it is invalid.
+        namespace (str): Name of the Verifier, so that tokens verified with other
+            keys are never accepted.
+        clock (Callable[[], float]): Function returning the current time in seconds.
+
+    Raises:
+        ValueError: If the token is malformed, expired or its signature is invalid.
+
+    Returns:
+        dict: Decoded claims of the token.
+    """
+    # NOTE: Only the digest is kept, so that the tokens are not held in memory.
+    token_digest = hashlib.sha256(f"{namespace}:{id_token}".encode("utf-8")).digest()
+    with _verified_tokens_lock:
+        entry = _verified_tokens.get(token_digest)
+        if entry is not None:
+            if clock() < entry["expires_at"]:
+                _verified_tokens.move_to_end(token_digest)
+                return dict(entry["claims"])
+            del _verified_tokens[token_digest]
+
+    claims = decode_token(id_token)
+
+    with _verified_tokens_lock:
+        _verified_tokens[token_digest] = {
+            "claims": claims,
+            "expires_at": claims["exp"],
+        }
+        while len(_verified_tokens) > MAX_VERIFIED_TOKENS:
+            _verified_tokens.popitem(last=False)
+    return dict(claims)
+
+
+def verify_firebase_id_token(
+    id_token: str,
+    request: TransportRequest = None,
+    certs_url: str = FIREBASE_CERTS_URL,
+    clock: Callable[[], float] = time.time,
+) -> dict:
+    """Function to verify a Firebase ID Token, skipping the tokens that were already verified.
+
+    Args:
+        id_token (str): Encoded ID Token.
+        request (TransportRequest): Object used for the HTTP requests, if the public
+            keys have to be fetched.
+        certs_url (str): URL of the public keys.
+        clock (Callable[[], float]): Function returning the current time in seconds.
+
+    Raises:
+        ValueError: If the token is malformed, expired or its signature is invalid.
+
+    Returns:
+        dict: Decoded claims of the token.
+    """
+    return verify_cached_token(
+        id_token,
+        lambda token: jwt.decode(
+            token,
+            certs=get_firebase_certs(request, certs_url, clock),
+            clock_skew_in_seconds=CLOCK_SKEW_SECONDS,
+        ),
+        certs_url,
+        clock,
+    )
@@ -0,0 +1,240 @@
+# -*- coding: utf-8 -*-
+"""Module containing the Helper Functions to read and bump the Version Counters.
+
+Version Counters are stored in the Database so that every worker process
+(uWSGI runs several of them) can tell when the data it has cached became stale.
+
+Returns:
+    function: Functions for reading and bumping the Version Counters.
+"""
+
+import uuid
+from datetime import datetime
+from typing import Dict, Iterable
+
+from flask_sqlalchemy import SQLAlchemy
+from flask_sqlalchemy.model import Model
+from sqlalchemy import event
+from sqlalchemy.dialects.postgresql import insert
+
+# Name of the Counter bumped whenever the Domain Model changes.
+DOMAIN_VERSION = "domain"
+
+# Models that make up the Domain Model (The Structure of the Knowledge Network and
+# the Topics, Templates, Pages & Test Questions that own its Adaptative Objects).
+DOMAIN_MODELS = {
+    "LearningContent",
+    "MeasurableInteraction",
+    "Page",
+    "PracticeTest",
+    "Template",
+    "TestQuestion",
+    "Topic",
+    "TopicPrecedence",
+}
+
+# Name of the Counter bumped whenever the Adaptation Rules change.
+RULES_VERSION = "rules"
+
+# Models that make up the Adaptation Rules (The Events and Conditions of every Object).
+RULES_MODELS = {"AdaptationCondition", "AdaptativeEvent"}
+
+# Models whose Content Version is not tracked.
+# NOTE: The Models written by the students (Fired Interactions, Test Attempts, Learning
+# Styles, etc.) are written concurrently by every student, so a single Counter per
+# Model would serialize all of their transactions on one row lock. The responses that
+# serialize them get the ETag of their rows instead (See serialized_etag).
+UNTRACKED_CONTENT_MODELS = {
+    "InteractionFired",
+    "LearningStyle",
+    "QuestionAnswer",
+    "Role",
+    "SelectedAnswerAlternatives",
+    "TestAttempt",
+    "User",
+    "UserKnowledgeSnapshot",
+    "VersionCounter",
+}
+
+
+def get_evidence_counter_name(user_id) -> str:
+    """Function to get the name of the Counter bumped whenever a User observes new Evidence.
+
+    Args:
+        user_id (UUID): ID of the User.
+
+    Returns:
+        str: Name of the Evidence Version Counter of the User.
+    """
+    return f"evidence:{user_id}"
+
+
+def get_learning_style_counter_name(user_id) -> str:
+    """Function to get the name of the Counter bumped whenever the Learning Style of a User changes.
+
+    NOTE: The Learning Styles are not Knowledge Evidence, so they are versioned apart
+    from it and changing them never discards the Knowledge State of the User.
+
+    Args:
+        user_id (UUID): ID of the User.
+
+    Returns:
+        str: Name of the Learning Style Version Counter of the User.
+    """
+    return f"learning_style:{user_id}"
+
+
+def get_content_counter_name(model_name: str) -> str:
+    """Function to get the name of the Counter bumped whenever the rows of a Model change.
+
+    Args:
+        model_name (str): Name of the Model.
+
+    Returns:
+        str: Name of the Content Version Counter of the Model.
+    """
+    return f"content:{model_name}"
+
+
+def get_version(models: Dict[str, Model], counter_name: str) -> int:
+    """Function to read the current value of a Version Counter.
+
+    Args:
+        models (Dict[str,Model]): Dictionary containing all models defined in the Database.
+        counter_name (str): Name of the Version Counter.
+
+    Returns:
+        int: Current value of the Counter. 0 if the Counter was never bumped.
+    """
+    counter_value = (
+        models["VersionCounter"]
+        .query.filter_by(counter_name=counter_name)
+        .with_entities(models["VersionCounter"].counter_value)
+        .scalar()
+    )
+    return counter_value or 0
+
+
+def get_versions(
+    models: Dict[str, Model], counter_names: Iterable[str]
+) -> Dict[str, int]:
+    """Function to read the current value of several Version Counters in a single Query.
+
+    Args:
+        models (Dict[str,Model]): Dictionary containing all models defined in the Database.
+        counter_names (Iterable[str]): Names of the Version Counters.
+
+    Returns:
+        Dict[str, int]: Current value of every Counter. 0 if the Counter was never bumped.
+    """
+    counter_names = list(counter_names)
+    counters = dict(
+        models["VersionCounter"]
+        .query.filter(models["VersionCounter"].counter_name.in_(counter_names))
+        .with_entities(
+            models["VersionCounter"].counter_name,
+            models["VersionCounter"].counter_value,
+        )
+        .all()
+    )
+    return {
+        counter_name: counters.get(counter_name, 0) for counter_name in counter_names
+    }
+
+
+def bump_version(db: SQLAlchemy, counter_name: str) -> int:
+    """Function to increase the value of a Version Counter.
+
+    NOTE: The Counter is bumped inside of the current transaction, so it must
+    be called before the session is committed.
+
+    Args:
+        db (SQLAlchemy): Database Object containing the Models.
+        counter_name (str): Name of the Version Counter.
+
+    Returns:
+        int: New value of the Counter.
+    """
+    # We get the table directly from the metadata, because the generic controllers
+    # only have access to the Database Object.
+    return _bump_session_version(
+        db.session, db.metadata.tables["version_counter"], counter_name
+    )
+
+
+def _bump_session_version(session, version_counter_table, counter_name: str) -> int:
+    """Function to bump a Version Counter inside of the transaction of a session."""
+    statement = insert(version_counter_table).values(
+        id=uuid.uuid4(),
+        created_at=datetime.utcnow(),
+        counter_name=counter_name,
+        counter_value=1,
+    )
+    # NOTE: We use an upsert so that concurrent bumps never lose an increment.
+    statement = statement.on_conflict_do_update(
+        index_elements=[version_counter_table.c.counter_name],
+        set_={"counter_value": version_counter_table.c.counter_value + 1},
+    )
+    return session.execute(
+        statement.returning(version_counter_table.c.counter_value)
+    ).scalar()
+
+
+def bump_domain_version(db: SQLAlchemy, model: Model = None):
+    """Function to bump the Domain Version Counter after a Domain Model change.
+
+    Args:
+        db (SQLAlchemy): Database Object containing the Models.
+        model (Model): Model that was changed. If given, the Counter is only bumped
+            when the Model belongs to the Domain Model.
+    """
+    if model is not None and model.__name__ not in DOMAIN_MODELS:
+        return
+    bump_version(db, DOMAIN_VERSION)
+
+
+def bump_rules_version(db: SQLAlchemy, model: Model = None):
+    """Function to bump the Rules Version Counter after an Adaptation Rule change.
+
+    Args:
+        db (SQLAlchemy): Database Object containing the Models.
+        model (Model): Model that was changed. If given, the Counter is only bumped
+            when the Model belongs to the Adaptation Rules.
+    """
+    if model is not None and model.__name__ not in RULES_MODELS:
+        return
+    bump_version(db, RULES_VERSION)
+
+
+def track_content_versions(db: SQLAlchemy):
+    """Function to bump the Content Version of every Model whose rows are written by a flush.
+
+    NOTE: Statements that bypass the session (Bulk updates) must bump the Content
+    Version of their Model themselves.
+
+    Args:
+        db (SQLAlchemy): Database Object containing the Models.
+    """
+    if event.contains(db.session, "before_flush", _bump_content_versions):
+        return
+    event.listen(db.session, "before_flush", _bump_content_versions)
+
+
+def _bump_content_versions(session, flush_context, instances):
+    """Listener that bumps the Content Versions of the Models about to be flushed."""
+    changed_instances = [
+        *session.new,
+        *session.deleted,
+        *(instance for instance in session.dirty if session.is_modified(instance)),
+    ]
+    changed_models = {
+        type(instance).__name__: type(instance) for instance in changed_instances
+    }
+    # NOTE: The Counters are always bumped in the same order, so that concurrent
+    # transactions never wait for each other's Counters in a cycle.
+    for model_name in sorted(changed_models.keys() - UNTRACKED_CONTENT_MODELS):
+        _bump_session_version(
+            session,
+            changed_models[model_name].metadata.tables["version_counter"],
+            get_content_counter_name(model_name),
+        )
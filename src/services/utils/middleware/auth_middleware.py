@@ -12,8 +12,10 @@ from firebase_admin.auth import (
 )
 from flask import request
 from flask_sqlalchemy import Model
-from google.oauth2.id_token import verify_firebase_token
-from google.auth.transport.requests import Request
+from src.services.utils.helpers.principal_cache.principal_cache import load_principal
+from src.services.utils.helpers.token_verifier.token_verifier import (
+    get_token_verifier,
+)
 
 
 def auth_middleware(
@@ -52,10 +54,7 @@ def auth_middleware(
                         "message": "Unauthorized",
                     }, 401
                 try:
-                    requests = Request()
-                    decoded_token = verify_firebase_token(
-                        id_token=token, request=requests, clock_skew_in_seconds=60
-                    )
+                    decoded_token = get_token_verifier().verify(token)
                 except ValueError:
                     return {
                         "success": False,
@@ -79,7 +78,13 @@ def auth_middleware(
                         "code": {"name": "INVALID_AUTH_HEADER"},
                         "message": "Unauthorized",
                     }, 401
-                current_user = user_model().query.get(uuid)
+                current_user = load_principal(user_model, uuid)
+                if current_user is None:
+                    return {
+                        "success": False,
+                        "code": {"name": "INVALID_AUTH_HEADER"},
+                        "message": "Unauthorized",
+                    }, 401
                 if expected_role == "teacher":
                     if not any(
                         role.role_name == expected_role for role in current_user.role
@@ -8,6 +8,9 @@ from flask_sqlalchemy import SQLAlchemy
 from src.models.index import create_models
 from src.schemas.index import create_schemas
 from src.app import create_app
+from src.services.utils.helpers.version_counter.version_counter import (
+    track_content_versions,
+)
 
 
 def pytest_addoption(parser):
@@ -48,6 +51,7 @@ def models(app, db):
     app.config["SQLALCHEMY_TRACK_MODIFICATIONS"] = False
     app.config["SQLALCHEMY_ECHO"] = False
     model = create_models(db)
+    track_content_versions(db)
     db.drop_all()
     db.create_all()
     return model
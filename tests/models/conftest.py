@@ -415,3 +415,50 @@ def mock_selected_answer_alternatives(
     db.session.add(new_instance)
     db.session.commit()
     return new_instance
+
+
+@pytest.fixture(scope="session")
+def mock_version_counter(models: Dict[str, Model], db):
+    """Fixture to create a mock Version Counter
+
+    Args:
+        models (Dict[str, Model]): Dictionary of all of the models
+        db (DB): Database connection
+
+    Returns:
+        Model: Mock Version Counter
+    """
+    model = models["VersionCounter"]
+    # Create a New Mock Version Counter with a Random name
+    new_instance = model(counter_name=f"counter:{uuid.uuid4()}")
+    db.session.add(new_instance)
+    db.session.commit()
+    return new_instance
+
+
+@pytest.fixture(scope="session")
+def mock_user_knowledge_snapshot(models: Dict[str, Model], db, mock_user):
+    """Fixture to create a mock User Knowledge Snapshot
+
+    Args:
+        models (Dict[str, Model]): Dictionary of all of the models
+        db (DB): Database connection
+        mock_user (Model): Mock User
+
+    Returns:
+        Model: Mock User Knowledge Snapshot
+    """
+    model = models["UserKnowledgeSnapshot"]
+    # Create a New Mock User Knowledge Snapshot for a Random Node
+    new_instance = model(
+        user_id=mock_user.id,
+        node_id=uuid.uuid4(),
+        entity_type="topic",
+        expected_knowledge=0.5,
+        evidence_observed=False,
+        domain_version=1,
+        evidence_version=1,
+    )
+    db.session.add(new_instance)
+    db.session.commit()
+    return new_instance
@@ -32,6 +32,10 @@ class TestLearningStyleModel:
         assert hasattr(model, "aural")
         assert hasattr(model, "kinesthetic")
         assert hasattr(model, "textual")
+        assert hasattr(model, "visual_affinity")
+        assert hasattr(model, "aural_affinity")
+        assert hasattr(model, "kinesthetic_affinity")
+        assert hasattr(model, "textual_affinity")
         assert hasattr(model, "user_id")
 
     def test_model_has_correct_relationships(self, models: Dict[str, Model]):
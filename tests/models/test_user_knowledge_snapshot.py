@@ -0,0 +1,55 @@
+# -*- coding: utf-8 -*-
+"""Test case suite for the User Knowledge Snapshot model."""
+
+import uuid
+from datetime import datetime
+from typing import Dict
+
+from flask_sqlalchemy.model import Model
+
+
+class TestUserKnowledgeSnapshotModel:
+    """Test suite for the User Knowledge Snapshot model's methods"""
+
+    def test_model_exists(self, models: Dict[str, Model]):
+        """Test case to assert that the User Knowledge Snapshot model exists
+
+        Args:
+            models (Dict[str, Model]): Dictionary of all of the models
+        """
+        assert "UserKnowledgeSnapshot" in models
+
+    def test_model_has_correct_fields(self, models: Dict[str, Model]):
+        """Test case to assert that the User Knowledge Snapshot model has the correct fields
+
+        Args:
+            models (Dict[str, Model]): Dictionary of all of the models
+        """
+        model = models["UserKnowledgeSnapshot"]
+        assert hasattr(model, "id")
+        assert hasattr(model, "created_at")
+        assert hasattr(model, "user_id")
+        assert hasattr(model, "node_id")
+        assert hasattr(model, "entity_type")
+        assert hasattr(model, "expected_knowledge")
+        assert hasattr(model, "evidence_observed")
+        assert hasattr(model, "domain_version")
+        assert hasattr(model, "evidence_version")
+
+    def test_model_has_correct_attribute_types(
+        self, mock_user_knowledge_snapshot: Model
+    ):
+        """Test case to assert that the User Knowledge Snapshot model has the correct attribute types
+
+        Args:
+            mock_user_knowledge_snapshot (Model): Mock User Knowledge Snapshot
+        """
+        assert isinstance(mock_user_knowledge_snapshot.id, uuid.UUID)
+        assert isinstance(mock_user_knowledge_snapshot.created_at, datetime)
+        assert isinstance(mock_user_knowledge_snapshot.user_id, uuid.UUID)
+        assert isinstance(mock_user_knowledge_snapshot.node_id, uuid.UUID)
+        assert isinstance(mock_user_knowledge_snapshot.entity_type, str)
+        assert isinstance(mock_user_knowledge_snapshot.expected_knowledge, float)
+        assert isinstance(mock_user_knowledge_snapshot.evidence_observed, bool)
+        assert isinstance(mock_user_knowledge_snapshot.domain_version, int)
+        assert isinstance(mock_user_knowledge_snapshot.evidence_version, int)
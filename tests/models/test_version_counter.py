@@ -0,0 +1,43 @@
+# -*- coding: utf-8 -*-
+"""Test case suite for the Version Counter model."""
+
+import uuid
+from datetime import datetime
+from typing import Dict
+
+from flask_sqlalchemy.model import Model
+
+
+class TestVersionCounterModel:
+    """Test suite for the Version Counter model's methods"""
+
+    def test_model_exists(self, models: Dict[str, Model]):
+        """Test case to assert that the Version Counter model exists
+
+        Args:
+            models (Dict[str, Model]): Dictionary of all of the models
+        """
+        assert "VersionCounter" in models
+
+    def test_model_has_correct_fields(self, models: Dict[str, Model]):
+        """Test case to assert that the Version Counter model has the correct fields
+
+        Args:
+            models (Dict[str, Model]): Dictionary of all of the models
+        """
+        model = models["VersionCounter"]
+        assert hasattr(model, "id")
+        assert hasattr(model, "created_at")
+        assert hasattr(model, "counter_name")
+        assert hasattr(model, "counter_value")
+
+    def test_model_has_correct_attribute_types(self, mock_version_counter: Model):
+        """Test case to assert that the Version Counter model has the correct attribute types
+
+        Args:
+            mock_version_counter (Model): Mock Version Counter
+        """
+        assert isinstance(mock_version_counter.id, uuid.UUID)
+        assert isinstance(mock_version_counter.created_at, datetime)
+        assert isinstance(mock_version_counter.counter_name, str)
+        assert isinstance(mock_version_counter.counter_value, int)
@@ -0,0 +1,126 @@
+# -*- coding: utf-8 -*-
+import uuid
+from typing import Dict
+
+import pytest
+from flask_sqlalchemy.model import Model
+from sqlalchemy import event
+from src.services.utils.helpers.version_counter.version_counter import (
+    bump_domain_version,
+)
+
+
+@pytest.fixture(scope="session")
+def mock_student(models: Dict[str, Model], db):
+    """Fixture to create a mock Student with its Learning Style
+
+    Args:
+        models (Dict[str, Model]): Dictionary of all of the models
+        db (DB): Database connection
+
+    Returns:
+        Model: Mock Student
+    """
+    new_instance = models["User"](
+        email=f"{uuid.uuid4()}@example.com",
+        first_name="Example",
+        last_name="Student",
+        vark_completed=True,
+    )
+    new_instance.role.append(models["Role"](role_name="student", is_enabled=True))
+    new_instance.learning_style = models["LearningStyle"](
+        visual=1, aural=2, kinesthetic=3, textual=4
+    )
+    db.session.add(new_instance)
+    db.session.commit()
+    return new_instance
+
+
+@pytest.fixture(scope="session")
+def course_factory(models: Dict[str, Model], db):
+    """Fixture to create mock Courses (A Topic with Templates, Learning Contents and Practice Tests)
+
+    Args:
+        models (Dict[str, Model]): Dictionary of all of the models
+        db (DB): Database connection
+
+    Returns:
+        function: Function that creates a new mock Course.
+    """
+
+    def create_course(templates: int = 1, pages_per_template: int = 2) -> dict:
+        course = {"templates": [], "practice_tests": [], "interactions": []}
+        course["topic"] = models["Topic"](
+            relative_position=uuid.uuid4().int % 1000000,
+            title=f"Topic {uuid.uuid4()}",
+            default_knowledge=50,
+            leak_parameter=10,
+            adaptative_object=models["AdaptativeObject"](),
+        )
+        for template_position in range(1, templates + 1):
+            template = models["Template"](
+                relative_position=template_position,
+                title=f"Template {uuid.uuid4()}",
+                default_knowledge=50,
+                knowledge_weight=80,
+                leak_parameter=5,
+                adaptative_object=models["AdaptativeObject"](),
+                topic=course["topic"],
+            )
+            course["templates"].append(template)
+            for page_position in range(1, pages_per_template + 1):
+                page = models["Page"](
+                    relative_position=page_position,
+                    template=template,
+                    adaptative_object=models["AdaptativeObject"](),
+                )
+                # Alternate between Practice Tests and Learning Contents.
+                if page_position % 2:
+                    page.practice_test = models["PracticeTest"](
+                        title=f"Practice Test {uuid.uuid4()}",
+                        adaptation_weight=60,
+                        approval_score=5,
+                        total_score=10,
+                    )
+                    course["practice_tests"].append(page.practice_test)
+                else:
+                    page.learning_content = models["LearningContent"](
+                        title=f"Learning Content {uuid.uuid4()}",
+                        content="Example Content",
+                    )
+                    for learning_style_attribute in (None, "VISUAL"):
+                        interaction = models["MeasurableInteraction"](
+                            interaction_weight=40,
+                            interaction_trigger="click",
+                            learning_style_attribute=learning_style_attribute,
+                        )
+                        page.learning_content.measurable_interactions.append(
+                            interaction
+                        )
+                        course["interactions"].append(interaction)
+        db.session.add(course["topic"])
+        bump_domain_version(db)
+        db.session.commit()
+        return course
+
+    return create_course
+
+
+@pytest.fixture
+def query_counter(db):
+    """Fixture to count the SQL Statements executed against the Database
+
+    Args:
+        db (DB): Database connection
+
+    Returns:
+        list: List that receives every executed SQL Statement.
+    """
+    statements = []
+
+    def count_statement(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(db.engine, "before_cursor_execute", count_statement)
+    yield statements
+    event.remove(db.engine, "before_cursor_execute", count_statement)
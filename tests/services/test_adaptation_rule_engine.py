@@ -0,0 +1,543 @@
+# -*- coding: utf-8 -*-
+"""Test case suite for the Adaptation Rule Engine."""
+
+import random
+import uuid
+from typing import Dict
+
+import numpy as np
+import pytest
+from flask_sqlalchemy.model import Model
+from src.services.utils.helpers.adaptation_rule_engine import adaptation_rule_engine
+from src.services.utils.helpers.adaptation_rule_engine.adaptation_rule_engine import (
+    LazyRuleVariables,
+    adaptation_rule_variables,
+    LEARNING_STYLE_VARIABLES,
+    adaptation_rules,
+    compile_adaptative_event,
+    compile_threshold_index,
+    evaluate_adaptation_rules,
+    evaluate_threshold_index,
+    find_objects_triggered_adaptative_events,
+    find_triggered_adaptative_events,
+)
+from src.services.utils.helpers.adaptative_object_ancestry.adaptative_object_ancestry import (
+    template_ancestry,
+)
+from src.services.utils.helpers.version_counter.version_counter import (
+    bump_rules_version,
+)
+
+
+class RecordingVariables(dict):
+    """Dictionary of variables that records every variable read from it"""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.read_variables = []
+
+    def get(self, key, default=None):
+        self.read_variables.append(key)
+        return super().get(key, default)
+
+
+def counting_providers(provider_values: dict) -> tuple:
+    """Function to create variable providers that count how many times they are called
+
+    Args:
+        provider_values (dict): Variables returned by the provider of every family
+
+    Returns:
+        tuple: Providers of every family and the calls of every provider.
+    """
+    calls = {family: 0 for family in provider_values}
+
+    def provider_factory(family: str):
+        def provider():
+            calls[family] += 1
+            return provider_values[family]
+
+        return provider
+
+    return {family: provider_factory(family) for family in provider_values}, calls
+
+
+@pytest.fixture
+def mock_adaptative_object(models: Dict[str, Model], db, course_factory) -> dict:
+    """Fixture to create an Adaptative Object with Events of every aggregator
+
+    Args:
+        models (Dict[str, Model]): Dictionary of all of the models
+        db (DB): Database connection
+        course_factory (function): Mock Course Factory
+
+    Returns:
+        dict: Dictionary containing the Adaptative Object and its Events by name.
+    """
+    adaptative_object = course_factory()["topic"].adaptative_object
+    events = {}
+    for name, relative_position, condition_aggregator, conditions in (
+        (
+            "and",
+            2,
+            "AND",
+            [
+                ("TOPIC_KNOWLEDGE", "gte", 50),
+                ("LEARNING_STYLE_AURAL_AFFINITY", "lte", 30),
+            ],
+        ),
+        (
+            "or",
+            1,
+            "OR",
+            [("TOPIC_KNOWLEDGE", "lte", 10), ("TEMPLATE_KNOWLEDGE", "gte", 90)],
+        ),
+        ("without_aggregator", 3, None, [("TOPIC_KNOWLEDGE", "gte", 0)]),
+    ):
+        events[name] = models["AdaptativeEvent"](
+            triggered_change="HIGHLIGHT",
+            relative_position=relative_position,
+            condition_aggregator=condition_aggregator,
+            adaptative_object=adaptative_object,
+        )
+        for variable_to_compare, comparation_condition, value_to_compare in conditions:
+            events[name].adaptation_conditions.append(
+                models["AdaptationCondition"](
+                    variable_to_compare=variable_to_compare,
+                    comparation_condition=comparation_condition,
+                    value_to_compare=value_to_compare,
+                )
+            )
+    db.session.add_all(events.values())
+    bump_rules_version(db)
+    db.session.commit()
+    return {
+        "adaptative_object_id": adaptative_object.id,
+        "event_ids": {name: event.id for name, event in events.items()},
+    }
+
+
+class TestAdaptationRuleEngine:
+    """Test suite for the Adaptation Rule Engine"""
+
+    @pytest.mark.parametrize(
+        "variables,triggered_events",
+        [
+            (
+                {"TOPIC_KNOWLEDGE": 0.6, "LEARNING_STYLE_AURAL_AFFINITY": 0.3},
+                ["and"],
+            ),
+            (
+                {"TOPIC_KNOWLEDGE": 0.05, "LEARNING_STYLE_AURAL_AFFINITY": 0.3},
+                ["or"],
+            ),
+            (
+                {
+                    "TOPIC_KNOWLEDGE": 0.6,
+                    "TEMPLATE_KNOWLEDGE": 0.95,
+                    "LEARNING_STYLE_AURAL_AFFINITY": 0.1,
+                },
+                ["or", "and"],
+            ),
+            # A variable that does not apply to the Adaptative Object never meets a Condition.
+            ({"LEARNING_STYLE_AURAL_AFFINITY": 0.1}, []),
+        ],
+    )
+    def test_rules_trigger_events_in_order(
+        self,
+        models: Dict[str, Model],
+        mock_adaptative_object: dict,
+        variables: dict,
+        triggered_events: list,
+    ):
+        """Test case to assert that the compiled Rules trigger the same Events as the Conditions
+
+        Args:
+            models (Dict[str, Model]): Dictionary of all of the models
+            mock_adaptative_object (dict): Mock Adaptative Object
+            variables (dict): Value of every variable_to_compare
+            triggered_events (list): Names of the expected triggered Events
+        """
+        compiled_rules = adaptation_rules(
+            models, mock_adaptative_object["adaptative_object_id"]
+        )
+
+        assert evaluate_adaptation_rules(compiled_rules, variables) == [
+            mock_adaptative_object["event_ids"][name] for name in triggered_events
+        ]
+
+    def test_aggregators_short_circuit(
+        self, models: Dict[str, Model], mock_adaptative_object: dict
+    ):
+        """Test case to assert that AND and OR stop at the first Condition that decides the Event
+
+        Args:
+            models (Dict[str, Model]): Dictionary of all of the models
+            mock_adaptative_object (dict): Mock Adaptative Object
+        """
+        compiled_rules = adaptation_rules(
+            models, mock_adaptative_object["adaptative_object_id"]
+        )
+        # The first Condition of the OR Event is met and the first of the AND Event is not.
+        variables = RecordingVariables({"TOPIC_KNOWLEDGE": 0.05})
+
+        evaluate_adaptation_rules(compiled_rules, variables)
+
+        assert variables.read_variables == ["TOPIC_KNOWLEDGE", "TOPIC_KNOWLEDGE"]
+
+    def test_rules_are_compiled_again_after_a_rule_change(
+        self,
+        models: Dict[str, Model],
+        db,
+        mock_adaptative_object: dict,
+        query_counter,
+    ):
+        """Test case to assert that the compiled Rules are reused until the Rules Version changes
+
+        Args:
+            models (Dict[str, Model]): Dictionary of all of the models
+            db (DB): Database connection
+            mock_adaptative_object (dict): Mock Adaptative Object
+            query_counter (list): Executed SQL Statements
+        """
+        adaptative_object_id = mock_adaptative_object["adaptative_object_id"]
+        compiled_rules = adaptation_rules(models, adaptative_object_id)
+        query_counter.clear()
+
+        assert adaptation_rules(models, adaptative_object_id) is compiled_rules
+        # NOTE: Only the Rules Version is read.
+        assert len(query_counter) == 1
+
+        models["AdaptativeEvent"].query.get(
+            mock_adaptative_object["event_ids"]["without_aggregator"]
+        ).condition_aggregator = "OR"
+        bump_rules_version(db)
+        db.session.commit()
+
+        assert evaluate_adaptation_rules(
+            adaptation_rules(models, adaptative_object_id), {"TOPIC_KNOWLEDGE": 0.0}
+        ) == [
+            mock_adaptative_object["event_ids"]["or"],
+            mock_adaptative_object["event_ids"]["without_aggregator"],
+        ]
+
+    def test_only_read_variable_families_are_provided(
+        self, models: Dict[str, Model], mock_adaptative_object: dict
+    ):
+        """Test case to assert that every provider is only called once, and only if its variables are read
+
+        Args:
+            models (Dict[str, Model]): Dictionary of all of the models
+            mock_adaptative_object (dict): Mock Adaptative Object
+        """
+        compiled_rules = adaptation_rules(
+            models, mock_adaptative_object["adaptative_object_id"]
+        )
+        providers, calls = counting_providers(
+            {
+                "KNOWLEDGE": {"TOPIC_KNOWLEDGE": 0.6, "TEMPLATE_KNOWLEDGE": 0.2},
+                "LEARNING_STYLE": {"LEARNING_STYLE_AURAL_AFFINITY": 0.1},
+            }
+        )
+
+        assert evaluate_adaptation_rules(
+            compiled_rules, LazyRuleVariables(providers)
+        ) == [mock_adaptative_object["event_ids"]["and"]]
+        assert calls == {"KNOWLEDGE": 1, "LEARNING_STYLE": 1}
+
+        # Rules over Learning Styles only never provide the Knowledge.
+        learning_style_rules = [
+            (event_id, aggregate, conditions[1:], adaptative_event)
+            for event_id, aggregate, conditions, adaptative_event in compiled_rules
+            if len(conditions) == 2 and aggregate is all
+        ]
+        providers, calls = counting_providers(
+            {"LEARNING_STYLE": {"LEARNING_STYLE_AURAL_AFFINITY": 0.1}}
+        )
+        evaluate_adaptation_rules(learning_style_rules, LazyRuleVariables(providers))
+        assert calls == {"LEARNING_STYLE": 1}
+
+    def test_objects_without_events_infer_nothing(
+        self, models: Dict[str, Model], course_factory, query_counter
+    ):
+        """Test case to assert that the variables of an object without Events are never provided
+
+        Args:
+            models (Dict[str, Model]): Dictionary of all of the models
+            course_factory (function): Mock Course Factory
+            query_counter (list): Executed SQL Statements
+        """
+        adaptative_object_id = course_factory()["topic"].adaptative_object_id
+        providers, calls = counting_providers({"KNOWLEDGE": {}, "LEARNING_STYLE": {}})
+        adaptation_rules(models, adaptative_object_id)
+        query_counter.clear()
+
+        assert (
+            find_triggered_adaptative_events(
+                models, adaptative_object_id, LazyRuleVariables(providers)
+            )
+            == []
+        )
+        assert calls == {"KNOWLEDGE": 0, "LEARNING_STYLE": 0}
+        # NOTE: Only the Rules Version is read.
+        assert len(query_counter) == 1
+
+    def test_batch_estimates_the_user_model_once(
+        self,
+        models: Dict[str, Model],
+        db,
+        mock_student,
+        course_factory,
+        monkeypatch,
+    ):
+        """Test case to assert that a whole Template is evaluated with a single Knowledge estimation
+
+        Args:
+            models (Dict[str, Model]): Dictionary of all of the models
+            db (DB): Database connection
+            mock_student (Model): Mock Student
+            course_factory (function): Mock Course Factory
+            monkeypatch (MonkeyPatch): Pytest MonkeyPatch
+        """
+        course = course_factory(templates=1, pages_per_template=2)
+        template = course["templates"][0]
+        # Every Adaptative Object but the last Page has Events over the Knowledge.
+        for adaptative_object in (
+            course["topic"].adaptative_object,
+            template.adaptative_object,
+            template.pages[0].adaptative_object,
+        ):
+            for relative_position, comparation_condition in enumerate(("gte", "lte")):
+                adaptative_event = models["AdaptativeEvent"](
+                    triggered_change="HIGHLIGHT",
+                    relative_position=relative_position,
+                    condition_aggregator="AND",
+                    adaptative_object=adaptative_object,
+                )
+                adaptative_event.adaptation_conditions.append(
+                    models["AdaptationCondition"](
+                        variable_to_compare="TOPIC_KNOWLEDGE",
+                        comparation_condition=comparation_condition,
+                        value_to_compare=30,
+                    )
+                )
+                db.session.add(adaptative_event)
+        bump_rules_version(db)
+        db.session.commit()
+        ancestry = template_ancestry(models, template.id)
+        expected_events = {
+            adaptative_object_id: [
+                adaptative_event["id"]
+                for adaptative_event in find_triggered_adaptative_events(
+                    models,
+                    adaptative_object_id,
+                    adaptation_rule_variables(
+                        models, mock_student, topic_id, template_id
+                    ),
+                )
+            ]
+            for adaptative_object_id, (topic_id, template_id) in ancestry.items()
+        }
+
+        knowledge_estimations = []
+
+        def counting_user_knowledge_state(*args, **kwargs):
+            knowledge_estimations.append(args)
+            return user_knowledge_state(*args, **kwargs)
+
+        user_knowledge_state = adaptation_rule_engine.user_knowledge_state
+        monkeypatch.setattr(
+            adaptation_rule_engine,
+            "user_knowledge_state",
+            counting_user_knowledge_state,
+        )
+        triggered_adaptative_events = find_objects_triggered_adaptative_events(
+            models, mock_student, ancestry
+        )
+
+        assert {
+            adaptative_object_id: [
+                adaptative_event["id"] for adaptative_event in adaptative_events
+            ]
+            for adaptative_object_id, adaptative_events in triggered_adaptative_events.items()
+        } == expected_events
+        assert all(
+            len(event_ids) == 1 for event_ids in expected_events.values() if event_ids
+        )
+        assert len(knowledge_estimations) == 1
+
+    def test_triggered_events_query_budget(
+        self,
+        models: Dict[str, Model],
+        schemas: dict,
+        db,
+        mock_adaptative_object: dict,
+        query_counter,
+    ):
+        """Test case to assert that the triggered Events are evaluated and serialized within the Query budget
+
+        Args:
+            models (Dict[str, Model]): Dictionary of all of the models
+            schemas (dict): Dictionary of all of the schemas
+            db (DB): Database connection
+            mock_adaptative_object (dict): Mock Adaptative Object
+            query_counter (list): Executed SQL Statements
+        """
+        adaptative_object_id = mock_adaptative_object["adaptative_object_id"]
+        event_ids = mock_adaptative_object["event_ids"]
+        variables = {
+            "TOPIC_KNOWLEDGE": 0.6,
+            "TEMPLATE_KNOWLEDGE": 0.95,
+            "LEARNING_STYLE_AURAL_AFFINITY": 0.1,
+        }
+        adaptative_event_schema = schemas["AdaptativeEvent_CompleteSchema"]()
+        # Serializing the Event instances issues one Query per Event for its Conditions.
+        expected_events = adaptative_event_schema.dump(
+            obj=[
+                models["AdaptativeEvent"].query.get(event_ids[name])
+                for name in ("or", "and")
+            ],
+            many=True,
+        )
+        bump_rules_version(db)
+        db.session.commit()
+        query_counter.clear()
+
+        # NOTE: The Rules Version and every Event alongside its Conditions.
+        serialized_events = adaptative_event_schema.dump(
+            obj=find_triggered_adaptative_events(
+                models, adaptative_object_id, variables
+            ),
+            many=True,
+        )
+        assert len(query_counter) == 2
+        query_counter.clear()
+
+        # NOTE: Only the Rules Version once the Rules are compiled.
+        cached_events = adaptative_event_schema.dump(
+            obj=find_triggered_adaptative_events(
+                models, adaptative_object_id, variables
+            ),
+            many=True,
+        )
+        assert len(query_counter) == 1
+
+        for adaptative_events in (serialized_events, cached_events):
+            assert [
+                {
+                    **adaptative_event,
+                    "adaptation_conditions": sorted(
+                        adaptative_event["adaptation_conditions"],
+                        key=lambda condition: condition["id"],
+                    ),
+                }
+                for adaptative_event in adaptative_events
+            ] == [
+                {
+                    **adaptative_event,
+                    "adaptation_conditions": sorted(
+                        adaptative_event["adaptation_conditions"],
+                        key=lambda condition: condition["id"],
+                    ),
+                }
+                for adaptative_event in expected_events
+            ]
+
+    def test_threshold_index_matches_the_rules(self):
+        """Test case to assert that the Threshold Index triggers the same Events as every compiled Rule"""
+        generator = random.Random(15)
+        topic_ids = [uuid.uuid4() for _ in range(5)]
+        template_ids = {
+            topic_id: [uuid.uuid4() for _ in range(3)] for topic_id in topic_ids
+        }
+        variables_to_compare = [
+            "TOPIC_KNOWLEDGE",
+            "TEMPLATE_KNOWLEDGE",
+            *LEARNING_STYLE_VARIABLES,
+        ]
+        ancestry = {}
+        compiled_rules = {}
+        for _ in range(200):
+            adaptative_object_id = uuid.uuid4()
+            topic_id = generator.choice(topic_ids)
+            # A third of the Adaptative Objects belong to a Topic.
+            ancestry[adaptative_object_id] = (
+                topic_id,
+                generator.choice([None, *template_ids[topic_id][:2]]),
+            )
+            compiled_rules[adaptative_object_id] = [
+                compile_adaptative_event(
+                    {
+                        "id": uuid.uuid4(),
+                        "condition_aggregator": generator.choice(["AND", "OR"]),
+                        "adaptation_conditions": [
+                            {
+                                "variable_to_compare": generator.choice(
+                                    variables_to_compare
+                                ),
+                                "comparation_condition": generator.choice(
+                                    ["lte", "gte"]
+                                ),
+                                "value_to_compare": generator.randrange(0, 101, 10),
+                            }
+                            for _ in range(generator.randrange(0, 4))
+                        ],
+                    }
+                )
+                for _ in range(generator.randrange(0, 4))
+            ]
+        index = compile_threshold_index(compiled_rules, ancestry)
+        # NOTE: The Knowledge of one Template is never known, and values hit the thresholds.
+        # Unknown values of the other variables are NaN.
+        users = [
+            {
+                **{
+                    node_id: generator.randrange(0, 11) / 10
+                    for node_id in index["knowledge_node_ids"]
+                    if node_id != template_ids[topic_ids[0]][0]
+                },
+                **{
+                    variable_to_compare: generator.random()
+                    for variable_to_compare in index["learning_style_variables"]
+                },
+            }
+            for _ in range(20)
+        ]
+        # Some Users have an unknown Learning Style.
+        for user in users[::3]:
+            del user["LEARNING_STYLE_AURAL_AFFINITY"]
+
+        triggered_events = evaluate_threshold_index(
+            index,
+            {
+                variable_key: np.array(
+                    [user.get(variable_key, np.nan) for user in users]
+                )
+                for variable_key in users[1]
+            },
+        )
+
+        assert triggered_events.shape == (len(users), len(index["adaptative_events"]))
+        assert 0 < triggered_events.sum() < triggered_events.size
+        for user, user_triggered_events in zip(users, triggered_events):
+            expected_event_ids = []
+            for adaptative_object_id, (topic_id, template_id) in ancestry.items():
+                variables = {
+                    variable_to_compare: user[variable_to_compare]
+                    for variable_to_compare in LEARNING_STYLE_VARIABLES
+                    if variable_to_compare in user
+                }
+                variables["TOPIC_KNOWLEDGE"] = user.get(topic_id)
+                variables["TEMPLATE_KNOWLEDGE"] = user.get(template_id)
+                expected_event_ids.extend(
+                    evaluate_adaptation_rules(
+                        compiled_rules[adaptative_object_id], variables
+                    )
+                )
+            assert [
+                adaptative_event["id"]
+                for (_, _, adaptative_event), triggered in zip(
+                    index["adaptative_events"], user_triggered_events
+                )
+                if triggered
+            ] == expected_event_ids
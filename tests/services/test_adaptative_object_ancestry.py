@@ -0,0 +1,272 @@
+# -*- coding: utf-8 -*-
+"""Test case suite for the Adaptative Object Ancestry."""
+
+import uuid
+from typing import Dict
+
+import pytest
+from flask_sqlalchemy.model import Model
+from src.services.utils.helpers.adaptative_object_ancestry.adaptative_object_ancestry import (
+    AdaptativeObjectScopeError,
+    adaptative_object_ancestry,
+    find_object_context,
+    practice_test_ancestry,
+    scope_ancestry,
+    template_ancestry,
+)
+from src.services.utils.helpers.version_counter.version_counter import (
+    DOMAIN_VERSION,
+    bump_domain_version,
+    get_version,
+)
+
+
+@pytest.fixture
+def mock_course_with_questions(models: Dict[str, Model], db, course_factory) -> dict:
+    """Fixture to create a mock Course whose Practice Tests have two Test Questions
+
+    Args:
+        models (Dict[str, Model]): Dictionary of all of the models
+        db (DB): Database connection
+        course_factory (function): Mock Course Factory
+
+    Returns:
+        dict: Mock Course (See course_factory) with its Test Questions.
+    """
+    course = course_factory(templates=2, pages_per_template=2)
+    course["test_questions"] = []
+    for practice_test in course["practice_tests"]:
+        for relative_position in (1, 2):
+            test_question = models["TestQuestion"](
+                question_prompt="Example Question",
+                relative_position=relative_position,
+                adaptative_object=models["AdaptativeObject"](),
+            )
+            practice_test.test_questions.append(test_question)
+            course["test_questions"].append(test_question)
+    bump_domain_version(db)
+    db.session.commit()
+    return course
+
+
+class TestAdaptativeObjectAncestry:
+    """Test suite for the Adaptative Object Ancestry"""
+
+    def test_template_contains_every_adaptative_object(
+        self, models: Dict[str, Model], mock_course_with_questions: dict, query_counter
+    ):
+        """Test case to assert that the ancestry of a Template covers its Topic, Pages and Test Questions, read from the index
+
+        Args:
+            models (Dict[str, Model]): Dictionary of all of the models
+            mock_course_with_questions (dict): Mock Course
+            query_counter (list): Executed SQL Statements
+        """
+        topic = mock_course_with_questions["topic"]
+        template = mock_course_with_questions["templates"][0]
+        expected_ancestry = {
+            topic.adaptative_object_id: (topic.id, None),
+            template.adaptative_object_id: (topic.id, template.id),
+        }
+        for page in template.pages:
+            expected_ancestry[page.adaptative_object_id] = (topic.id, template.id)
+            if page.practice_test:
+                for test_question in page.practice_test.test_questions:
+                    expected_ancestry[test_question.adaptative_object_id] = (
+                        topic.id,
+                        template.id,
+                    )
+
+        domain_version = get_version(models, DOMAIN_VERSION)
+        assert (
+            template_ancestry(models, template.id, domain_version) == expected_ancestry
+        )
+        assert len(expected_ancestry) == 6
+
+        query_counter.clear()
+        assert (
+            template_ancestry(models, str(template.id), domain_version)
+            == expected_ancestry
+        )
+        assert template_ancestry(models, topic.id, domain_version) == {}
+        assert template_ancestry(models, "not-an-id", domain_version) == {}
+        assert len(query_counter) == 0
+
+    def test_practice_test_contains_its_parents_and_questions(
+        self, models: Dict[str, Model], mock_course_with_questions: dict
+    ):
+        """Test case to assert that the ancestry of a Practice Test covers its parents and Test Questions
+
+        Args:
+            models (Dict[str, Model]): Dictionary of all of the models
+            mock_course_with_questions (dict): Mock Course
+        """
+        topic = mock_course_with_questions["topic"]
+        practice_test = mock_course_with_questions["practice_tests"][1]
+        page = practice_test.page
+        template = page.template
+
+        assert practice_test_ancestry(models, str(practice_test.id)) == {
+            topic.adaptative_object_id: (topic.id, None),
+            template.adaptative_object_id: (topic.id, template.id),
+            page.adaptative_object_id: (topic.id, template.id),
+            **{
+                test_question.adaptative_object_id: (topic.id, template.id)
+                for test_question in practice_test.test_questions
+            },
+        }
+        assert practice_test_ancestry(models, page.id) == {}
+
+    def test_listed_adaptative_objects(
+        self, models: Dict[str, Model], mock_course_with_questions: dict
+    ):
+        """Test case to assert that only the listed and existing Adaptative Objects are found
+
+        Args:
+            models (Dict[str, Model]): Dictionary of all of the models
+            mock_course_with_questions (dict): Mock Course
+        """
+        topic = mock_course_with_questions["topic"]
+        test_question = mock_course_with_questions["test_questions"][-1]
+        template = test_question.practice_test.page.template
+        missing_adaptative_object = models["AdaptativeObject"]()
+
+        assert adaptative_object_ancestry(
+            models,
+            [
+                topic.adaptative_object_id,
+                test_question.adaptative_object_id,
+                missing_adaptative_object.id,
+            ],
+        ) == {
+            topic.adaptative_object_id: (topic.id, None),
+            test_question.adaptative_object_id: (topic.id, template.id),
+        }
+        assert adaptative_object_ancestry(models, []) == {}
+        # IDs coming from a request body are parsed.
+        assert adaptative_object_ancestry(
+            models, [str(topic.adaptative_object_id), "not-an-id"]
+        ) == {topic.adaptative_object_id: (topic.id, None)}
+
+    @pytest.mark.parametrize(
+        "scope,error",
+        [
+            ({}, "INVALID_SCOPE"),
+            (
+                {
+                    "template_id": str(uuid.uuid4()),
+                    "practice_test_id": str(uuid.uuid4()),
+                },
+                "INVALID_SCOPE",
+            ),
+            ({"template_id": str(uuid.uuid4())}, "TEMPLATE_NOT_FOUND"),
+            ({"practice_test_id": "not-an-id"}, "PRACTICE_TEST_NOT_FOUND"),
+            ({"adaptative_object_ids": "not-a-list"}, "INVALID_ADAPTATIVE_OBJECT_IDS"),
+            ({"adaptative_object_ids": [1]}, "INVALID_ADAPTATIVE_OBJECT_IDS"),
+            ({"adaptative_object_ids": ["not-an-id"]}, "INVALID_ADAPTATIVE_OBJECT_IDS"),
+        ],
+    )
+    def test_invalid_scopes_are_rejected(
+        self,
+        models: Dict[str, Model],
+        mock_course_with_questions: dict,
+        scope: dict,
+        error: str,
+    ):
+        """Test case to assert that invalid scopes raise the error returned to the client
+
+        Args:
+            models (Dict[str, Model]): Dictionary of all of the models
+            mock_course_with_questions (dict): Mock Course
+            scope (dict): Requested scope
+            error (str): Expected error code
+        """
+        with pytest.raises(AdaptativeObjectScopeError) as raised:
+            scope_ancestry(models, scope)
+
+        assert raised.value.error == error
+
+    def test_scope_is_resolved_from_the_index(
+        self, models: Dict[str, Model], mock_course_with_questions: dict
+    ):
+        """Test case to assert that every kind of scope is resolved like its own lookup
+
+        Args:
+            models (Dict[str, Model]): Dictionary of all of the models
+            mock_course_with_questions (dict): Mock Course
+        """
+        template = mock_course_with_questions["templates"][0]
+        practice_test = mock_course_with_questions["practice_tests"][0]
+        topic = mock_course_with_questions["topic"]
+
+        assert scope_ancestry(
+            models, {"template_id": str(template.id)}
+        ) == template_ancestry(models, template.id)
+        assert scope_ancestry(
+            models, {"practice_test_id": str(practice_test.id)}
+        ) == practice_test_ancestry(models, practice_test.id)
+        assert scope_ancestry(
+            models, {"adaptative_object_ids": [str(topic.adaptative_object_id)]}
+        ) == {topic.adaptative_object_id: (topic.id, None)}
+
+    def test_object_context_is_resolved_without_queries(
+        self,
+        models: Dict[str, Model],
+        db,
+        mock_course_with_questions: dict,
+        query_counter,
+    ):
+        """Test case to assert that the context of an object is resolved from the index until the Domain Model changes
+
+        Args:
+            models (Dict[str, Model]): Dictionary of all of the models
+            db (DB): Database connection
+            mock_course_with_questions (dict): Mock Course
+            query_counter (list): Executed SQL Statements
+        """
+        topic = mock_course_with_questions["topic"]
+        test_question = mock_course_with_questions["test_questions"][0]
+        practice_test = test_question.practice_test
+        page = practice_test.page
+        template = page.template
+        expected_contexts = {
+            ("Topic", topic.id): (topic.adaptative_object_id, topic.id, None),
+            ("Template", template.id): (
+                template.adaptative_object_id,
+                topic.id,
+                template.id,
+            ),
+            ("Page", page.id): (page.adaptative_object_id, topic.id, template.id),
+            ("TestQuestion", test_question.id): (
+                test_question.adaptative_object_id,
+                topic.id,
+                template.id,
+            ),
+        }
+        domain_version = get_version(models, DOMAIN_VERSION)
+        find_object_context(models, "Topic", topic.id, domain_version)
+
+        query_counter.clear()
+        for (model_name, owner_id), expected_context in expected_contexts.items():
+            assert (
+                find_object_context(models, model_name, str(owner_id), domain_version)
+                == expected_context
+            )
+        assert find_object_context(models, "Page", "not-an-id", domain_version) is None
+        assert find_object_context(models, "Page", topic.id, domain_version) is None
+        assert len(query_counter) == 0
+
+        # New objects are found once the Domain Version is bumped.
+        new_test_question = models["TestQuestion"](
+            question_prompt="Example Question",
+            relative_position=3,
+            adaptative_object=models["AdaptativeObject"](),
+        )
+        practice_test.test_questions.append(new_test_question)
+        bump_domain_version(db)
+        db.session.commit()
+        assert find_object_context(models, "TestQuestion", new_test_question.id) == (
+            new_test_question.adaptative_object_id,
+            topic.id,
+            template.id,
+        )
@@ -0,0 +1,107 @@
+# -*- coding: utf-8 -*-
+"""Test case suite for the Cohort Knowledge Inference."""
+
+import uuid
+from typing import Dict
+
+import numpy as np
+import pytest
+from flask_sqlalchemy.model import Model
+from src.services.utils.helpers.cohort_knowledge_inference.cohort_knowledge_inference import (
+    cohort_knowledge_inference,
+)
+from src.services.utils.helpers.knowledge_inference_engine.knowledge_inference_engine import (
+    knowledge_inference_engine,
+)
+
+
+@pytest.fixture
+def mock_cohort(models: Dict[str, Model], db, course_factory) -> dict:
+    """Fixture to create a Course and three Students that observed different Evidence
+
+    Args:
+        models (Dict[str, Model]): Dictionary of all of the models
+        db (DB): Database connection
+        course_factory (function): Mock Course Factory
+
+    Returns:
+        dict: Dictionary containing the Course and the Students.
+    """
+    course = course_factory(templates=2, pages_per_template=4)
+    students = []
+    for student_position in range(3):
+        student = models["User"](
+            email=f"{uuid.uuid4()}@example.com",
+            first_name="Cohort",
+            last_name=f"Student {student_position}",
+        )
+        student.role.append(models["Role"](role_name="student", is_enabled=True))
+        # Every Student passes a different amount of the Practice Tests.
+        for practice_test in course["practice_tests"][:student_position]:
+            student.test_attempts.append(
+                models["TestAttempt"](practice_test=practice_test, acquired_score=10)
+            )
+        for interaction in course["interactions"][student_position:]:
+            student.interactions_fired.append(
+                models["InteractionFired"](measurable_interaction=interaction)
+            )
+        students.append(student)
+    db.session.add_all(students)
+    db.session.commit()
+    return {"course": course, "students": students}
+
+
+class TestCohortKnowledgeInference:
+    """Test suite for the Cohort Knowledge Inference"""
+
+    def test_cohort_matches_single_user_estimation(
+        self, models: Dict[str, Model], mock_cohort: dict
+    ):
+        """Test case to assert that the batched pass estimates the same Knowledge as one User at a time
+
+        Args:
+            models (Dict[str, Model]): Dictionary of all of the models
+            mock_cohort (dict): Mock Course and Students
+        """
+        students = mock_cohort["students"]
+        cohort_knowledge = cohort_knowledge_inference(
+            models, [student.id for student in students]
+        )
+
+        assert mock_cohort["course"]["topic"].id in cohort_knowledge["node_ids"]
+        for row, student in enumerate(students):
+            knowledge_estimation = knowledge_inference_engine(models, student)
+            for column, node_id in enumerate(cohort_knowledge["node_ids"]):
+                assert cohort_knowledge["expected_knowledge"][
+                    row, column
+                ] == pytest.approx(knowledge_estimation[node_id]["expected_knowledge"])
+                assert (
+                    cohort_knowledge["evidence_observed"][row, column]
+                    == knowledge_estimation[node_id]["evidence_observed"]
+                )
+        # NOTE: The Students observed different Evidence.
+        assert not np.allclose(
+            cohort_knowledge["expected_knowledge"][0],
+            cohort_knowledge["expected_knowledge"][2],
+        )
+
+    def test_queries_do_not_grow_with_the_cohort(
+        self, models: Dict[str, Model], mock_cohort: dict, query_counter
+    ):
+        """Test case to assert that the number of queries is independent of the cohort size
+
+        Args:
+            models (Dict[str, Model]): Dictionary of all of the models
+            mock_cohort (dict): Mock Course and Students
+            query_counter (list): Executed SQL Statements
+        """
+        user_ids = [student.id for student in mock_cohort["students"]]
+        cohort_knowledge_inference(models, user_ids[:1])
+        query_counter.clear()
+        cohort_knowledge_inference(models, user_ids[:1])
+        single_user_queries = len(query_counter)
+        query_counter.clear()
+
+        cohort_knowledge_inference(models, user_ids)
+
+        assert len(query_counter) == single_user_queries
@@ -0,0 +1,229 @@
+# -*- coding: utf-8 -*-
+"""Test case suite for the Conditional Requests and the Content Versions."""
+
+import uuid
+from typing import Dict
+
+from flask import Flask
+from flask_marshmallow.schema import Schema
+from flask_sqlalchemy.model import Model
+from src.services.utils.helpers.conditional_request.conditional_request import (
+    content_etag,
+    is_not_modified,
+    not_modified_response,
+    schema_model_names,
+    serialized_etag,
+)
+from src.services.utils.helpers.triggered_events_cache.triggered_events_cache import (
+    triggered_events_etag,
+    triggered_events_versions,
+)
+from src.services.utils.helpers.version_counter.version_counter import (
+    bump_version,
+    get_content_counter_name,
+    get_evidence_counter_name,
+    get_learning_style_counter_name,
+    get_versions,
+)
+
+
+def content_versions(models: Dict[str, Model], *model_names: str) -> Dict[str, int]:
+    """Function to read the Content Versions of several Models
+
+    Args:
+        models (Dict[str, Model]): Dictionary of all of the models
+        *model_names (str): Names of the Models
+
+    Returns:
+        Dict[str, int]: Content Version of every Model
+    """
+    versions = get_versions(
+        models, [get_content_counter_name(model_name) for model_name in model_names]
+    )
+    return {
+        model_name: versions[get_content_counter_name(model_name)]
+        for model_name in model_names
+    }
+
+
+class TestConditionalRequest:
+    """Test suite for the Conditional Requests"""
+
+    def test_flushes_bump_the_content_versions_of_the_written_models(
+        self, models: Dict[str, Model], db, course_factory, mock_student
+    ):
+        """Test case to assert that only the Models written by a flush get their Content Version bumped
+
+        Args:
+            models (Dict[str, Model]): Dictionary of all of the models
+            db (DB): Database connection
+            course_factory (function): Mock Course Factory
+            mock_student (Model): Mock Student
+        """
+        course = course_factory(templates=1, pages_per_template=2)
+        model_names = (
+            "Topic",
+            "Template",
+            "LearningContent",
+            "InteractionFired",
+            "TestAttempt",
+        )
+        initial_versions = content_versions(models, *model_names)
+
+        course["templates"][0].title = f"Template {uuid.uuid4()}"
+        db.session.add(
+            models["InteractionFired"](
+                user_id=mock_student.id,
+                measurable_interaction_id=course["interactions"][0].id,
+            )
+        )
+        db.session.add(
+            models["TestAttempt"](
+                user=mock_student,
+                practice_test=course["practice_tests"][0],
+                acquired_score=10,
+            )
+        )
+        db.session.commit()
+        versions = content_versions(models, *model_names)
+        assert versions["Template"] == initial_versions["Template"] + 1
+        assert versions["Topic"] == initial_versions["Topic"]
+        assert versions["LearningContent"] == initial_versions["LearningContent"]
+        # NOTE: The Models written by the students are never tracked.
+        assert versions["InteractionFired"] == 0
+        assert versions["TestAttempt"] == 0
+
+        # Instances that were touched without changing are not bumped.
+        course["topic"].title = course["topic"].title
+        db.session.commit()
+        assert content_versions(models, *model_names) == versions
+
+    def test_schema_models_include_the_nested_schemas(self, schemas: Dict[str, Schema]):
+        """Test case to assert that the Models serialized by the Nested Schemas are found
+
+        Args:
+            schemas (Dict[str, Schema]): Dictionary of all of the schemas
+        """
+        assert schema_model_names(schemas["Page_PageInheritanceSchema"]) == [
+            "AdaptationCondition",
+            "AdaptativeEvent",
+            "AdaptativeObject",
+            "AnswerAlternative",
+            "LearningContent",
+            "Page",
+            "PracticeTest",
+            "TestQuestion",
+        ]
+        assert schema_model_names(schemas["Topic_DefaultSchema"]) == ["Topic"]
+
+    def test_content_etag_changes_with_the_serialized_models(
+        self,
+        models: Dict[str, Model],
+        db,
+        schemas: Dict[str, Schema],
+        course_factory,
+        query_counter,
+    ):
+        """Test case to assert that the Content ETag is matched until any of the serialized Models changes
+
+        Args:
+            models (Dict[str, Model]): Dictionary of all of the models
+            db (DB): Database connection
+            schemas (Dict[str, Schema]): Dictionary of all of the schemas
+            course_factory (function): Mock Course Factory
+            query_counter (list): Executed SQL Statements
+        """
+        # NOTE: A separate app is used for the requests, so that tearing them down does
+        # not remove the session of the Database.
+        app = Flask(__name__)
+        course = course_factory(templates=1, pages_per_template=2)
+        page = course["practice_tests"][0].page
+        page_id = str(page.id)
+        schema = schemas["Page_PageInheritanceSchema"]
+
+        query_counter.clear()
+        etag = content_etag(models["Page"], schema, page_id)
+        # NOTE: The Content Versions of every serialized Model are read at once.
+        assert len(query_counter) == 1
+        assert content_etag(models["Page"], schema, str(uuid.uuid4())) != etag
+        with app.test_request_context(headers={"If-None-Match": f'"{etag}"'}):
+            assert is_not_modified(etag)
+            assert not_modified_response(etag) == ("", 304, {"ETag": f'"{etag}"'})
+        with app.test_request_context():
+            assert not is_not_modified(etag)
+
+        # Changing a Nested Model changes the ETag.
+        course["practice_tests"][0].title = f"Practice Test {uuid.uuid4()}"
+        db.session.commit()
+        new_etag = content_etag(models["Page"], schema, page_id)
+        assert new_etag != etag
+        with app.test_request_context(headers={"If-None-Match": f'"{etag}"'}):
+            assert not is_not_modified(new_etag)
+
+    def test_untracked_models_get_the_etag_of_their_rows(
+        self, models: Dict[str, Model], db, schemas: Dict[str, Schema], mock_student
+    ):
+        """Test case to assert that the responses serializing Models written by the students are tagged by their rows
+
+        Args:
+            models (Dict[str, Model]): Dictionary of all of the models
+            db (DB): Database connection
+            schemas (Dict[str, Schema]): Dictionary of all of the schemas
+            mock_student (Model): Mock Student
+        """
+        schema = schemas["User_DefaultSchema"]
+        user_id = str(mock_student.id)
+        assert content_etag(models["User"], schema, user_id) is None
+
+        etag = serialized_etag(
+            models["User"], schema, schema().dump(obj=mock_student), user_id
+        )
+        assert etag == serialized_etag(
+            models["User"], schema, schema().dump(obj=mock_student), user_id
+        )
+        mock_student.first_name = f"Student {uuid.uuid4()}"
+        db.session.commit()
+        assert etag != serialized_etag(
+            models["User"], schema, schema().dump(obj=mock_student), user_id
+        )
+
+    def test_triggered_events_etag_changes_with_the_evidence(
+        self, models: Dict[str, Model], db, mock_student
+    ):
+        """Test case to assert that the ETag of the Triggered Events changes with the Evidence and the Learning Style of the User
+
+        Args:
+            models (Dict[str, Model]): Dictionary of all of the models
+            db (DB): Database connection
+            mock_student (Model): Mock Student
+        """
+        adaptative_object_id = uuid.uuid4()
+        versions = triggered_events_versions(models, mock_student.id)
+        etag = triggered_events_etag(mock_student.id, adaptative_object_id, versions)
+        assert etag == triggered_events_etag(
+            mock_student.id, adaptative_object_id, versions
+        )
+        assert etag != triggered_events_etag(
+            uuid.uuid4(), adaptative_object_id, versions
+        )
+
+        bump_version(db, get_evidence_counter_name(mock_student.id))
+        db.session.commit()
+        evidence_versions = triggered_events_versions(models, mock_student.id)
+        assert etag != triggered_events_etag(
+            mock_student.id, adaptative_object_id, evidence_versions
+        )
+
+        # NOTE: The Learning Style is versioned apart from the Knowledge Evidence.
+        bump_version(db, get_learning_style_counter_name(mock_student.id))
+        db.session.commit()
+        learning_style_versions = triggered_events_versions(models, mock_student.id)
+        assert learning_style_versions[0] == evidence_versions[0]
+        assert etag != triggered_events_etag(
+            mock_student.id, adaptative_object_id, learning_style_versions
+        )
+        assert triggered_events_etag(
+            mock_student.id, adaptative_object_id, evidence_versions
+        ) != triggered_events_etag(
+            mock_student.id, adaptative_object_id, learning_style_versions
+        )
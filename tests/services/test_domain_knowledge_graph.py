@@ -0,0 +1,90 @@
+# -*- coding: utf-8 -*-
+"""Test case suite for the cached Domain Knowledge Graph."""
+
+from typing import Dict
+
+from flask_sqlalchemy.model import Model
+from src.services.utils.helpers.domain_knowledge_graph.domain_knowledge_graph import (
+    domain_knowledge_graph,
+)
+from src.services.utils.helpers.version_counter.version_counter import (
+    DOMAIN_VERSION,
+    bump_domain_version,
+    bump_version,
+    get_version,
+)
+
+
+class TestDomainKnowledgeGraph:
+    """Test suite for the cached Domain Knowledge Graph"""
+
+    def test_bump_version_increases_counter(self, models: Dict[str, Model], db):
+        """Test case to assert that bumping a Version Counter increases it by one
+
+        Args:
+            models (Dict[str, Model]): Dictionary of all of the models
+            db (DB): Database connection
+        """
+        assert get_version(models, "unknown-counter") == 0
+        bump_version(db, "test-counter")
+        db.session.commit()
+        first_version = get_version(models, "test-counter")
+        bump_version(db, "test-counter")
+        db.session.commit()
+        assert get_version(models, "test-counter") == first_version + 1
+
+    def test_only_domain_models_bump_domain_version(self, models: Dict[str, Model], db):
+        """Test case to assert that only changes on Domain Models bump the Domain Version
+
+        Args:
+            models (Dict[str, Model]): Dictionary of all of the models
+            db (DB): Database connection
+        """
+        version = get_version(models, DOMAIN_VERSION)
+        bump_domain_version(db, models["Role"])
+        db.session.commit()
+        assert get_version(models, DOMAIN_VERSION) == version
+        bump_domain_version(db, models["Topic"])
+        db.session.commit()
+        assert get_version(models, DOMAIN_VERSION) == version + 1
+
+    def test_graph_is_reused_while_domain_is_unchanged(
+        self, models: Dict[str, Model], course_factory, query_counter
+    ):
+        """Test case to assert that the Domain is not loaded again if its version did not change
+
+        Args:
+            models (Dict[str, Model]): Dictionary of all of the models
+            course_factory (function): Mock Course Factory
+            query_counter (list): Executed SQL Statements
+        """
+        course_factory(templates=1, pages_per_template=2)
+        first_graph = domain_knowledge_graph(models)
+        query_counter.clear()
+
+        second_graph = domain_knowledge_graph(models)
+
+        assert second_graph is first_graph
+        # NOTE: Only the Domain Version is read.
+        assert len(query_counter) == 1
+
+    def test_graph_is_rebuilt_when_domain_changes(
+        self, models: Dict[str, Model], course_factory
+    ):
+        """Test case to assert that the Domain is loaded again after the Domain Version is bumped
+
+        Args:
+            models (Dict[str, Model]): Dictionary of all of the models
+            course_factory (function): Mock Course Factory
+        """
+        first_graph = domain_knowledge_graph(models)
+
+        course = course_factory(templates=2, pages_per_template=2)
+        second_graph = domain_knowledge_graph(models)
+
+        assert second_graph is not first_graph
+        assert second_graph["version"] > first_graph["version"]
+        assert course["topic"].id in second_graph["network"].nodes
+        for template in course["templates"]:
+            assert template.id in second_graph["template_ids"]
+        assert course["topic"].id not in first_graph["network"].nodes
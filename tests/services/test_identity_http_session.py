@@ -0,0 +1,180 @@
+# -*- coding: utf-8 -*-
+"""Test case suite for the Identity HTTP Session."""
+
+import json
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from threading import Thread
+from typing import Dict
+
+import pytest
+from flask import Flask
+from flask_marshmallow.schema import Schema
+from flask_sqlalchemy.model import Model
+from src.routes.auth.auth_blueprint import create_auth_blueprint
+from src.services.utils.helpers.identity_http_session import identity_http_session
+from src.services.utils.helpers.identity_http_session.identity_http_session import (
+    get_http_session,
+    identity_post,
+    identity_toolkit_url,
+    secure_token_url,
+)
+
+
+@pytest.fixture
+def identity_server(monkeypatch):
+    """Fixture of a local stand-in for the Google Identity APIs, used through a new Session
+
+    Args:
+        monkeypatch (MonkeyPatch): Pytest MonkeyPatch
+
+    Yields:
+        dict: Requests answered by the server, the client port of every one of them and
+            the statuses of the next responses.
+    """
+    monkeypatch.setattr(
+        identity_http_session, "_http_session", {"pid": None, "session": None}
+    )
+    monkeypatch.setattr(identity_http_session.RETRY, "backoff_factor", 0)
+    monkeypatch.setenv("GOOGLE_API_KEY", "api-key")
+    server_state = {"requests": [], "client_ports": [], "statuses": []}
+
+    class IdentityHandler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_GET(self):
+            self.do_POST()
+
+        def do_POST(self):
+            self.rfile.read(int(self.headers.get("Content-Length", 0)))
+            server_state["requests"].append(self.path)
+            server_state["client_ports"].append(self.client_address[1])
+            status = (
+                server_state["statuses"].pop(0) if server_state["statuses"] else 200
+            )
+            body = json.dumps({"idToken": "token"}).encode()
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), IdentityHandler)
+    thread = Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    base_url = f"http://127.0.0.1:{server.server_port}"
+    monkeypatch.setenv("IDENTITY_TOOLKIT_BASE_URL", base_url)
+    monkeypatch.setenv("SECURE_TOKEN_BASE_URL", f"{base_url}/securetoken/")
+    yield server_state
+    get_http_session().close()
+    server.shutdown()
+    server.server_close()
+
+
+class TestIdentityHttpSession:
+    """Test suite for the Identity HTTP Session"""
+
+    def test_requests_reuse_one_connection(self, identity_server: dict):
+        """Test case to assert that the requests to the configured Base URLs are sent over one kept-alive connection
+
+        Args:
+            identity_server (dict): Local stand-in for the Google Identity APIs
+        """
+        for _ in range(5):
+            response = identity_post(
+                identity_toolkit_url("accounts:signInWithPassword"),
+                data={"email": "user@example.com", "password": "password"},
+            )
+            assert response.json() == {"idToken": "token"}
+        identity_post(secure_token_url("token"), data={"grant_type": "refresh_token"})
+
+        assert identity_server["requests"] == 5 * [
+            "/v1/accounts:signInWithPassword?key=api-key"
+        ] + ["/securetoken/v1/token?key=api-key"]
+        assert len(set(identity_server["client_ports"])) == 1
+
+    def test_unavailable_responses_are_retried(self, identity_server: dict):
+        """Test case to assert that unavailable responses are retried, and that errors of the API are not
+
+        Args:
+            identity_server (dict): Local stand-in for the Google Identity APIs
+        """
+        identity_server["statuses"] = [503, 503]
+        response = identity_post(identity_toolkit_url("accounts:update"))
+        assert response.status_code == 200
+        assert len(identity_server["requests"]) == 3
+
+        identity_server["statuses"] = [400]
+        response = identity_post(identity_toolkit_url("accounts:update"))
+        assert response.status_code == 400
+        assert len(identity_server["requests"]) == 4
+
+    def test_posts_the_api_may_have_handled_are_not_retried(
+        self, identity_server: dict
+    ):
+        """Test case to assert that POSTs are only retried on the statuses sent before the API handles them
+
+        Args:
+            identity_server (dict): Local stand-in for the Google Identity APIs
+        """
+        identity_server["statuses"] = [502]
+        response = identity_post(identity_toolkit_url("accounts:update"))
+        assert response.status_code == 502
+        assert len(identity_server["requests"]) == 1
+
+        identity_server["statuses"] = [429, 504]
+        response = identity_post(identity_toolkit_url("accounts:signUp"))
+        assert response.status_code == 504
+        assert len(identity_server["requests"]) == 3
+
+        # NOTE: GETs do not change anything, so they are retried on every unavailable status.
+        identity_server["statuses"] = [502, 504]
+        response = get_http_session().get(
+            identity_toolkit_url("publicKeys"),
+            timeout=identity_http_session.REQUEST_TIMEOUT,
+        )
+        assert response.status_code == 200
+        assert len(identity_server["requests"]) == 6
+
+    def test_unreachable_api_returns_an_error_response(
+        self, models: Dict[str, Model], schemas: Dict[str, Schema], db, monkeypatch
+    ):
+        """Test case to assert that the Auth routes answer with an error response when the API cannot be reached
+
+        Args:
+            models (Dict[str, Model]): Dictionary of all of the models
+            schemas (Dict[str, Schema]): Dictionary of all of the schemas
+            db (DB): Database connection
+            monkeypatch (MonkeyPatch): Pytest MonkeyPatch
+        """
+        monkeypatch.setattr(
+            identity_http_session, "_http_session", {"pid": None, "session": None}
+        )
+        monkeypatch.setattr(identity_http_session.RETRY, "backoff_factor", 0)
+        # NOTE: Nothing listens on the port 9 (Discard) of the loopback interface.
+        monkeypatch.setenv("IDENTITY_TOOLKIT_BASE_URL", "http://127.0.0.1:9")
+        auth_app = Flask(__name__)
+        auth_app.register_blueprint(create_auth_blueprint(db, models, schemas, None))
+
+        response = auth_app.test_client().post(
+            "/auth/login", json={"email": "user@example.com", "password": "password"}
+        )
+        assert response.status_code == 503
+        assert response.get_json()["data"]["error"] == "IDENTITY_SERVICE_UNAVAILABLE"
+        get_http_session().close()
+
+    def test_every_process_gets_its_own_session(
+        self, identity_server: dict, monkeypatch
+    ):
+        """Test case to assert that the Session is shared within a process, but not with forked ones
+
+        Args:
+            identity_server (dict): Local stand-in for the Google Identity APIs
+            monkeypatch (MonkeyPatch): Pytest MonkeyPatch
+        """
+        session = get_http_session()
+        assert get_http_session() is session
+        monkeypatch.setattr(identity_http_session, "getpid", lambda: -1)
+        assert get_http_session() is not session
@@ -0,0 +1,138 @@
+# -*- coding: utf-8 -*-
+"""Test case suite for the Keyset Pagination."""
+
+import uuid
+from typing import Dict, List
+
+import pytest
+from flask_sqlalchemy.model import Model
+from sqlalchemy.orm import Query
+from src.services.utils.helpers.keyset_pagination.keyset_pagination import (
+    PaginationError,
+    encode_cursor,
+    keyset_paginate,
+)
+
+
+def paginate_all(query: Query, model: Model, sort_key: str, page_size: int) -> List:
+    """Function to read every page of a query, following the cursors
+
+    Args:
+        query (Query): Paginated query
+        model (Model): Model of the paginated items
+        sort_key (str): Sort Key of the pagination
+        page_size (int): Maximum number of items of every page
+
+    Returns:
+        List: Items of every page, in order.
+    """
+    items, cursor = [], ""
+    while cursor is not None:
+        page = keyset_paginate(query, model, sort_key, cursor, page_size)
+        assert len(page["items"]) <= page_size
+        items.extend(page["items"])
+        cursor = page["next_cursor"]
+    return items
+
+
+class TestKeysetPagination:
+    """Test suite for the Keyset Pagination"""
+
+    def test_pages_follow_the_sort_key(
+        self, models: Dict[str, Model], course_factory, query_counter
+    ):
+        """Test case to assert that following the cursors reads every item once, in order and without offsets
+
+        Args:
+            models (Dict[str, Model]): Dictionary of all of the models
+            course_factory (function): Mock Course Factory
+            query_counter (list): Executed SQL Statements
+        """
+        template = course_factory(templates=1, pages_per_template=5)["templates"][0]
+        query = models["Page"].query.filter_by(template_id=template.id)
+        pages = sorted(template.pages, key=lambda page: page.relative_position)
+
+        query_counter.clear()
+        assert paginate_all(query, models["Page"], "relative_position", 2) == pages
+        # NOTE: Three pages are read, without counting the items nor skipping them.
+        assert len(query_counter) == 3
+        assert not any("OFFSET" in statement for statement in query_counter)
+        assert (
+            paginate_all(query, models["Page"], "relative_position desc", 3)
+            == pages[::-1]
+        )
+        assert paginate_all(query, models["Page"], None, 4) == sorted(
+            pages, key=lambda page: page.id
+        )
+
+        page = keyset_paginate(query, models["Page"], count="exact")
+        assert page["total_items"] == 5
+        assert page["next_cursor"] is None
+        assert (
+            keyset_paginate(query, models["Page"], count="estimated")["total_items"]
+            >= 0
+        )
+
+    @pytest.mark.parametrize("descending", [False, True], ids=["asc", "desc"])
+    def test_null_sort_values_are_paginated(
+        self, models: Dict[str, Model], db, descending: bool
+    ):
+        """Test case to assert that items with a NULL sort value are paginated like PostgreSQL sorts them
+
+        Args:
+            models (Dict[str, Model]): Dictionary of all of the models
+            db (DB): Database connection
+            descending (bool): Whether the items are sorted in descending order
+        """
+        email_domain = f"{uuid.uuid4()}.example.com"
+        users = [
+            models["User"](email=f"{index}@{email_domain}", first_name=first_name)
+            for index, first_name in enumerate(["Ana", None, "Ana", "Luis", None])
+        ]
+        db.session.add_all(users)
+        db.session.commit()
+        query = models["User"].query.filter(models["User"].email.endswith(email_domain))
+
+        # NOTE: PostgreSQL sorts the NULLs last in ascending order.
+        expected_users = sorted(
+            users,
+            key=lambda user: (user.first_name is None, user.first_name or "", user.id),
+        )
+        if descending:
+            expected_users.reverse()
+        sort_key = "first_name desc" if descending else "first_name"
+        for page_size in (1, 2):
+            assert (
+                paginate_all(query, models["User"], sort_key, page_size)
+                == expected_users
+            )
+
+    def test_invalid_params_are_rejected(self, models: Dict[str, Model]):
+        """Test case to assert that invalid sort keys, cursors and counts are rejected with their error code
+
+        Args:
+            models (Dict[str, Model]): Dictionary of all of the models
+        """
+        query = models["Page"].query
+        invalid_params = {
+            "INVALID_SORT_KEY": {"sort_key": "not_a_column"},
+            "INVALID_CURSOR": {"after": "not-a-cursor"},
+            "INVALID_COUNT": {"count": "all"},
+            "INVALID_PAGE_SIZE": {"page_size": 0},
+        }
+        for error, params in invalid_params.items():
+            with pytest.raises(PaginationError) as raised_error:
+                keyset_paginate(query, models["Page"], **params)
+            assert raised_error.value.error == error
+
+        # Cursors are only valid for the sort key they were created for, and its type.
+        cursor = encode_cursor("relative_position", 1, uuid.uuid4())
+        with pytest.raises(PaginationError):
+            keyset_paginate(query, models["Page"], "created_at", cursor)
+        with pytest.raises(PaginationError):
+            keyset_paginate(
+                query,
+                models["Page"],
+                "relative_position",
+                encode_cursor("relative_position", "1", uuid.uuid4()),
+            )
@@ -0,0 +1,116 @@
+# -*- coding: utf-8 -*-
+"""Test case suite for the Knowledge Bayesian Network Constructor."""
+
+from typing import Dict
+
+import pytest
+from flask_sqlalchemy.model import Model
+from src.services.utils.helpers.knowledge_bayesian_network_constructor.knowledge_bayesian_network_constructor import (
+    knowledge_bayesian_network_constructor,
+)
+from src.services.utils.helpers.knowledge_evidence_loader.knowledge_evidence_loader import (
+    knowledge_evidence_loader,
+)
+
+
+class TestKnowledgeBayesianNetworkConstructor:
+    """Test suite for the Knowledge Bayesian Network Constructor"""
+
+    def test_evidence_loader_finds_user_evidence(
+        self, models: Dict[str, Model], db, mock_student, course_factory
+    ):
+        """Test case to assert that only passed tests and fired knowledge interactions are evidence
+
+        Args:
+            models (Dict[str, Model]): Dictionary of all of the models
+            db (DB): Database connection
+            mock_student (Model): Mock Student
+            course_factory (function): Mock Course Factory
+        """
+        course = course_factory(templates=1, pages_per_template=4)
+        passed_test, failed_test = course["practice_tests"]
+        knowledge_interaction, learning_style_interaction = course["interactions"][:2]
+        db.session.add_all(
+            [
+                models["TestAttempt"](
+                    user=mock_student, practice_test=passed_test, acquired_score=5
+                ),
+                models["TestAttempt"](
+                    user=mock_student, practice_test=failed_test, acquired_score=4
+                ),
+                models["InteractionFired"](
+                    user=mock_student, measurable_interaction=knowledge_interaction
+                ),
+                models["InteractionFired"](
+                    user=mock_student,
+                    measurable_interaction=learning_style_interaction,
+                ),
+            ]
+        )
+        db.session.commit()
+
+        knowledge_evidence = knowledge_evidence_loader(models, mock_student)
+
+        assert passed_test.page_id in knowledge_evidence["passed_practice_tests"]
+        assert failed_test.page_id not in knowledge_evidence["passed_practice_tests"]
+        assert knowledge_interaction.id in knowledge_evidence["fired_interactions"]
+        assert (
+            learning_style_interaction.id
+            not in knowledge_evidence["fired_interactions"]
+        )
+
+    def test_network_estimates_expected_knowledge(
+        self, models: Dict[str, Model], db, mock_student, course_factory
+    ):
+        """Test case to assert that the Leaky OR estimation uses the observed evidence
+
+        Args:
+            models (Dict[str, Model]): Dictionary of all of the models
+            db (DB): Database connection
+            mock_student (Model): Mock Student
+            course_factory (function): Mock Course Factory
+        """
+        course = course_factory(templates=1, pages_per_template=2)
+        db.session.add(
+            models["TestAttempt"](
+                user=mock_student,
+                practice_test=course["practice_tests"][0],
+                acquired_score=10,
+            )
+        )
+        db.session.commit()
+
+        bayesian_network = knowledge_bayesian_network_constructor(models, mock_student)
+
+        template = course["templates"][0]
+        template_knowledge = 1 - (1 - 60 / 100) * (1 - 5 / 100)
+        assert bayesian_network.nodes[template.id][
+            "expected_knowledge"
+        ] == pytest.approx(template_knowledge)
+        assert bayesian_network.nodes[template.id]["evidence_observed"]
+        assert bayesian_network.nodes[course["topic"].id][
+            "expected_knowledge"
+        ] == pytest.approx(1 - (1 - 80 / 100) * (1 - 10 / 100))
+
+    def test_query_count_does_not_grow_with_course_size(
+        self, models: Dict[str, Model], mock_student, course_factory, query_counter
+    ):
+        """Test case to assert that the number of queries is independent of the course size
+
+        Args:
+            models (Dict[str, Model]): Dictionary of all of the models
+            mock_student (Model): Mock Student
+            course_factory (function): Mock Course Factory
+            query_counter (list): Executed SQL Statements
+        """
+        course_factory(templates=1, pages_per_template=2)
+        query_counter.clear()
+        knowledge_bayesian_network_constructor(models, mock_student)
+        small_course_queries = len(query_counter)
+
+        course_factory(templates=5, pages_per_template=10)
+        query_counter.clear()
+        knowledge_bayesian_network_constructor(models, mock_student)
+        large_course_queries = len(query_counter)
+
+        assert small_course_queries == large_course_queries
@@ -0,0 +1,223 @@
+# -*- coding: utf-8 -*-
+"""Test case suite for the Array Backed Knowledge Inference Engine."""
+
+import uuid
+from typing import Dict
+
+import pytest
+from easygraph.classes.directed_graph import DiGraph
+from flask_sqlalchemy.model import Model
+from src.services.utils.helpers.knowledge_bayesian_network_constructor.knowledge_bayesian_network_constructor import (
+    knowledge_bayesian_network_constructor,
+)
+from src.services.utils.helpers.knowledge_inference_engine import (
+    knowledge_inference_engine as engine_module,
+)
+from src.services.utils.helpers.knowledge_inference_engine.knowledge_inference_engine import (
+    compile_knowledge_inference_engine,
+    evaluate_knowledge_inference_engine,
+    knowledge_ancestor_closure,
+    knowledge_inference_engine,
+)
+from src.services.utils.helpers.version_counter.version_counter import (
+    bump_domain_version,
+)
+
+
+class TestKnowledgeInferenceEngine:
+    """Test suite for the Array Backed Knowledge Inference Engine"""
+
+    def test_engine_matches_reference_network(
+        self, models: Dict[str, Model], db, mock_student, course_factory
+    ):
+        """Test case to assert that the Engine estimates the same Knowledge as the reference Network
+
+        Args:
+            models (Dict[str, Model]): Dictionary of all of the models
+            db (DB): Database connection
+            mock_student (Model): Mock Student
+            course_factory (function): Mock Course Factory
+        """
+        courses = [
+            course_factory(templates=templates, pages_per_template=4)
+            for templates in (1, 2, 3, 1)
+        ]
+        # Precedence Relations forming a diamond: 0 -> 2, 1 -> 2, 2 -> 3.
+        for predecessor, successor, knowledge_weight in (
+            (0, 2, 70),
+            (1, 2, 30),
+            (2, 3, 90),
+        ):
+            db.session.add(
+                models["TopicPrecedence"](
+                    predecessor_id=courses[predecessor]["topic"].id,
+                    successor_id=courses[successor]["topic"].id,
+                    knowledge_weight=knowledge_weight,
+                )
+            )
+        # Pass half of the Practice Tests and fire half of the Interactions.
+        for course in courses:
+            for practice_test in course["practice_tests"][::2]:
+                db.session.add(
+                    models["TestAttempt"](
+                        user=mock_student,
+                        practice_test=practice_test,
+                        acquired_score=10,
+                    )
+                )
+            for interaction in course["interactions"][::2]:
+                db.session.add(
+                    models["InteractionFired"](
+                        user=mock_student, measurable_interaction=interaction
+                    )
+                )
+        bump_domain_version(db)
+        db.session.commit()
+
+        reference_network = knowledge_bayesian_network_constructor(models, mock_student)
+        knowledge_estimation = knowledge_inference_engine(models, mock_student)
+
+        compared_nodes = 0
+        for node_id, node in reference_network.nodes.items():
+            if "expected_knowledge" not in node:
+                continue
+            assert knowledge_estimation[node_id]["expected_knowledge"] == pytest.approx(
+                node["expected_knowledge"]
+            )
+            assert (
+                knowledge_estimation[node_id]["evidence_observed"]
+                == node["evidence_observed"]
+            )
+            compared_nodes += 1
+        for course in courses:
+            assert "expected_knowledge" in knowledge_estimation[course["topic"].id]
+        assert compared_nodes >= 4 + 7
+
+    def test_engine_evaluates_levels_and_nodes_without_parents(self):
+        """Test case to assert that the Engine handles chains and nodes without parents"""
+        evidence, template, topic, successor_topic, lonely_topic = (
+            uuid.uuid4() for _ in range(5)
+        )
+        network = DiGraph()
+        network.add_node(evidence, entity_type="interaction", evidence_observed=False)
+        for node_id, entity_type in (
+            (template, "template"),
+            (topic, "topic"),
+            (successor_topic, "topic"),
+            (lonely_topic, "topic"),
+        ):
+            network.add_node(
+                node_id,
+                default_knowledge=50,
+                leak_parameter=0.1,
+                entity_type=entity_type,
+            )
+        edges = {
+            (evidence, template): 80,
+            (template, topic): 80,
+            (topic, successor_topic): 80,
+        }
+        for (predecessor, successor), knowledge_weight in edges.items():
+            network.add_edge(predecessor, successor, knowledge_weight=knowledge_weight)
+
+        engine = compile_knowledge_inference_engine(
+            {"network": network, "edges": edges}
+        )
+        knowledge_estimation = evaluate_knowledge_inference_engine(engine, {evidence})
+
+        chain_knowledge = 1 - 0.2 * 0.9
+        assert len(engine["levels"]) == 3
+        assert knowledge_estimation[template]["expected_knowledge"] == pytest.approx(
+            chain_knowledge
+        )
+        assert knowledge_estimation[topic]["expected_knowledge"] == pytest.approx(
+            chain_knowledge
+        )
+        assert knowledge_estimation[successor_topic][
+            "expected_knowledge"
+        ] == pytest.approx(chain_knowledge)
+        # A node without parents only has its leak.
+        assert knowledge_estimation[lonely_topic][
+            "expected_knowledge"
+        ] == pytest.approx(0.1)
+        assert not knowledge_estimation[lonely_topic]["evidence_observed"]
+        assert "expected_knowledge" not in knowledge_estimation[evidence]
+
+    def test_ancestor_closures_are_bounded(self, monkeypatch):
+        """Test case to assert that only the most recently used Ancestor Closures are cached
+
+        Args:
+            monkeypatch (MonkeyPatch): Pytest MonkeyPatch
+        """
+        monkeypatch.setattr(engine_module, "MAX_ANCESTOR_CLOSURES", 2)
+        topic_ids = [uuid.uuid4() for _ in range(3)]
+        network = DiGraph()
+        for topic_id in topic_ids:
+            network.add_node(
+                topic_id, default_knowledge=50, leak_parameter=0.1, entity_type="topic"
+            )
+        engine = compile_knowledge_inference_engine({"network": network, "edges": {}})
+
+        first_closure = knowledge_ancestor_closure(engine, [topic_ids[0]])
+        knowledge_ancestor_closure(engine, [topic_ids[1]])
+        assert knowledge_ancestor_closure(engine, [topic_ids[0]]) is first_closure
+        knowledge_ancestor_closure(engine, [topic_ids[2]])
+
+        # NOTE: The closure of the second Topic was the least recently used one.
+        assert len(engine["ancestor_index"]) == 2
+        assert knowledge_ancestor_closure(engine, [topic_ids[0]]) is first_closure
+        assert frozenset([engine["node_index"][topic_ids[1]]]) not in (
+            engine["ancestor_index"]
+        )
+
+    def test_target_nodes_only_evaluate_their_ancestors(
+        self, models: Dict[str, Model], db, mock_student, course_factory, query_counter
+    ):
+        """Test case to assert that only the ancestor closure of the target nodes is evaluated
+
+        Args:
+            models (Dict[str, Model]): Dictionary of all of the models
+            db (DB): Database connection
+            mock_student (Model): Mock Student
+            course_factory (function): Mock Course Factory
+            query_counter (list): Executed SQL Statements
+        """
+        course, unrelated_course = (
+            course_factory(templates=2, pages_per_template=2) for _ in range(2)
+        )
+        for practice_test in (
+            course["practice_tests"] + unrelated_course["practice_tests"]
+        ):
+            db.session.add(
+                models["TestAttempt"](
+                    user=mock_student, practice_test=practice_test, acquired_score=10
+                )
+            )
+        db.session.commit()
+        target_ids = [course["topic"].id, course["templates"][0].id]
+        unrelated_topic_id = unrelated_course["topic"].id
+        unrelated_page_id = unrelated_course["practice_tests"][0].page_id
+        page_id = course["practice_tests"][0].page_id
+        full_estimation = knowledge_inference_engine(models, mock_student)
+        query_counter.clear()
+
+        partial_estimation = knowledge_inference_engine(
+            models, mock_student, target_ids
+        )
+
+        for node_id in target_ids:
+            assert partial_estimation[node_id]["expected_knowledge"] == pytest.approx(
+                full_estimation[node_id]["expected_knowledge"]
+            )
+        assert (
+            "expected_knowledge" not in partial_estimation[unrelated_course["topic"].id]
+        )
+        # NOTE: Only the Evidence of the Templates of the closure is loaded.
+        assert not partial_estimation[unrelated_course["practice_tests"][0].page_id][
+            "evidence_observed"
+        ]
+        assert partial_estimation[course["practice_tests"][0].page_id][
+            "evidence_observed"
+        ]
+        # The Domain Version and the Evidence of the closure.
+        assert len(query_counter) == 3
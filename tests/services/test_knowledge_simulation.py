@@ -0,0 +1,163 @@
+# -*- coding: utf-8 -*-
+"""Test case suite for the Knowledge Simulation."""
+
+import uuid
+from typing import Dict
+
+import numpy as np
+from flask_sqlalchemy.model import Model
+from src.services.utils.helpers.adaptation_rule_engine.adaptation_rule_engine import (
+    find_scenarios_triggered_adaptative_events,
+)
+from src.services.utils.helpers.knowledge_evidence_loader.knowledge_evidence_loader import (
+    knowledge_evidence_loader,
+)
+from src.services.utils.helpers.knowledge_inference_engine.knowledge_inference_engine import (
+    evaluate_knowledge_inference_engine,
+)
+from src.services.utils.helpers.knowledge_simulation.knowledge_simulation import (
+    resolve_hypothetical_evidence,
+    user_knowledge_simulation,
+)
+from src.services.utils.helpers.version_counter.version_counter import (
+    bump_rules_version,
+)
+
+
+class TestKnowledgeSimulation:
+    """Test suite for the Knowledge Simulation"""
+
+    def test_hypothetical_evidence_is_resolved_to_evidence_nodes(
+        self, models: Dict[str, Model], course_factory
+    ):
+        """Test case to assert that Practice Tests are resolved to their Pages and that other deltas are rejected
+
+        Args:
+            models (Dict[str, Model]): Dictionary of all of the models
+            course_factory (function): Mock Course Factory
+        """
+        course = course_factory(templates=1, pages_per_template=2)
+        practice_test = course["practice_tests"][0]
+        knowledge_interaction, learning_style_interaction = course["interactions"]
+        invalid_deltas = [
+            {"measurable_interaction_id": str(learning_style_interaction.id)},
+            {"practice_test_id": str(uuid.uuid4())},
+            {"practice_test_id": "not-an-id"},
+        ]
+
+        scenarios_evidence_changes, unresolved_deltas = resolve_hypothetical_evidence(
+            models,
+            [
+                [{"practice_test_id": str(practice_test.id), "passed": True}],
+                [
+                    {
+                        "measurable_interaction_id": str(knowledge_interaction.id),
+                        "fired": False,
+                    },
+                    *invalid_deltas,
+                ],
+            ],
+        )
+
+        assert scenarios_evidence_changes == [
+            {practice_test.page_id: True},
+            {knowledge_interaction.id: False},
+        ]
+        assert unresolved_deltas == invalid_deltas
+
+    def test_scenarios_match_a_full_estimation(
+        self, models: Dict[str, Model], mock_student, course_factory
+    ):
+        """Test case to assert that every scenario is estimated like the full network, starting from the current state
+
+        Args:
+            models (Dict[str, Model]): Dictionary of all of the models
+            mock_student (Model): Mock Student
+            course_factory (function): Mock Course Factory
+        """
+        course = course_factory(templates=2, pages_per_template=2)
+        evidence_ids = [
+            practice_test.page_id for practice_test in course["practice_tests"]
+        ] + [course["interactions"][0].id]
+        simulation = user_knowledge_simulation(models, mock_student)
+        knowledge_estimation = simulation.knowledge_estimation
+        expected_knowledge = knowledge_estimation.expected_knowledge.copy()
+        knowledge_evidence = knowledge_evidence_loader(models, mock_student)
+        observed_evidence_ids = (
+            knowledge_evidence["passed_practice_tests"]
+            | knowledge_evidence["fired_interactions"]
+        )
+
+        for scenario_evidence_ids in (evidence_ids[:1], evidence_ids, evidence_ids[:1]):
+            changed_nodes = simulation.simulate(
+                {evidence_id: True for evidence_id in scenario_evidence_ids}
+            )
+            full_estimation = evaluate_knowledge_inference_engine(
+                simulation.engine, observed_evidence_ids | set(scenario_evidence_ids)
+            )
+            assert changed_nodes
+            # NOTE: Only the Topics and Templates are estimated.
+            for node_id, index in simulation.engine["node_index"].items():
+                if not simulation.engine["latent"][index]:
+                    continue
+                simulated_node = changed_nodes.get(
+                    node_id, knowledge_estimation[node_id]
+                )
+                assert (
+                    simulated_node["evidence_observed"]
+                    == full_estimation[node_id]["evidence_observed"]
+                )
+                np.testing.assert_allclose(
+                    simulated_node.get("expected_knowledge", np.nan),
+                    full_estimation[node_id].get("expected_knowledge", np.nan),
+                )
+
+        # NOTE: The Knowledge State of the User is never modified.
+        np.testing.assert_array_equal(
+            knowledge_estimation.expected_knowledge, expected_knowledge
+        )
+
+    def test_every_scenario_triggers_its_own_events(
+        self, models: Dict[str, Model], db, mock_student, course_factory
+    ):
+        """Test case to assert that the Events of every Knowledge scenario are evaluated apart
+
+        Args:
+            models (Dict[str, Model]): Dictionary of all of the models
+            db (DB): Database connection
+            mock_student (Model): Mock Student
+            course_factory (function): Mock Course Factory
+        """
+        topic = course_factory()["topic"]
+        adaptative_event = models["AdaptativeEvent"](
+            triggered_change="HIGHLIGHT",
+            relative_position=1,
+            condition_aggregator="AND",
+            adaptative_object=topic.adaptative_object,
+        )
+        adaptative_event.adaptation_conditions.append(
+            models["AdaptationCondition"](
+                variable_to_compare="TOPIC_KNOWLEDGE",
+                comparation_condition="gte",
+                value_to_compare=50,
+            )
+        )
+        db.session.add(adaptative_event)
+        bump_rules_version(db)
+        db.session.commit()
+
+        scenarios_events = find_scenarios_triggered_adaptative_events(
+            models,
+            mock_student,
+            {topic.adaptative_object_id: (topic.id, None)},
+            [
+                {topic.id: {"expected_knowledge": 0.9}},
+                {topic.id: {"expected_knowledge": 0.1}},
+                {topic.id: {"evidence_observed": False}},
+            ],
+        )
+
+        assert [
+            [event["id"] for event in events[topic.adaptative_object_id]]
+            for events in scenarios_events
+        ] == [[adaptative_event.id], [], []]
@@ -0,0 +1,210 @@
+# -*- coding: utf-8 -*-
+"""Test case suite for the Learning Style Bayesian Network Constructor."""
+
+import uuid
+from typing import Dict
+
+import pytest
+from flask_sqlalchemy.model import Model
+from src.services.utils.helpers.learning_style_affinity.learning_style_affinity import (
+    LEARNING_STYLE_AFFINITY_COLUMNS,
+    compute_learning_style_affinities,
+    rebuild_learning_style_affinities,
+    update_learning_style_affinities,
+)
+from src.services.utils.helpers.learning_style_bayesian_network_constructor.learning_style_bayesian_network_constructor import (
+    learning_style_bayesian_network_constructor,
+)
+
+
+@pytest.fixture
+def mock_learning_style_student(models: Dict[str, Model], db):
+    """Fixture to create a Student without any fired Interaction
+
+    Args:
+        models (Dict[str, Model]): Dictionary of all of the models
+        db (DB): Database connection
+
+    Returns:
+        Model: Mock Student
+    """
+    new_instance = models["User"](
+        email=f"{uuid.uuid4()}@example.com",
+        first_name="Learning Style",
+        last_name="Student",
+        vark_completed=True,
+    )
+    new_instance.role.append(models["Role"](role_name="student", is_enabled=True))
+    new_instance.learning_style = models["LearningStyle"](
+        visual=1, aural=2, kinesthetic=3, textual=4
+    )
+    db.session.add(new_instance)
+    db.session.commit()
+    return new_instance
+
+
+def fire_interactions(
+    models: Dict[str, Model], db, student, learning_content, interaction_weights: dict
+):
+    """Function to fire new Interactions the same way the Fired Interaction controller does
+
+    Args:
+        models (Dict[str, Model]): Dictionary of all of the models
+        db (DB): Database connection
+        student (Model): Student that fires the Interactions
+        learning_content (Model): Learning Content of the Interactions
+        interaction_weights (dict): Weights of the Interactions of every Learning Style
+    """
+    for learning_style_attribute, weights in interaction_weights.items():
+        for interaction_weight in weights:
+            interaction = models["MeasurableInteraction"](
+                interaction_weight=interaction_weight,
+                interaction_trigger="click",
+                learning_style_attribute=learning_style_attribute,
+            )
+            learning_content.measurable_interactions.append(interaction)
+            db.session.add(
+                models["InteractionFired"](
+                    user=student, measurable_interaction=interaction
+                )
+            )
+            db.session.flush()
+            update_learning_style_affinities(db, models, student.id, interaction.id)
+            db.session.commit()
+
+
+class TestLearningStyleBayesianNetworkConstructor:
+    """Test suite for the Learning Style Bayesian Network Constructor"""
+
+    def test_affinities_follow_noisy_or(
+        self,
+        models: Dict[str, Model],
+        db,
+        mock_learning_style_student,
+        course_factory,
+        query_counter,
+    ):
+        """Test case to assert that the stored Affinities follow the Noisy-OR of every Learning Style
+
+        Args:
+            models (Dict[str, Model]): Dictionary of all of the models
+            db (DB): Database connection
+            mock_learning_style_student (Model): Mock Student
+            course_factory (function): Mock Course Factory
+            query_counter (list): Executed SQL Statements
+        """
+        course = course_factory(templates=1, pages_per_template=2)
+        interaction_weights = {
+            "VISUAL": [50, 50],
+            "AURAL": [20],
+            "KINESTHETIC": [100, 30],
+            "TEXTUAL": [10, 10, 10],
+        }
+        fire_interactions(
+            models,
+            db,
+            mock_learning_style_student,
+            course["interactions"][0].learning_content,
+            interaction_weights,
+        )
+        # The Learning Style of the Student is loaded before counting.
+        assert mock_learning_style_student.learning_style.visual == 1
+        query_counter.clear()
+
+        learning_style_values = learning_style_bayesian_network_constructor(
+            models, mock_learning_style_student
+        )
+
+        expected_affinities = {}
+        for learning_style, weights in interaction_weights.items():
+            expected_affinity_modifier = 1
+            for interaction_weight in weights:
+                expected_affinity_modifier *= 1 - interaction_weight / 100
+            expected_affinities[learning_style] = 1 - expected_affinity_modifier
+        affinities_sum = sum(expected_affinities.values())
+        for learning_style, expected_affinity in expected_affinities.items():
+            assert learning_style_values[learning_style] == pytest.approx(
+                expected_affinity / affinities_sum
+            )
+        # NOTE: The Affinities are read from the already loaded Learning Style.
+        assert len(query_counter) == 0
+
+    def test_vark_values_are_used_until_every_style_has_interactions(
+        self, models: Dict[str, Model], db, mock_learning_style_student, course_factory
+    ):
+        """Test case to assert that the VARK values are used if a Learning Style has no Interactions
+
+        Args:
+            models (Dict[str, Model]): Dictionary of all of the models
+            db (DB): Database connection
+            mock_learning_style_student (Model): Mock Student
+            course_factory (function): Mock Course Factory
+        """
+        course = course_factory(templates=1, pages_per_template=2)
+        fire_interactions(
+            models,
+            db,
+            mock_learning_style_student,
+            course["interactions"][0].learning_content,
+            {"VISUAL": [90], "AURAL": [90], "KINESTHETIC": [90]},
+        )
+
+        learning_style_values = learning_style_bayesian_network_constructor(
+            models, mock_learning_style_student
+        )
+
+        assert learning_style_values == pytest.approx(
+            {"VISUAL": 0.1, "AURAL": 0.2, "KINESTHETIC": 0.3, "TEXTUAL": 0.4}
+        )
+
+    def test_stored_affinities_match_recomputed_affinities(
+        self, models: Dict[str, Model], db, mock_learning_style_student, course_factory
+    ):
+        """Test case to assert that the stored Affinities are the same as recomputing them
+
+        Args:
+            models (Dict[str, Model]): Dictionary of all of the models
+            db (DB): Database connection
+            mock_learning_style_student (Model): Mock Student
+            course_factory (function): Mock Course Factory
+        """
+        course = course_factory(templates=1, pages_per_template=2)
+        student_id = mock_learning_style_student.id
+        learning_content = course["interactions"][0].learning_content
+        fire_interactions(
+            models,
+            db,
+            mock_learning_style_student,
+            learning_content,
+            {"VISUAL": [35, 70], "AURAL": [5] * 20, "TEXTUAL": [99, 1]},
+        )
+        # Interactions without a Learning Style do not change the Affinities.
+        fire_interactions(
+            models, db, mock_learning_style_student, learning_content, {None: [90]}
+        )
+
+        learning_style = (
+            models["LearningStyle"].query.filter_by(user_id=student_id).one()
+        )
+        recomputed_affinities = compute_learning_style_affinities(models, student_id)
+        assert set(recomputed_affinities) == {"VISUAL", "AURAL", "TEXTUAL"}
+        assert learning_style.kinesthetic_affinity is None
+        for (
+            learning_style_attribute,
+            expected_affinity,
+        ) in recomputed_affinities.items():
+            assert getattr(
+                learning_style,
+                LEARNING_STYLE_AFFINITY_COLUMNS[learning_style_attribute],
+            ) == pytest.approx(expected_affinity)
+
+        # The bulk rebuild restores the same Affinities.
+        learning_style.visual_affinity = None
+        db.session.commit()
+        assert rebuild_learning_style_affinities(db, models) == (
+            models["LearningStyle"].query.count()
+        )
+        db.session.refresh(learning_style)
+        assert learning_style.visual_affinity == pytest.approx(
+            recomputed_affinities["VISUAL"]
+        )
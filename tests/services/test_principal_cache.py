@@ -0,0 +1,169 @@
+# -*- coding: utf-8 -*-
+"""Test case suite for the Principal Cache."""
+
+import uuid
+from typing import Dict
+
+import pytest
+from flask_sqlalchemy.model import Model
+from src.services.utils.helpers.principal_cache.principal_cache import (
+    PRINCIPAL_TTL_SECONDS,
+    invalidate_principal,
+    load_principal,
+    refresh_learning_style,
+)
+from src.services.utils.helpers.version_counter.version_counter import (
+    bump_version,
+    get_learning_style_counter_name,
+)
+
+
+@pytest.fixture
+def mock_principal_student(models: Dict[str, Model], db):
+    """Fixture to create a mock Student, detached from the session as in a new request
+
+    Args:
+        models (Dict[str, Model]): Dictionary of all of the models
+        db (DB): Database connection
+
+    Returns:
+        UUID: ID of the mock Student
+    """
+    new_instance = models["User"](
+        email=f"{uuid.uuid4()}@example.com",
+        first_name="Example",
+        last_name="Student",
+    )
+    new_instance.role.append(models["Role"](role_name="student", is_enabled=True))
+    new_instance.learning_style = models["LearningStyle"](
+        visual=1, aural=2, kinesthetic=3, textual=4
+    )
+    db.session.add(new_instance)
+    db.session.commit()
+    user_id = new_instance.id
+    db.session.expunge(new_instance)
+    return user_id
+
+
+class TestPrincipalCache:
+    """Test suite for the Principal Cache"""
+
+    def test_warm_principals_need_no_queries(
+        self, models: Dict[str, Model], db, mock_principal_student, query_counter
+    ):
+        """Test case to assert that the User and its Roles are loaded in one query, and then served from the cache
+
+        Args:
+            models (Dict[str, Model]): Dictionary of all of the models
+            db (DB): Database connection
+            mock_principal_student (UUID): ID of the mock Student
+            query_counter (list): Executed SQL Statements
+        """
+        principal = load_principal(models["User"], str(mock_principal_student))
+        assert [role.role_name for role in principal.role] == ["student"]
+        assert principal.learning_style is not None
+        assert len(query_counter) == 1
+
+        # A new request gets its own instance, without querying the Database.
+        db.session.expunge(principal)
+        query_counter.clear()
+        cached_principal = load_principal(models["User"], mock_principal_student)
+        assert cached_principal is not principal
+        assert cached_principal in db.session
+        assert cached_principal.email == principal.email
+        assert [role.role_name for role in cached_principal.role] == ["student"]
+        assert len(query_counter) == 0
+
+        # NOTE: The cached Learning Style is used while its Version is current.
+        assert cached_principal.learning_style.textual == 4
+        refresh_learning_style(cached_principal, 0)
+        assert cached_principal.learning_style.textual == 4
+        assert len(query_counter) == 0
+        db.session.expunge(cached_principal)
+
+        assert load_principal(models["User"], uuid.uuid4()) is None
+        assert load_principal(models["User"], "not-an-id") is None
+
+    def test_learning_style_is_refreshed_when_its_version_changes(
+        self, models: Dict[str, Model], db, mock_principal_student, query_counter
+    ):
+        """Test case to assert that the cached Learning Style is only read again once its Version changes
+
+        Args:
+            models (Dict[str, Model]): Dictionary of all of the models
+            db (DB): Database connection
+            mock_principal_student (UUID): ID of the mock Student
+            query_counter (list): Executed SQL Statements
+        """
+        learning_style_counter_name = get_learning_style_counter_name(
+            mock_principal_student
+        )
+        bump_version(db, learning_style_counter_name)
+        db.session.commit()
+        db.session.expunge(load_principal(models["User"], mock_principal_student))
+
+        # Another process updates the Learning Style, without invalidating the Principal.
+        learning_style = (
+            models["LearningStyle"]
+            .query.filter_by(user_id=mock_principal_student)
+            .one()
+        )
+        learning_style.textual = 5
+        learning_style_version = bump_version(db, learning_style_counter_name)
+        db.session.commit()
+        db.session.expunge(learning_style)
+
+        query_counter.clear()
+        principal = load_principal(models["User"], mock_principal_student)
+        refresh_learning_style(principal, learning_style_version - 1)
+        assert principal.learning_style.textual == 4
+        assert len(query_counter) == 0
+
+        refresh_learning_style(principal, learning_style_version)
+        assert principal.learning_style.textual == 5
+        assert len(query_counter) == 1
+        db.session.expunge(principal)
+
+        # The next request loads the new Learning Style with its Version.
+        principal = load_principal(models["User"], mock_principal_student)
+        refresh_learning_style(principal, learning_style_version)
+        assert principal.learning_style.textual == 5
+        assert len(query_counter) == 2
+        db.session.expunge(principal)
+
+    def test_principals_are_reloaded_when_invalidated_or_expired(
+        self, models: Dict[str, Model], db, mock_principal_student, query_counter
+    ):
+        """Test case to assert that changed Roles are seen after invalidating the Principal, or once it expires
+
+        Args:
+            models (Dict[str, Model]): Dictionary of all of the models
+            db (DB): Database connection
+            mock_principal_student (UUID): ID of the mock Student
+            query_counter (list): Executed SQL Statements
+        """
+        clock = {"seconds": 0}
+
+        def load() -> list:
+            principal = load_principal(
+                models["User"], mock_principal_student, clock=lambda: clock["seconds"]
+            )
+            role_names = sorted(role.role_name for role in principal.role)
+            db.session.expunge(principal)
+            return role_names
+
+        load()
+        user = models["User"].query.get(mock_principal_student)
+        user.role.append(models["Role"](role_name="teacher", is_enabled=True))
+        db.session.commit()
+        db.session.expunge(user)
+        assert load() == ["student"]
+
+        invalidate_principal(mock_principal_student)
+        query_counter.clear()
+        assert load() == ["student", "teacher"]
+        assert len(query_counter) == 1
+
+        clock["seconds"] += PRINCIPAL_TTL_SECONDS
+        load()
+        assert len(query_counter) == 2
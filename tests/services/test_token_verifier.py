@@ -0,0 +1,182 @@
+# -*- coding: utf-8 -*-
+"""Test case suite for the Token Verifiers and the local token Commands."""
+
+import json
+import time
+import uuid
+from typing import Dict
+
+import pytest
+from click.testing import CliRunner
+from flask import Flask
+from flask.cli import ScriptInfo
+from flask_sqlalchemy.model import Model
+from google.auth import jwt
+from src.commands.auth.mint_local_tokens import (
+    create_generate_local_keys_command,
+    create_mint_local_tokens_command,
+)
+from src.services.utils.helpers.token_verifier.token_verifier import (
+    LOCAL_TOKEN_ISSUER,
+    FirebaseTokenVerifier,
+    LocalTokenVerifier,
+    TokenVerifier,
+    create_token_verifier,
+    generate_local_keys,
+    load_local_signer,
+    mint_local_token,
+)
+
+
+def write_local_keys(directory) -> tuple:
+    """Function to generate a local key pair into a directory
+
+    Args:
+        directory (Path): Directory of the key files
+
+    Returns:
+        tuple: Paths of the private key and of the public keys.
+    """
+    private_key_file = directory / "local_private_key.pem"
+    public_keys_file = directory / "local_public_keys.json"
+    result = CliRunner().invoke(
+        create_generate_local_keys_command(),
+        [str(private_key_file), str(public_keys_file)],
+    )
+    assert result.exit_code == 0, result.output
+    return private_key_file, public_keys_file
+
+
+class TestTokenVerifier:
+    """Test suite for the Token Verifiers"""
+
+    def test_local_tokens_are_verified_in_process(self, tmp_path):
+        """Test case to assert that the local tokens are only accepted if they are signed with the local keys
+
+        Args:
+            tmp_path (Path): Temporary directory
+        """
+        private_key_file, public_keys_file = write_local_keys(tmp_path)
+        verifier = LocalTokenVerifier.from_file(str(public_keys_file))
+        signer = load_local_signer(str(private_key_file))
+        user_id = uuid.uuid4()
+
+        token = mint_local_token(signer, user_id)
+        assert verifier.verify(token)["user_id"] == str(user_id)
+        # NOTE: A single PEM public key is also accepted.
+        single_key_file = tmp_path / "local_public_key.pem"
+        single_key_file.write_text(json.loads(public_keys_file.read_text())["local"])
+        assert LocalTokenVerifier.from_file(str(single_key_file)).verify(token)
+
+        other_private_key_file = tmp_path / "other_private_key.pem"
+        other_private_key_file.write_text(generate_local_keys()[0])
+        forged_token = mint_local_token(
+            load_local_signer(str(other_private_key_file)), user_id
+        )
+        with pytest.raises(ValueError):
+            verifier.verify(forged_token)
+        with pytest.raises(ValueError):
+            verifier.verify(mint_local_token(signer, user_id, expires_in=-3600))
+
+    def test_local_tokens_of_other_issuers_are_rejected(self, tmp_path):
+        """Test case to assert that tokens signed with the local keys are rejected if another issuer issued them
+
+        Args:
+            tmp_path (Path): Temporary directory
+        """
+        private_key_file, public_keys_file = write_local_keys(tmp_path)
+        verifier = LocalTokenVerifier.from_file(str(public_keys_file))
+        signer = load_local_signer(str(private_key_file))
+        user_id = str(uuid.uuid4())
+        issued_at = int(time.time())
+        claims = {
+            "aud": LOCAL_TOKEN_ISSUER,
+            "sub": user_id,
+            "user_id": user_id,
+            "iat": issued_at,
+            "exp": issued_at + 3600,
+        }
+
+        for issuer in ("https://securetoken.google.com/other", None):
+            token_claims = claims if issuer is None else {**claims, "iss": issuer}
+            with pytest.raises(ValueError):
+                verifier.verify(jwt.encode(signer, token_claims).decode("utf-8"))
+        assert (
+            verifier.verify(
+                jwt.encode(signer, {**claims, "iss": LOCAL_TOKEN_ISSUER}).decode(
+                    "utf-8"
+                )
+            )["user_id"]
+            == user_id
+        )
+
+    def test_token_verifiers_must_implement_verify(self):
+        """Test case to assert that the base Token Verifier cannot be instantiated"""
+        with pytest.raises(TypeError):
+            TokenVerifier()
+
+    def test_verifier_is_chosen_by_the_environment(self, tmp_path, monkeypatch):
+        """Test case to assert that Firebase is the default Verifier, and that the local one needs its keys
+
+        Args:
+            tmp_path (Path): Temporary directory
+            monkeypatch (MonkeyPatch): Pytest MonkeyPatch
+        """
+        monkeypatch.delenv("AUTH_VERIFIER", raising=False)
+        assert isinstance(create_token_verifier(), FirebaseTokenVerifier)
+
+        monkeypatch.setenv("AUTH_VERIFIER", "local")
+        monkeypatch.delenv("LOCAL_JWT_PUBLIC_KEYS_FILE", raising=False)
+        with pytest.raises(ValueError):
+            create_token_verifier()
+        _, public_keys_file = write_local_keys(tmp_path)
+        monkeypatch.setenv("LOCAL_JWT_PUBLIC_KEYS_FILE", str(public_keys_file))
+        assert isinstance(create_token_verifier(), LocalTokenVerifier)
+
+        monkeypatch.setenv("AUTH_VERIFIER", "unknown")
+        with pytest.raises(ValueError):
+            create_token_verifier()
+
+    def test_minted_tokens_authenticate_new_users(
+        self, app: Flask, models: Dict[str, Model], db, tmp_path, monkeypatch
+    ):
+        """Test case to assert that the minting Command creates a User with the Role of every token
+
+        Args:
+            app (Flask): Flask Application of the Database
+            models (Dict[str, Model]): Dictionary of all of the models
+            db (DB): Database connection
+            tmp_path (Path): Temporary directory
+            monkeypatch (MonkeyPatch): Pytest MonkeyPatch
+        """
+        private_key_file, public_keys_file = write_local_keys(tmp_path)
+        tokens_file = tmp_path / "tokens.jsonl"
+        # NOTE: Tearing down the context of the Command must not remove the session
+        # of the Database, whose instances are used by the other tests.
+        monkeypatch.setattr(db.session, "remove", lambda: None)
+        result = CliRunner().invoke(
+            create_mint_local_tokens_command(db, models),
+            [
+                str(private_key_file),
+                "--role",
+                "teacher",
+                "--count",
+                "3",
+                "--output",
+                str(tokens_file),
+            ],
+            obj=ScriptInfo(create_app=lambda: app),
+        )
+        assert result.exit_code == 0, result.output
+
+        verifier = LocalTokenVerifier.from_file(str(public_keys_file))
+        minted_tokens = [
+            json.loads(line) for line in tokens_file.read_text().splitlines()
+        ]
+        assert len(minted_tokens) == 3
+        for minted_token in minted_tokens:
+            claims = verifier.verify(minted_token["token"])
+            assert claims["user_id"] == minted_token["user_id"]
+            user = models["User"].query.get(claims["user_id"])
+            assert [role.role_name for role in user.role] == ["teacher"]
+            assert user.learning_style is not None
@@ -0,0 +1,139 @@
+# -*- coding: utf-8 -*-
+"""Benchmark suite for the propagation over large Topic Precedence DAGs."""
+
+import random
+import time
+import uuid
+
+import pytest
+from easygraph.classes.directed_graph import DiGraph
+from src.services.utils.helpers.domain_knowledge_graph.domain_knowledge_graph import (
+    topic_precedence_layers,
+)
+from src.services.utils.helpers.knowledge_bayesian_network_constructor.knowledge_bayesian_network_constructor import (
+    estimate_knowledge_bayesian_network,
+)
+from src.services.utils.helpers.knowledge_inference_engine.knowledge_inference_engine import (
+    compile_knowledge_inference_engine,
+    evaluate_knowledge_inference_engine,
+)
+
+# Number of Topics of every benchmarked DAG.
+BENCHMARK_TOPICS = 2000
+
+# NOTE: Generous bound (For the sweep and for compiling and evaluating the Engine),
+# so that slow machines do not fail it.
+MAX_SWEEP_SECONDS = 5
+
+
+def synthetic_domain_graph(layers: int, topics_per_layer: int, fan_in: int) -> dict:
+    """Function to build an in memory Domain Knowledge Graph with the shape of a real one.
+
+    Every Topic has one Template with one Practice Test, and every Topic after the
+    first layer has fan_in Predecessors on the previous layer.
+
+    Args:
+        layers (int): Number of layers of the Topic Precedence DAG.
+        topics_per_layer (int): Number of Topics on every layer.
+        fan_in (int): Number of Predecessors of every Topic.
+
+    Returns:
+        dict: Domain Knowledge Graph (See build_domain_knowledge_graph).
+    """
+    generator = random.Random(layers * topics_per_layer)
+    network = DiGraph()
+    edges = {}
+    topic_layers = [
+        [uuid.uuid4() for _ in range(topics_per_layer)] for _ in range(layers)
+    ]
+    topic_ids = [topic_id for layer in topic_layers for topic_id in layer]
+    template_ids = []
+    for topic_id in topic_ids:
+        network.add_node(
+            topic_id, default_knowledge=50, leak_parameter=0.1, entity_type="topic"
+        )
+        template_id, page_id = uuid.uuid4(), uuid.uuid4()
+        network.add_node(
+            template_id,
+            default_knowledge=50,
+            leak_parameter=0.05,
+            entity_type="template",
+        )
+        network.add_node(page_id, evidence_observed=False, entity_type="practice_test")
+        for predecessor, successor, knowledge_weight in (
+            (template_id, topic_id, 80),
+            (page_id, template_id, 60),
+        ):
+            network.add_edge(predecessor, successor, knowledge_weight=knowledge_weight)
+            edges[(predecessor, successor)] = knowledge_weight
+        template_ids.append(template_id)
+    precedences = []
+    for previous_layer, layer in zip(topic_layers, topic_layers[1:]):
+        for successor in layer:
+            for predecessor in generator.sample(previous_layer, fan_in):
+                network.add_edge(predecessor, successor, knowledge_weight=70)
+                edges[(predecessor, successor)] = 70
+                precedences.append((predecessor, successor))
+
+    # We shuffle the Relations so that the layers do not depend on their order.
+    generator.shuffle(precedences)
+    computed_layers = topic_precedence_layers(topic_ids, precedences)
+    return {
+        "network": network,
+        "edges": edges,
+        "topic_ids": topic_ids,
+        "template_ids": template_ids,
+        "root_topic_ids": topic_layers[0],
+        "topic_layers": computed_layers,
+        "topic_order": [topic_id for layer in computed_layers for topic_id in layer],
+        "expected_layers": topic_layers,
+    }
+
+
+class TestTopicPropagationBenchmark:
+    """Benchmark suite for the propagation over large Topic Precedence DAGs"""
+
+    @pytest.mark.parametrize(
+        "layers,topics_per_layer,fan_in",
+        [(BENCHMARK_TOPICS, 1, 1), (20, BENCHMARK_TOPICS // 20, 3)],
+        ids=["chain", "wide"],
+    )
+    def test_large_dag_is_estimated_in_one_sweep(
+        self, layers: int, topics_per_layer: int, fan_in: int
+    ):
+        """Test case to assert that large Chains and wide DAGs are layered and estimated quickly
+
+        Args:
+            layers (int): Number of layers of the Topic Precedence DAG.
+            topics_per_layer (int): Number of Topics on every layer.
+            fan_in (int): Number of Predecessors of every Topic.
+        """
+        domain_graph = synthetic_domain_graph(layers, topics_per_layer, fan_in)
+        assert [set(layer) for layer in domain_graph["topic_layers"]] == [
+            set(layer) for layer in domain_graph["expected_layers"]
+        ]
+        # Half of the Practice Tests are passed.
+        evidence_ids = {
+            page_id
+            for page_id, node in domain_graph["network"].nodes.items()
+            if node["entity_type"] == "practice_test"
+        }
+        evidence_ids = set(list(evidence_ids)[::2])
+
+        start = time.perf_counter()
+        bayesian_network = estimate_knowledge_bayesian_network(
+            domain_graph, evidence_ids
+        )
+        sweep_seconds = time.perf_counter() - start
+        start = time.perf_counter()
+        knowledge_estimation = evaluate_knowledge_inference_engine(
+            compile_knowledge_inference_engine(domain_graph), evidence_ids
+        )
+        engine_seconds = time.perf_counter() - start
+
+        assert sweep_seconds < MAX_SWEEP_SECONDS
+        assert engine_seconds < MAX_SWEEP_SECONDS
+        for topic_id in domain_graph["topic_ids"]:
+            assert knowledge_estimation[topic_id][
+                "expected_knowledge"
+            ] == pytest.approx(bayesian_network.nodes[topic_id]["expected_knowledge"])
@@ -0,0 +1,177 @@
+# -*- coding: utf-8 -*-
+"""Test case suite for the Triggered Events Cache."""
+
+import json
+import uuid
+from collections import OrderedDict
+from typing import Dict
+
+import pytest
+from flask_sqlalchemy.model import Model
+from src.services.utils.helpers.triggered_events_cache import triggered_events_cache
+from src.services.utils.helpers.triggered_events_cache.triggered_events_cache import (
+    cached_triggered_adaptative_events,
+    triggered_events_diff,
+)
+from src.services.utils.helpers.version_counter.version_counter import (
+    bump_domain_version,
+    bump_rules_version,
+    bump_version,
+    get_evidence_counter_name,
+)
+
+
+def counting_computation(triggered_adaptative_events: list) -> tuple:
+    """Function to create a computation of Triggered Adaptative Events that counts its calls
+
+    Args:
+        triggered_adaptative_events (list): Serialized Events returned by the computation
+
+    Returns:
+        tuple: The computation and the list of its calls.
+    """
+    calls = []
+
+    def compute_triggered_adaptative_events():
+        calls.append(1)
+        return triggered_adaptative_events
+
+    return compute_triggered_adaptative_events, calls
+
+
+class TestTriggeredEventsCache:
+    """Test suite for the Triggered Events Cache"""
+
+    @pytest.mark.parametrize(
+        "bump",
+        [
+            lambda db, user_id: bump_version(db, get_evidence_counter_name(user_id)),
+            lambda db, user_id: bump_domain_version(db),
+            lambda db, user_id: bump_rules_version(db),
+        ],
+        ids=["evidence", "domain", "rules"],
+    )
+    def test_events_are_cached_until_a_version_changes(
+        self, models: Dict[str, Model], db, mock_student, query_counter, bump
+    ):
+        """Test case to assert that the cached Events are served until any of their versions changes
+
+        Args:
+            models (Dict[str, Model]): Dictionary of all of the models
+            db (DB): Database connection
+            mock_student (Model): Mock Student
+            query_counter (list): Executed SQL Statements
+            bump (function): Function that bumps one of the versions
+        """
+        user_id = mock_student.id
+        adaptative_object_id = uuid.uuid4()
+        compute, calls = counting_computation([{"id": str(uuid.uuid4())}])
+
+        first_events = cached_triggered_adaptative_events(
+            models, user_id, adaptative_object_id, compute
+        )
+        query_counter.clear()
+        assert (
+            cached_triggered_adaptative_events(
+                models, user_id, adaptative_object_id, compute
+            )
+            is first_events
+        )
+        # NOTE: Only the versions are read.
+        assert len(query_counter) == 1
+        assert len(calls) == 1
+
+        # The Events of other Users and Adaptative Objects are cached apart.
+        cached_triggered_adaptative_events(
+            models, uuid.uuid4(), adaptative_object_id, compute
+        )
+        cached_triggered_adaptative_events(models, user_id, uuid.uuid4(), compute)
+        assert len(calls) == 3
+
+        bump(db, user_id)
+        db.session.commit()
+        cached_triggered_adaptative_events(
+            models, user_id, adaptative_object_id, compute
+        )
+        assert len(calls) == 4
+
+    def test_least_recently_used_events_are_evicted(
+        self, models: Dict[str, Model], mock_student, monkeypatch
+    ):
+        """Test case to assert that the cache stays under its memory cap, evicting the least recently used Events
+
+        Args:
+            models (Dict[str, Model]): Dictionary of all of the models
+            mock_student (Model): Mock Student
+            monkeypatch (MonkeyPatch): Pytest MonkeyPatch
+        """
+        monkeypatch.setattr(
+            triggered_events_cache, "_triggered_events_cache", OrderedDict()
+        )
+        monkeypatch.setattr(
+            triggered_events_cache, "_triggered_events_cache_size", {"bytes": 0}
+        )
+        serialized_events = [{"id": str(uuid.uuid4())}]
+        entry_size = len(json.dumps(serialized_events))
+        monkeypatch.setattr(
+            triggered_events_cache, "MAX_TRIGGERED_EVENTS_CACHE_BYTES", 2 * entry_size
+        )
+        compute, calls = counting_computation(serialized_events)
+        first_object, second_object, third_object = (uuid.uuid4() for _ in range(3))
+
+        for adaptative_object_id in (first_object, second_object, first_object):
+            cached_triggered_adaptative_events(
+                models, mock_student.id, adaptative_object_id, compute
+            )
+        assert len(calls) == 2
+        # The second Adaptative Object is the least recently used one.
+        cached_triggered_adaptative_events(
+            models, mock_student.id, third_object, compute
+        )
+        assert triggered_events_cache._triggered_events_cache_size["bytes"] == (
+            2 * entry_size
+        )
+        for adaptative_object_id in (first_object, third_object):
+            cached_triggered_adaptative_events(
+                models, mock_student.id, adaptative_object_id, compute
+            )
+        assert len(calls) == 3
+        cached_triggered_adaptative_events(
+            models, mock_student.id, second_object, compute
+        )
+        assert len(calls) == 4
+
+        # Responses larger than the cap are never cached.
+        compute, calls = counting_computation(serialized_events * 3)
+        for _ in range(2):
+            cached_triggered_adaptative_events(
+                models, mock_student.id, first_object, compute
+            )
+        assert len(calls) == 2
+        assert triggered_events_cache._triggered_events_cache_size["bytes"] <= (
+            2 * entry_size
+        )
+
+    def test_diff_contains_only_the_changed_objects(self):
+        """Test case to assert that the diff contains the added and removed Events of the changed Adaptative Objects"""
+        first_event, second_event = {"id": "first"}, {"id": "second"}
+        previous_events = {
+            "unchanged": [first_event],
+            "changed": [first_event],
+            "emptied": [second_event],
+        }
+        current_events = {
+            "unchanged": [first_event],
+            "changed": [{"id": "first", "triggered_change": "HIDE"}, second_event],
+            "new": [first_event],
+        }
+
+        assert triggered_events_diff(previous_events, current_events) == {
+            "changed": {
+                "added": [{"id": "first", "triggered_change": "HIDE"}, second_event],
+                "removed": [],
+            },
+            "emptied": {"added": [], "removed": ["second"]},
+            "new": {"added": [first_event], "removed": []},
+        }
+        assert triggered_events_diff(current_events, current_events) == {}
@@ -0,0 +1,205 @@
+# -*- coding: utf-8 -*-
+"""Test case suite for the Triggered Events Stream."""
+
+import json
+import uuid
+from typing import Dict
+
+from flask_sqlalchemy.model import Model
+from src.services.utils.helpers.triggered_events_cache.triggered_events_cache import (
+    triggered_events_versions,
+)
+from src.services.utils.helpers.triggered_events_stream.triggered_events_stream import (
+    decode_stream_event_id,
+    encode_stream_event_id,
+    stream_triggered_events_changes,
+)
+from src.services.utils.helpers.version_counter.version_counter import (
+    bump_version,
+    get_evidence_counter_name,
+)
+
+
+def parse_server_sent_event(message: str) -> dict:
+    """Function to parse the fields of a Server-Sent Events message
+
+    Args:
+        message (str): Server-Sent Events message
+
+    Returns:
+        dict: Fields of the message, with its data parsed from JSON.
+    """
+    fields = dict(
+        line.split(": ", 1) for line in message.strip().split("\n") if ": " in line
+    )
+    if "data" in fields:
+        fields["data"] = json.loads(fields["data"])
+    return fields
+
+
+class TestTriggeredEventsStream:
+    """Test suite for the Triggered Events Stream"""
+
+    def test_event_id_holds_the_versions_and_the_events(self):
+        """Test case to assert that the ID of a message can be read back on any worker"""
+        adaptative_object_id = str(uuid.uuid4())
+        event_ids = {str(uuid.uuid4()), str(uuid.uuid4())}
+        triggered_adaptative_events = {
+            adaptative_object_id: [{"id": event_id} for event_id in event_ids],
+            str(uuid.uuid4()): [],
+        }
+
+        event_id = encode_stream_event_id((3, 1, 2, 0), triggered_adaptative_events)
+
+        assert decode_stream_event_id(event_id) == (
+            (3, 1, 2, 0),
+            {adaptative_object_id: event_ids},
+        )
+        assert decode_stream_event_id(None) == (None, None)
+        assert decode_stream_event_id("not.an.event.id") == (None, None)
+        # IDs without the Events still resume the Versions.
+        assert decode_stream_event_id("3.1.2.0") == ((3, 1, 2, 0), None)
+
+    def test_stream_is_not_evaluated_until_a_version_changes(self):
+        """Test case to assert that a client resuming with the current Versions gets no message"""
+        triggered_adaptative_events = {str(uuid.uuid4()): [{"id": str(uuid.uuid4())}]}
+        computed_versions = []
+
+        def compute_triggered_adaptative_events(versions: tuple) -> dict:
+            computed_versions.append(versions)
+            return triggered_adaptative_events
+
+        messages = list(
+            stream_triggered_events_changes(
+                (1, 0, 1, 1), lambda: (1, 0, 1, 1), compute_triggered_adaptative_events
+            )
+        )
+        snapshot = parse_server_sent_event(messages[1])
+        resumed_messages = list(
+            stream_triggered_events_changes(
+                (1, 0, 1, 1),
+                lambda: (1, 0, 1, 1),
+                compute_triggered_adaptative_events,
+                last_event_id=snapshot["id"],
+            )
+        )
+
+        assert messages[0] == "retry: 2000\n\n"
+        assert snapshot["event"] == "snapshot"
+        assert snapshot["data"] == triggered_adaptative_events
+        assert resumed_messages == ["retry: 2000\n\n"]
+        assert computed_versions == [(1, 0, 1, 1)]
+
+    def test_evidence_change_pushes_the_diff(self):
+        """Test case to assert that only the Events added and removed since the Last-Event-ID are pushed"""
+        adaptative_object_id = str(uuid.uuid4())
+        kept_event, removed_event, added_event = (
+            {"id": str(uuid.uuid4()), "triggered_change": "HIDE"} for _ in range(3)
+        )
+        last_event_id = encode_stream_event_id(
+            (1, 0, 1, 1), {adaptative_object_id: [kept_event, removed_event]}
+        )
+
+        messages = list(
+            stream_triggered_events_changes(
+                (2, 0, 1, 1),
+                lambda: (2, 0, 1, 1),
+                lambda versions: {adaptative_object_id: [kept_event, added_event]},
+                last_event_id=last_event_id,
+            )
+        )
+        diff = parse_server_sent_event(messages[1])
+        unchanged_messages = list(
+            stream_triggered_events_changes(
+                (3, 0, 1, 1),
+                lambda: (3, 0, 1, 1),
+                lambda versions: {adaptative_object_id: [kept_event, added_event]},
+                last_event_id=diff["id"],
+            )
+        )
+
+        assert diff["event"] == "diff"
+        assert diff["data"] == {
+            adaptative_object_id: {
+                "added": [added_event],
+                "removed": [removed_event["id"]],
+            }
+        }
+        # NOTE: A change that leaves the Events as they were only moves the Last-Event-ID.
+        current_event_id = encode_stream_event_id(
+            (3, 0, 1, 1), {adaptative_object_id: [kept_event, added_event]}
+        )
+        assert unchanged_messages[1] == f"id: {current_event_id}\n\n"
+
+    def test_rules_change_pushes_a_snapshot(self):
+        """Test case to assert that every Event is pushed again if their content may have changed"""
+        adaptative_object_id = str(uuid.uuid4())
+        event = {"id": str(uuid.uuid4()), "triggered_change": "HIDE"}
+        last_event_id = encode_stream_event_id(
+            (1, 0, 1, 1), {adaptative_object_id: [event]}
+        )
+
+        messages = list(
+            stream_triggered_events_changes(
+                (1, 0, 1, 2),
+                lambda: (1, 0, 1, 2),
+                lambda versions: {adaptative_object_id: [event]},
+                last_event_id=last_event_id,
+            )
+        )
+
+        snapshot = parse_server_sent_event(messages[1])
+        assert snapshot["event"] == "snapshot"
+        assert snapshot["data"] == {adaptative_object_id: [event]}
+
+    def test_waiting_stream_pushes_once_after_the_evidence_changes(
+        self, models: Dict[str, Model], db, mock_student
+    ):
+        """Test case to assert that a stream waiting on a cooperative worker is driven by the Evidence Version
+
+        Args:
+            models (Dict[str, Model]): Dictionary of all of the models
+            db (DB): Database connection
+            mock_student (Model): Mock Student
+        """
+        user_id = mock_student.id
+        adaptative_object_id = str(uuid.uuid4())
+        event = {"id": str(uuid.uuid4())}
+        versions = triggered_events_versions(models, user_id)
+        last_event_id = encode_stream_event_id(versions, {adaptative_object_id: []})
+        computed_versions = []
+        ended_transactions = []
+
+        def compute_triggered_adaptative_events(current_versions: tuple) -> dict:
+            computed_versions.append(current_versions)
+            return {adaptative_object_id: [event]}
+
+        clock = {"seconds": 0}
+
+        def sleep(seconds: float):
+            clock["seconds"] += seconds
+            # Evidence is observed on the 3rd second.
+            if clock["seconds"] == 3:
+                bump_version(db, get_evidence_counter_name(user_id))
+                db.session.commit()
+
+        messages = list(
+            stream_triggered_events_changes(
+                versions,
+                lambda: triggered_events_versions(models, user_id),
+                compute_triggered_adaptative_events,
+                last_event_id=last_event_id,
+                end_transaction=lambda: ended_transactions.append(True),
+                max_wait=10,
+                sleep=sleep,
+                clock=lambda: clock["seconds"],
+            )
+        )
+
+        assert clock["seconds"] == 3
+        assert len(ended_transactions) == 3
+        assert computed_versions == [triggered_events_versions(models, user_id)]
+        assert computed_versions[0][0] == versions[0] + 1
+        diff = parse_server_sent_event(messages[1])
+        assert diff["event"] == "diff"
+        assert diff["data"] == {adaptative_object_id: {"added": [event], "removed": []}}
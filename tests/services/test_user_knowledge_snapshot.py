@@ -0,0 +1,217 @@
+# -*- coding: utf-8 -*-
+"""Test case suite for the User Knowledge Snapshots."""
+
+from typing import Dict
+
+import pytest
+from flask import Flask
+from flask_sqlalchemy.model import Model
+from sqlalchemy.exc import OperationalError
+from src.services.utils.helpers.user_knowledge_snapshot import (
+    user_knowledge_snapshot as snapshot_module,
+)
+from src.services.utils.helpers.user_knowledge_snapshot.user_knowledge_snapshot import (
+    load_user_knowledge_snapshot,
+    rebuild_user_knowledge_snapshots,
+)
+from src.services.utils.helpers.user_knowledge_state import user_knowledge_state
+from src.services.utils.helpers.version_counter.version_counter import (
+    DOMAIN_VERSION,
+    bump_version,
+    get_evidence_counter_name,
+    get_version,
+)
+
+
+class TestUserKnowledgeSnapshot:
+    """Test suite for the User Knowledge Snapshots"""
+
+    def test_current_snapshot_is_used_by_other_workers(
+        self, models: Dict[str, Model], mock_student, course_factory, query_counter
+    ):
+        """Test case to assert that a worker without the state reads the current Snapshot
+
+        Args:
+            models (Dict[str, Model]): Dictionary of all of the models
+            mock_student (Model): Mock Student
+            course_factory (function): Mock Course Factory
+            query_counter (list): Executed SQL Statements
+        """
+        course = course_factory(templates=1, pages_per_template=2)
+        node_ids = [course["topic"].id, course["templates"][0].id]
+        knowledge_estimation = user_knowledge_state.user_knowledge_state(
+            models, mock_student, node_ids
+        )
+        # Another worker does not have the state of the user.
+        user_knowledge_state._user_knowledge_states.clear()
+        query_counter.clear()
+
+        knowledge_snapshot = user_knowledge_state.user_knowledge_state(
+            models, mock_student, node_ids
+        )
+
+        # NOTE: Only the versions and the Snapshot of the two nodes are read.
+        assert len(query_counter) == 2
+        for node_id in node_ids:
+            assert knowledge_snapshot[node_id]["expected_knowledge"] == pytest.approx(
+                knowledge_estimation[node_id]["expected_knowledge"]
+            )
+            assert (
+                knowledge_snapshot[node_id]["evidence_observed"]
+                == knowledge_estimation[node_id]["evidence_observed"]
+            )
+
+    def test_stale_snapshot_is_recomputed(
+        self, models: Dict[str, Model], db, mock_student, course_factory
+    ):
+        """Test case to assert that a Snapshot of an old Evidence Version is not used
+
+        Args:
+            models (Dict[str, Model]): Dictionary of all of the models
+            db (DB): Database connection
+            mock_student (Model): Mock Student
+            course_factory (function): Mock Course Factory
+        """
+        course = course_factory(templates=1, pages_per_template=2)
+        template = course["templates"][0]
+        knowledge_before = user_knowledge_state.user_knowledge_state(
+            models, mock_student, [template.id]
+        )[template.id]["expected_knowledge"]
+        user_knowledge_state._user_knowledge_states.clear()
+
+        db.session.add(
+            models["TestAttempt"](
+                user=mock_student,
+                practice_test=course["practice_tests"][0],
+                acquired_score=10,
+            )
+        )
+        bump_version(db, get_evidence_counter_name(mock_student.id))
+        db.session.commit()
+
+        knowledge_after = user_knowledge_state.user_knowledge_state(
+            models, mock_student, [template.id]
+        )[template.id]["expected_knowledge"]
+
+        assert knowledge_after > knowledge_before
+
+    def test_snapshot_is_written_after_the_response(
+        self, models: Dict[str, Model], mock_student, course_factory
+    ):
+        """Test case to assert that a request only writes the Snapshot once its response is closed
+
+        Args:
+            models (Dict[str, Model]): Dictionary of all of the models
+            mock_student (Model): Mock Student
+            course_factory (function): Mock Course Factory
+        """
+        # NOTE: A separate app is used for the requests, so that tearing them down does
+        # not remove the session of the Database.
+        app = Flask(__name__)
+        course = course_factory(templates=1, pages_per_template=2)
+        template = course["templates"][0]
+
+        @app.route("/knowledge")
+        def knowledge():
+            return {
+                "expected_knowledge": user_knowledge_state.user_knowledge_state(
+                    models, mock_student, [template.id]
+                )[template.id]["expected_knowledge"]
+            }
+
+        def current_snapshot():
+            return load_user_knowledge_snapshot(
+                models,
+                mock_student.id,
+                get_version(models, DOMAIN_VERSION),
+                get_version(models, get_evidence_counter_name(mock_student.id)),
+                [template.id],
+            )
+
+        response = app.test_client().get("/knowledge")
+
+        assert response.status_code == 200
+        assert current_snapshot() is None
+        response.close()
+        assert current_snapshot()[template.id]["expected_knowledge"] == pytest.approx(
+            response.json["expected_knowledge"]
+        )
+
+    def test_failed_snapshot_write_does_not_fail_the_read(
+        self, models: Dict[str, Model], mock_student, course_factory, monkeypatch
+    ):
+        """Test case to assert that a request reading the knowledge succeeds if its Snapshot cannot be written
+
+        Args:
+            models (Dict[str, Model]): Dictionary of all of the models
+            mock_student (Model): Mock Student
+            course_factory (function): Mock Course Factory
+            monkeypatch (MonkeyPatch): Pytest MonkeyPatch
+        """
+        app = Flask(__name__)
+        course = course_factory(templates=1, pages_per_template=2)
+        template = course["templates"][0]
+
+        def failing_snapshot_write(*args, **kwargs):
+            raise OperationalError("INSERT", {}, Exception("connection lost"))
+
+        monkeypatch.setattr(
+            snapshot_module,
+            "_upsert_user_knowledge_snapshot_rows",
+            failing_snapshot_write,
+        )
+
+        @app.route("/knowledge")
+        def knowledge():
+            return {
+                "expected_knowledge": user_knowledge_state.user_knowledge_state(
+                    models, mock_student, [template.id]
+                )[template.id]["expected_knowledge"]
+            }
+
+        response = app.test_client().get("/knowledge")
+        response.close()
+
+        assert response.status_code == 200
+        assert response.json["expected_knowledge"] is not None
+        assert (
+            load_user_knowledge_snapshot(
+                models,
+                mock_student.id,
+                get_version(models, DOMAIN_VERSION),
+                get_version(models, get_evidence_counter_name(mock_student.id)),
+                [template.id],
+            )
+            is None
+        )
+
+    def test_rebuild_stores_current_snapshots(
+        self, db, models: Dict[str, Model], mock_student, course_factory
+    ):
+        """Test case to assert that the bulk rebuild stores current Snapshots for every User
+
+        Args:
+            db (DB): Database connection
+            models (Dict[str, Model]): Dictionary of all of the models
+            mock_student (Model): Mock Student
+            course_factory (function): Mock Course Factory
+        """
+        course = course_factory(templates=2, pages_per_template=2)
+        models["UserKnowledgeSnapshot"].query.filter_by(
+            user_id=mock_student.id
+        ).delete()
+        db.session.commit()
+
+        rebuilt_users = rebuild_user_knowledge_snapshots(db, models, batch_size=1)
+
+        assert rebuilt_users == models["User"].query.count()
+        snapshot = (
+            models["UserKnowledgeSnapshot"]
+            .query.filter_by(user_id=mock_student.id, node_id=course["topic"].id)
+            .one()
+        )
+        assert snapshot.entity_type == "topic"
+        assert snapshot.domain_version == get_version(models, DOMAIN_VERSION)
+        assert snapshot.evidence_version == get_version(
+            models, get_evidence_counter_name(mock_student.id)
+        )
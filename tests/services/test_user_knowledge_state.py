@@ -0,0 +1,223 @@
+# -*- coding: utf-8 -*-
+"""Test case suite for the per User Knowledge State."""
+
+from typing import Dict
+
+import numpy as np
+import pytest
+from flask_sqlalchemy.model import Model
+from sqlalchemy.exc import OperationalError
+from src.services.utils.helpers.knowledge_inference_engine.knowledge_inference_engine import (
+    knowledge_inference_engine,
+)
+from src.services.utils.helpers.user_knowledge_snapshot import (
+    user_knowledge_snapshot as snapshot_module,
+)
+from src.services.utils.helpers.user_knowledge_snapshot.user_knowledge_snapshot import (
+    load_user_knowledge_snapshot,
+)
+from src.services.utils.helpers.user_knowledge_state.user_knowledge_state import (
+    update_user_knowledge_state,
+    user_knowledge_state,
+)
+from src.services.utils.helpers.version_counter.version_counter import (
+    DOMAIN_VERSION,
+    bump_version,
+    get_evidence_counter_name,
+    get_version,
+)
+
+
+class TestUserKnowledgeState:
+    """Test suite for the per User Knowledge State"""
+
+    def test_state_is_reused_while_versions_are_unchanged(
+        self, models: Dict[str, Model], mock_student, course_factory, query_counter
+    ):
+        """Test case to assert that a current Knowledge State is read without recomputing it
+
+        Args:
+            models (Dict[str, Model]): Dictionary of all of the models
+            mock_student (Model): Mock Student
+            course_factory (function): Mock Course Factory
+            query_counter (list): Executed SQL Statements
+        """
+        course_factory(templates=2, pages_per_template=2)
+        first_state = user_knowledge_state(models, mock_student)
+        query_counter.clear()
+
+        second_state = user_knowledge_state(models, mock_student)
+
+        assert second_state is first_state
+        # NOTE: Only the Domain and Evidence Versions are read.
+        assert len(query_counter) == 1
+
+    def test_new_evidence_is_propagated_incrementally(
+        self, models: Dict[str, Model], db, mock_student, course_factory
+    ):
+        """Test case to assert that new Evidence updates the kept state like a full recomputation
+
+        Args:
+            models (Dict[str, Model]): Dictionary of all of the models
+            db (DB): Database connection
+            mock_student (Model): Mock Student
+            course_factory (function): Mock Course Factory
+        """
+        course = course_factory(templates=2, pages_per_template=2)
+        state = user_knowledge_state(models, mock_student)
+        template = course["templates"][0]
+        knowledge_before = state[template.id]["expected_knowledge"]
+
+        # Record the new Evidence the same way the Test Attempt controller does.
+        practice_test = course["practice_tests"][0]
+        db.session.add(
+            models["TestAttempt"](
+                user=mock_student, practice_test=practice_test, acquired_score=10
+            )
+        )
+        evidence_version = bump_version(db, get_evidence_counter_name(mock_student.id))
+        db.session.commit()
+        update_user_knowledge_state(
+            models, mock_student.id, evidence_version, [practice_test.page_id]
+        )
+
+        updated_state = user_knowledge_state(models, mock_student)
+        recomputed_state = knowledge_inference_engine(models, mock_student)
+
+        assert updated_state is state
+        assert updated_state[template.id]["expected_knowledge"] > knowledge_before
+        np.testing.assert_allclose(
+            updated_state.expected_knowledge, recomputed_state.expected_knowledge
+        )
+        np.testing.assert_array_equal(
+            updated_state.evidence_observed, recomputed_state.evidence_observed
+        )
+
+    def test_partial_read_keeps_a_state_for_new_evidence(
+        self, models: Dict[str, Model], db, mock_student, course_factory, query_counter
+    ):
+        """Test case to assert that a read of a few nodes keeps a state that new Evidence is propagated through
+
+        Args:
+            models (Dict[str, Model]): Dictionary of all of the models
+            db (DB): Database connection
+            mock_student (Model): Mock Student
+            course_factory (function): Mock Course Factory
+            query_counter (list): Executed SQL Statements
+        """
+        course = course_factory(templates=2, pages_per_template=2)
+        template_id, other_template_id = (
+            template.id for template in course["templates"]
+        )
+        topic_id = course["topic"].id
+        state = user_knowledge_state(models, mock_student, [template_id])
+
+        # Record new Evidence of the read Template, and of another one.
+        for practice_test in course["practice_tests"]:
+            db.session.add(
+                models["TestAttempt"](
+                    user=mock_student, practice_test=practice_test, acquired_score=10
+                )
+            )
+            evidence_version = bump_version(
+                db, get_evidence_counter_name(mock_student.id)
+            )
+            db.session.commit()
+            update_user_knowledge_state(
+                models, mock_student.id, evidence_version, [practice_test.page_id]
+            )
+        query_counter.clear()
+
+        updated_state = user_knowledge_state(models, mock_student, [template_id])
+
+        assert updated_state is state
+        # NOTE: Only the Domain and Evidence Versions are read.
+        assert len(query_counter) == 1
+        recomputed_state = knowledge_inference_engine(models, mock_student)
+        assert updated_state[template_id]["expected_knowledge"] == pytest.approx(
+            recomputed_state[template_id]["expected_knowledge"]
+        )
+        # The Snapshot of the read Template was moved forward with the state.
+        assert load_user_knowledge_snapshot(
+            models,
+            mock_student.id,
+            get_version(models, DOMAIN_VERSION),
+            evidence_version,
+            [template_id],
+        )
+
+        # Reads of other nodes extend the closure of the state.
+        extended_state = user_knowledge_state(models, mock_student, [topic_id])
+        assert extended_state is not state
+        for node_id in (template_id, other_template_id, topic_id):
+            assert extended_state[node_id]["expected_knowledge"] == pytest.approx(
+                recomputed_state[node_id]["expected_knowledge"]
+            )
+
+    def test_state_is_recomputed_when_it_missed_evidence(
+        self, models: Dict[str, Model], db, mock_student, course_factory
+    ):
+        """Test case to assert that a state that missed Evidence from another worker is recomputed
+
+        Args:
+            models (Dict[str, Model]): Dictionary of all of the models
+            db (DB): Database connection
+            mock_student (Model): Mock Student
+            course_factory (function): Mock Course Factory
+        """
+        course = course_factory(templates=1, pages_per_template=2)
+        state = user_knowledge_state(models, mock_student)
+
+        # Another worker records new Evidence without updating this process.
+        db.session.add(
+            models["InteractionFired"](
+                user=mock_student, measurable_interaction=course["interactions"][0]
+            )
+        )
+        bump_version(db, get_evidence_counter_name(mock_student.id))
+        db.session.commit()
+
+        new_state = user_knowledge_state(models, mock_student)
+
+        assert new_state is not state
+        assert new_state[course["interactions"][0].id]["evidence_observed"]
+
+    def test_failed_snapshot_write_drops_the_state(
+        self, models: Dict[str, Model], db, mock_student, course_factory, monkeypatch
+    ):
+        """Test case to assert that a failed Snapshot write drops the state instead of failing the saved Evidence
+
+        Args:
+            models (Dict[str, Model]): Dictionary of all of the models
+            db (DB): Database connection
+            mock_student (Model): Mock Student
+            course_factory (function): Mock Course Factory
+            monkeypatch (MonkeyPatch): Pytest MonkeyPatch
+        """
+        course = course_factory(templates=1, pages_per_template=2)
+        state = user_knowledge_state(models, mock_student)
+
+        def failing_snapshot_write(*args, **kwargs):
+            raise OperationalError("UPDATE", {}, Exception("connection lost"))
+
+        monkeypatch.setattr(
+            snapshot_module,
+            "_upsert_user_knowledge_snapshot_rows",
+            failing_snapshot_write,
+        )
+        interaction = course["interactions"][0]
+        db.session.add(
+            models["InteractionFired"](
+                user=mock_student, measurable_interaction=interaction
+            )
+        )
+        evidence_version = bump_version(db, get_evidence_counter_name(mock_student.id))
+        db.session.commit()
+        update_user_knowledge_state(
+            models, mock_student.id, evidence_version, [interaction.id]
+        )
+
+        new_state = user_knowledge_state(models, mock_student)
+
+        assert new_state is not state
+        assert new_state[interaction.id]["evidence_observed"]
@@ -0,0 +1,170 @@
+# -*- coding: utf-8 -*-
+"""Test case suite for the Verified Token Cache."""
+
+import json
+import time
+from collections import OrderedDict
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from threading import Thread
+
+import pytest
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import rsa
+from google.auth import crypt, jwt
+from src.services.utils.helpers.verified_token_cache import verified_token_cache
+from src.services.utils.helpers.verified_token_cache.verified_token_cache import (
+    parse_max_age,
+    verify_firebase_id_token,
+)
+
+
+def generate_signing_key(key_id: str) -> tuple:
+    """Function to generate an RSA key, as Firebase signs the ID Tokens with
+
+    Args:
+        key_id (str): ID of the key
+
+    Returns:
+        tuple: The signer of the key and its public key in PEM format.
+    """
+    private_key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    private_pem = private_key.private_bytes(
+        serialization.Encoding.PEM,
+        serialization.PrivateFormat.PKCS8,
+        serialization.NoEncryption(),
+    )
+    public_pem = private_key.public_key().public_bytes(
+        serialization.Encoding.PEM, serialization.PublicFormat.SubjectPublicKeyInfo
+    )
+    return crypt.RSASigner.from_string(private_pem, key_id), public_pem.decode()
+
+
+def mint_token(signer: crypt.RSASigner, user_id: str, expires_in: int = 3600) -> str:
+    """Function to mint an ID Token for a User
+
+    Args:
+        signer (crypt.RSASigner): Signer of the token
+        user_id (str): ID of the User
+        expires_in (int): Seconds until the token expires
+
+    Returns:
+        str: Encoded ID Token
+    """
+    now = int(time.time())
+    return jwt.encode(
+        signer, {"user_id": user_id, "iat": now, "exp": now + expires_in}
+    ).decode()
+
+
+@pytest.fixture
+def key_server(monkeypatch):
+    """Fixture of a local server of the Firebase public keys, with empty caches
+
+    Args:
+        monkeypatch (MonkeyPatch): Pytest MonkeyPatch
+
+    Yields:
+        dict: URL of the server, the keys it serves, its Cache-Control header and the
+            requests it answered.
+    """
+    monkeypatch.setattr(verified_token_cache, "_firebase_certs_cache", {})
+    monkeypatch.setattr(verified_token_cache, "_verified_tokens", OrderedDict())
+    server_state = {"certs": {}, "cache_control": "public, max-age=600", "requests": 0}
+
+    class KeyServerHandler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            server_state["requests"] += 1
+            body = json.dumps(server_state["certs"]).encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Cache-Control", server_state["cache_control"])
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = HTTPServer(("127.0.0.1", 0), KeyServerHandler)
+    thread = Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    server_state["url"] = f"http://127.0.0.1:{server.server_port}/certs"
+    yield server_state
+    server.shutdown()
+    server.server_close()
+
+
+class TestVerifiedTokenCache:
+    """Test suite for the Verified Token Cache"""
+
+    def test_max_age_is_read_from_cache_control(self):
+        """Test case to assert that the max-age directive is honoured unless caching is forbidden"""
+        assert parse_max_age("public, max-age=19204, must-revalidate") == 19204
+        assert parse_max_age("max-age=60") == 60
+        assert parse_max_age("public, s-maxage=60") == 0
+        assert parse_max_age("no-store, max-age=60") == 0
+        assert parse_max_age(None) == 0
+
+    def test_repeated_tokens_skip_the_network_and_the_signature(
+        self, key_server: dict, monkeypatch
+    ):
+        """Test case to assert that the keys are fetched once per max-age and that every token is verified once
+
+        Args:
+            key_server (dict): Local server of the Firebase public keys
+            monkeypatch (MonkeyPatch): Pytest MonkeyPatch
+        """
+        signer, public_pem = generate_signing_key("first")
+        key_server["certs"] = {"first": public_pem}
+        first_token, second_token = (
+            mint_token(signer, user_id) for user_id in ("first", "second")
+        )
+        decoded_tokens = []
+        decode = jwt.decode
+
+        def counting_decode(*args, **kwargs):
+            decoded_tokens.append(args[0])
+            return decode(*args, **kwargs)
+
+        monkeypatch.setattr(verified_token_cache.jwt, "decode", counting_decode)
+        clock = {"seconds": time.time()}
+
+        def verify(token: str) -> dict:
+            return verify_firebase_id_token(
+                token, certs_url=key_server["url"], clock=lambda: clock["seconds"]
+            )
+
+        for _ in range(3):
+            assert verify(first_token)["user_id"] == "first"
+        assert verify(second_token)["user_id"] == "second"
+        assert decoded_tokens == [first_token, second_token]
+        assert key_server["requests"] == 1
+
+        # The keys are fetched again once their max-age passed.
+        clock["seconds"] += 601
+        verify(mint_token(signer, "third"))
+        assert key_server["requests"] == 2
+
+        # Expired tokens are verified again.
+        clock["seconds"] += 3600
+        verify(first_token)
+        assert decoded_tokens.count(first_token) == 2
+
+    def test_invalid_tokens_are_never_cached(self, key_server: dict):
+        """Test case to assert that tokens with an invalid signature are rejected every time
+
+        Args:
+            key_server (dict): Local server of the Firebase public keys
+        """
+        _, public_pem = generate_signing_key("first")
+        forged_signer, _ = generate_signing_key("first")
+        key_server["certs"] = {"first": public_pem}
+        key_server["cache_control"] = "no-cache"
+        forged_token = mint_token(forged_signer, "first")
+
+        for _ in range(2):
+            with pytest.raises(ValueError):
+                verify_firebase_id_token(forged_token, certs_url=key_server["url"])
+        assert not verified_token_cache._verified_tokens
+        # NOTE: Keys without a max-age are fetched on every verification.
+        assert key_server["requests"] == 2